@@ -1,17 +1,33 @@
 #!/usr/bin/env python3
 """Main entry point for Early Bird Train"""
 
+from __future__ import annotations
+
+import asyncio
 import sys
+from functools import partial
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from loguru import logger
 
-from src.container import Container
 from src.domain.exceptions import DomainException
 
+# Heavy modules are imported where they are used, so --once does not pay for the
+# scheduler, the worker pool or NumPy (see --startup-profile)
+if TYPE_CHECKING:
+    from src.application.sharding import ShardedTargetMonitor
+    from src.application.ticket_service import TicketMonitorService
+    from src.container import Container
+    from src.domain.models import WatchListResult, WatchTarget
+    from src.infrastructure.async_crawler import AsyncCtripTicketCrawler
+    from src.infrastructure.crawler import CtripTicketCrawler
+    from src.infrastructure.import_profiler import ImportProfiler
+    from src.infrastructure.worker_pool import ProcessWorkerPool
+
 
-def setup_logging(log_level: str) -> None:
-    """Configure logging"""
+def setup_logging(log_level: str, log_file: bool = True) -> None:
+    """Configure logging (worker processes log to the console only; the coordinator owns the log file)"""
     logger.remove()  # Remove default handler
 
     # Console output
@@ -22,6 +38,9 @@ def setup_logging(log_level: str) -> None:
         colorize=True,
     )
 
+    if not log_file:
+        return
+
     # File output
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
@@ -36,12 +55,89 @@ def setup_logging(log_level: str) -> None:
     )
 
 
-def run_once(container: Container) -> None:
-    """Run monitoring task once (for testing)"""
+class ShardWorker:
+    """
+    Worker process side of sharded monitoring: one container per process, reused for every shard
+
+    Each worker gets 1/N of CRAWLER_RATE_LIMIT and CRAWLER_RATE_BURST, so N workers
+    together stay within the configured rate to the Ctrip host.
+    """
+
+    def __init__(self, workers: int = 1) -> None:
+        from dependency_injector import providers
+
+        from src.container import Container
+
+        self._container = Container()
+        config = self._container.config()
+        if workers > 1:
+            share = {
+                "crawler_rate_limit": config.crawler_rate_limit / workers,
+                "crawler_rate_burst": max(1, config.crawler_rate_burst // workers),
+            }
+            self._container.config.override(providers.Object(config.model_copy(update=share)))
+        self._last_run: WatchListResult | None = None
+        setup_logging(config.log_level, log_file=False)
+
+    def __call__(self, task: tuple[str, list[WatchTarget] | None]) -> WatchListResult | None:
+        from src.application.sharding import REMEMBER
+
+        command, targets = task
+        if command == REMEMBER:
+            # The coordinator notified the last poll: remember it so it is not notified again
+            if self._last_run is not None:
+                build_service(self._container).remember(self._last_run)
+                self._last_run = None
+            return None
+
+        self._last_run = build_service(self._container).poll_targets(targets or [])
+        return self._last_run
+
+    def close(self) -> None:
+        self._container.shutdown_resources()
+
+
+def build_service(container: Container, crawler: CtripTicketCrawler | None = None) -> TicketMonitorService:
+    """Ticket service for one run (on the long-lived clients when REUSE_CLIENTS is set)"""
+    from src.container import shared_clients
+
+    clients = shared_clients(container) if container.config().reuse_clients else {}
+    if crawler is not None:
+        clients["crawler"] = crawler
+    # Container providers build through _lazy() imports, which mypy sees as Any
+    service: TicketMonitorService = container.ticket_service(**clients)
+    return service
+
+
+def parse_workers(args: list[str], default: int) -> int:
+    """Worker process count from --workers N / --workers=N (default from settings)"""
+    for index, arg in enumerate(args):
+        if arg.startswith("--workers="):
+            return int(arg.split("=", 1)[1])
+        if arg == "--workers" and index + 1 < len(args):
+            return int(args[index + 1])
+    return default
+
+
+def run_once(
+    container: Container,
+    crawler: CtripTicketCrawler | None = None,
+    sharded: ShardedTargetMonitor | None = None,
+) -> None:
+    """Run monitoring task once (optionally reusing a pre-warmed crawler or sharding across workers)"""
     logger.info("Running ticket monitoring once...")
 
     config = container.config()
-    service = container.ticket_service()
+
+    if config.watch_targets and sharded is not None:
+        sharded.monitor(config.watch_targets)
+        return
+
+    service = build_service(container, crawler)
+
+    if config.watch_targets:
+        service.monitor_targets(config.watch_targets)
+        return
 
     service.monitor_ticket(
         departure_station=config.departure_station,
@@ -51,28 +147,206 @@ def run_once(container: Container) -> None:
     )
 
 
-def run_scheduler(container: Container) -> None:
-    """Start scheduled task scheduler"""
+def release_time(container: Container) -> tuple[int, int, int]:
+    """Release time of day to burst around: learned from snapshot history when possible, else the schedule"""
+    config = container.config()
+    configured = (config.schedule_hour, config.schedule_minute, 0)
+
+    store = container.snapshot_store()
+    if not config.burst_predict_release or store is None:
+        return configured
+
+    from src.application.history_analytics import load_history
+
+    # The same train number on another watched route releases on its own schedule
+    history = load_history(
+        store,
+        config.train_number,
+        departure_station=config.departure_station,
+        arrival_station=config.arrival_station,
+    )
+    prediction = container.release_predictor().predict(history, config.train_number)
+    if prediction is None:
+        return configured
+
+    return prediction.release_time.hour, prediction.release_time.minute, prediction.release_time.second
+
+
+def run_burst(container: Container, crawler: CtripTicketCrawler | None = None) -> None:
+    """Run release-window burst polling for the next release instant"""
+    from src.application.burst_poller import BurstPoller
+
+    logger.info("Running release burst...")
+
+    config = container.config()
+    service = build_service(container)
+    hour, minute, second = release_time(container)
+    # Every burst poll must reach Ctrip, so the shared response cache is bypassed
+    poller = container.burst_poller(crawler=crawler or container.crawler(response_cache=None))
+
+    service.monitor_release(
+        departure_station=config.departure_station,
+        arrival_station=config.arrival_station,
+        train_number=config.train_number,
+        days_ahead=config.days_ahead,
+        release_at=BurstPoller.next_release(hour, minute, second=second),
+        poller=poller,
+    )
+
+
+async def run_once_async(container: Container, crawler: AsyncCtripTicketCrawler) -> None:
+    """Run the single-train check as a coroutine (asyncio scheduler backend)"""
+    logger.info("Running ticket monitoring once...")
+
+    config = container.config()
+    await build_service(container).monitor_ticket_async(
+        departure_station=config.departure_station,
+        arrival_station=config.arrival_station,
+        train_number=config.train_number,
+        days_ahead=config.days_ahead,
+        crawler=crawler,
+    )
+
+
+async def run_burst_async(container: Container, crawler: AsyncCtripTicketCrawler) -> None:
+    """Run release-window burst polling as a coroutine (asyncio scheduler backend)"""
+    from src.application.burst_poller import BurstPoller
+
+    logger.info("Running release burst...")
+
+    config = container.config()
+    service = build_service(container)
+    # Reads the snapshot history, so it runs off the event loop
+    hour, minute, second = await asyncio.to_thread(release_time, container)
+
+    await service.monitor_release_async(
+        departure_station=config.departure_station,
+        arrival_station=config.arrival_station,
+        train_number=config.train_number,
+        days_ahead=config.days_ahead,
+        release_at=BurstPoller.next_release(hour, minute, second=second),
+        poller=container.async_burst_poller(crawler=crawler),
+    )
+
+
+def run_sweep(container: Container) -> None:
+    """Run a multi-date sweep once"""
+    logger.info("Running ticket sweep once...")
+
+    config = container.config()
+    service = build_service(container)
+
+    service.sweep_tickets(
+        departure_station=config.departure_station,
+        arrival_station=config.arrival_station,
+        train_number=config.train_number,
+        days=range(config.sweep_start_day, config.sweep_end_day + 1),
+        weekdays=config.sweep_weekdays or None,
+    )
+
+
+def run_scheduler(container: Container, sharded: ShardedTargetMonitor | None = None) -> None:
+    """Start scheduled task scheduler (as the only coordinator when a leader lock is configured)"""
+    from src.infrastructure.leader_lock import FileLeaderLock
+
+    config = container.config()
+
+    lock = FileLeaderLock(config.leader_lock_path) if config.leader_lock_path else None
+    if lock is not None and not lock.acquire():
+        logger.warning(f"Another coordinator holds {config.leader_lock_path}, waiting as standby...")
+        lock.acquire(blocking=True)
+
+    try:
+        _run_scheduler(container, sharded)
+    finally:
+        if lock is not None:
+            lock.release()
+
+
+def _run_scheduler(container: Container, sharded: ShardedTargetMonitor | None) -> None:
     logger.info("Starting scheduled monitoring...")
 
     config = container.config()
     scheduler = container.scheduler()
 
+    # Crawler warmed up ahead of the next run, handed over to that run
+    warmed: dict[str, CtripTicketCrawler] = {}
+
+    def warm_up() -> None:
+        if config.burst_enabled:
+            crawler = container.crawler(response_cache=None)
+        elif config.reuse_clients:
+            from src.container import shared_clients
+
+            # Health-checked (and recreated if needed) ahead of the run, not during it
+            crawler = shared_clients(container)["crawler"]
+        else:
+            crawler = container.crawler()
+        crawler.warm_up()
+        warmed["crawler"] = crawler
+
+    hour, minute, lead_seconds = config.schedule_hour, config.schedule_minute, 0
+    if config.burst_enabled:
+        hour, minute, second = release_time(container)
+        # The scheduler works in whole minutes; the release second shortens the lead
+        lead_seconds = config.burst_lead_seconds - second
+
     # Create scheduled job
     def job():
         try:
-            run_once(container)
+            if config.burst_enabled:
+                run_burst(container, crawler=warmed.pop("crawler", None))
+            else:
+                run_once(container, crawler=warmed.pop("crawler", None), sharded=sharded)
         except DomainException as e:
             logger.error(f"Monitoring job failed: {e}")
         except Exception as e:
             logger.exception(f"Unexpected error in monitoring job: {e}")
+        finally:
+            log_crawler_metrics(container)
+
+    # Coroutine jobs for the asyncio backend; watch lists keep the thread-pooled planner (and
+    # worker processes) and run through the plain job in the loop's executor
+    coroutine_jobs = config.scheduler_backend == "asyncio" and not config.watch_targets
+    warmed_async: dict[str, AsyncCtripTicketCrawler] = {}
+
+    def new_async_crawler() -> AsyncCtripTicketCrawler:
+        # Every burst poll must reach Ctrip, so the shared response cache is bypassed
+        crawler: AsyncCtripTicketCrawler = (
+            container.async_crawler(response_cache=None) if config.burst_enabled else container.async_crawler()
+        )
+        return crawler
+
+    async def warm_up_async() -> None:
+        crawler = new_async_crawler()
+        await crawler.warm_up()
+        warmed_async["crawler"] = crawler
+
+    async def async_job() -> None:
+        try:
+            async with warmed_async.pop("crawler", None) or new_async_crawler() as crawler:
+                if config.burst_enabled:
+                    await run_burst_async(container, crawler)
+                else:
+                    await run_once_async(container, crawler)
+        except DomainException as e:
+            logger.error(f"Monitoring job failed: {e}")
+        except Exception as e:
+            logger.exception(f"Unexpected error in monitoring job: {e}")
+        finally:
+            log_crawler_metrics(container)
 
     # Schedule multiple weekly jobs
     scheduler.schedule_multiple_weekly_jobs(
         days_of_week=config.schedule_days_of_week,
-        hour=config.schedule_hour,
-        minute=config.schedule_minute,
-        job_func=job,
+        hour=hour,
+        minute=minute,
+        job_func=async_job if coroutine_jobs else job,
+        warmup_func=warm_up_async if coroutine_jobs else warm_up,
+        warmup_seconds=config.warmup_seconds,
+        lead_seconds=lead_seconds,
+        # Stable while the (predicted) run time moves, so a run missed during downtime is still recovered
+        job_id="ticket_monitor",
     )
 
     # Format day names
@@ -81,8 +355,8 @@ def run_scheduler(container: Container) -> None:
 
     logger.info(
         f"Scheduled to run on {scheduled_days} "
-        f"at {config.schedule_hour:02d}:{config.schedule_minute:02d} "
-        f"(max_retries={config.max_retries})"
+        f"at {hour:02d}:{minute:02d} "
+        f"(max_retries={config.max_retries}{', burst' if config.burst_enabled else ''})"
     )
 
     # Start scheduler (blocking)
@@ -93,24 +367,71 @@ def run_scheduler(container: Container) -> None:
         scheduler.shutdown()
 
 
+def log_crawler_metrics(container: Container) -> None:
+    """Log rate limiter, response cache and latency state (cumulative for the process) after a run"""
+
+    def format_metrics(metrics: dict[str, float]) -> str:
+        return ", ".join(f"{name}={value:.4g}" for name, value in metrics.items())
+
+    limiter = container.rate_limiter()
+    logger.info(f"Rate limiter ({limiter.host}): {format_metrics(limiter.metrics())}")
+    logger.info(f"Response cache: {format_metrics(container.response_cache().stats())}")
+    logger.info(f"Latency ({limiter.host}): {format_metrics(container.latency_tracker().stats(limiter.host))}")
+
+
+def start_profiling(args: list[str]) -> ImportProfiler | None:
+    """Time every following import when --startup-profile is given"""
+    if "--startup-profile" not in args:
+        return None
+
+    from src.infrastructure.import_profiler import ImportProfiler
+
+    return ImportProfiler().install()
+
+
 def main() -> int:
     """Main entry point"""
+    profiler = start_profiling(sys.argv[1:])
+
+    from src.container import Container
+
+    container = Container()
+    pool: ProcessWorkerPool | None = None
+
     try:
-        # Create container
-        container = Container()
         config = container.config()
+        args = sys.argv[1:]
 
         # Configure logging
         setup_logging(config.log_level)
 
         logger.info(f"Starting {config.app_name}...")
-        logger.info(f"Monitoring: {config.train_number} ({config.departure_station} -> {config.arrival_station})")
+        if config.watch_targets:
+            logger.info(f"Monitoring watch list: {len(config.watch_targets)} target(s)")
+        else:
+            logger.info(f"Monitoring: {config.train_number} ({config.departure_station} -> {config.arrival_station})")
+
+        # Shard the watch list across worker processes
+        sharded = None
+        workers = parse_workers(args, config.worker_processes)
+        if workers > 1 and config.watch_targets:
+            from src.application.sharding import ShardedTargetMonitor
+            from src.application.ticket_service import resolve_target_date
+            from src.infrastructure.worker_pool import ProcessWorkerPool
+
+            pool = ProcessWorkerPool(workers, partial(ShardWorker, workers))
+            sharded = ShardedTargetMonitor(pool, container.notifier(), resolve_target_date)
+            logger.info(f"Sharding the watch list across {workers} worker process(es)")
 
         # Determine running mode based on command line arguments
-        if len(sys.argv) > 1 and sys.argv[1] == "--once":
-            run_once(container)
+        if "--once" in args:
+            run_once(container, sharded=sharded)
+            log_crawler_metrics(container)
+        elif "--sweep" in args:
+            run_sweep(container)
+            log_crawler_metrics(container)
         else:
-            run_scheduler(container)
+            run_scheduler(container, sharded)
 
         return 0
 
@@ -120,6 +441,13 @@ def main() -> int:
     except Exception as e:
         logger.exception(f"Unexpected error: {e}")
         return 2
+    finally:
+        if pool is not None:
+            pool.close()
+        container.shutdown_resources()
+        if profiler is not None:
+            profiler.uninstall()
+            logger.info(f"Startup import profile:\n{profiler.report()}")
 
 
 if __name__ == "__main__":
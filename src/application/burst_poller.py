@@ -0,0 +1,242 @@
+"""Release-window burst polling"""
+
+import asyncio
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+from loguru import logger
+
+from src.domain.interfaces import IAsyncTicketCrawler, ISnapshotStore, ITicketCrawler
+from src.domain.models import BurstResult, TicketQuery, TicketQueryResult
+
+
+def has_available_seat(result: TicketQueryResult) -> bool:
+    """Whether any train in the result has a bookable seat"""
+    return any(seat.is_available for train in result.trains for seat in train.seats)
+
+
+class _BurstWindow:
+    """Release window timing and detection shared by the sync and async burst pollers"""
+
+    def __init__(
+        self,
+        interval: float,
+        lead_seconds: float,
+        window_seconds: float,
+        snapshot_store: ISnapshotStore | None,
+    ) -> None:
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+
+        self._interval = interval
+        self._lead = timedelta(seconds=lead_seconds)
+        self._window = timedelta(seconds=window_seconds)
+        self._snapshot_store = snapshot_store
+
+    @staticmethod
+    def next_release(
+        hour: int,
+        minute: int,
+        now: datetime | None = None,
+        grace_seconds: float = 3600,
+        second: int = 0,
+    ) -> datetime:
+        """
+        Release instant a burst job should target
+
+        Args:
+            hour: Release hour
+            minute: Release minute
+            now: Current time (default: now)
+            grace_seconds: How long after a release it is still considered current
+            second: Release second
+
+        Returns:
+            Today's release instant, or tomorrow's if today's is more than grace_seconds ago
+        """
+        now = now or datetime.now()
+        release = now.replace(hour=hour, minute=minute, second=second, microsecond=0)
+        if release + timedelta(seconds=grace_seconds) < now:
+            release += timedelta(days=1)
+        return release
+
+    def _lead_wait(self, release_at: datetime) -> float:
+        """Seconds until polling should start"""
+        start_at = release_at - self._lead
+        wait = (start_at - datetime.now()).total_seconds()
+        if wait > 0:
+            logger.info(f"Burst polling starts at {start_at:%H:%M:%S} ({wait:.1f}s), release at {release_at:%H:%M:%S}")
+        return wait
+
+    @staticmethod
+    def _on_error(burst: BurstResult, error: Exception) -> None:
+        """Count a failed poll"""
+        burst.errors += 1
+        logger.warning(f"Burst poll {burst.polls} failed: {error}")
+
+    def _on_result(
+        self,
+        burst: BurstResult,
+        result: TicketQueryResult,
+        is_available: Callable[[TicketQueryResult], bool],
+    ) -> bool:
+        """Record a successful poll; returns whether tickets were detected"""
+        burst.result = result
+        if self._snapshot_store is not None:
+            self._snapshot_store.record(result)
+        if not is_available(result):
+            return False
+
+        burst.detected_at = datetime.now()
+        logger.info(
+            f"Tickets detected after {burst.polls} poll(s), {burst.detection_latency:+.3f}s relative to release"
+        )
+        return True
+
+    @staticmethod
+    def _on_window_closed(burst: BurstResult) -> BurstResult:
+        logger.warning(f"No tickets within the burst window ({burst.polls} poll(s), {burst.errors} error(s))")
+        return burst
+
+
+class BurstPoller(_BurstWindow):
+    """
+    Polls one list page at high frequency around a known ticket release instant
+
+    Polling starts lead_seconds before the release and repeats every interval
+    seconds until tickets appear or window_seconds after the release have passed.
+    The crawler's rate limiter still applies, so a sub-second interval is an
+    upper bound on the request rate, not a guarantee.
+    """
+
+    def __init__(
+        self,
+        crawler: ITicketCrawler,
+        interval: float = 0.5,
+        lead_seconds: float = 5,
+        window_seconds: float = 120,
+        snapshot_store: ISnapshotStore | None = None,
+    ) -> None:
+        """
+        Initialize burst poller
+
+        Args:
+            crawler: Crawler interface implementation
+            interval: Seconds between poll starts
+            lead_seconds: Seconds before the release instant to start polling
+            window_seconds: Seconds after the release instant to keep polling
+            snapshot_store: Records every successful poll (optional)
+        """
+        super().__init__(interval, lead_seconds, window_seconds, snapshot_store)
+        self._crawler = crawler
+
+    def poll(
+        self,
+        query: TicketQuery,
+        release_at: datetime,
+        is_available: Callable[[TicketQueryResult], bool] = has_available_seat,
+    ) -> BurstResult:
+        """
+        Poll until tickets appear or the window closes
+
+        Args:
+            query: Ticket query
+            release_at: Expected release instant
+            is_available: Decides whether a result counts as tickets appearing
+
+        Returns:
+            Burst result with the detection latency relative to release_at
+        """
+        end_at = release_at + self._window
+        burst = BurstResult(query=query, release_at=release_at)
+
+        wait = self._lead_wait(release_at)
+        if wait > 0:
+            time.sleep(wait)
+
+        logger.info(f"Burst polling every {self._interval}s until {end_at:%H:%M:%S}")
+
+        while datetime.now() < end_at:
+            poll_started = time.monotonic()
+            burst.polls += 1
+
+            try:
+                result = self._crawler.fetch_tickets(query)
+            except Exception as e:
+                self._on_error(burst, e)
+            else:
+                if self._on_result(burst, result, is_available):
+                    return burst
+
+            remaining = self._interval - (time.monotonic() - poll_started)
+            if remaining > 0:
+                time.sleep(remaining)
+
+        return self._on_window_closed(burst)
+
+
+class AsyncBurstPoller(_BurstWindow):
+    """
+    Burst polling from a coroutine through an async crawler
+
+    Same timing and detection as BurstPoller, but waits and requests only
+    suspend the polling coroutine, so other jobs on the event loop keep
+    running through the release window.
+    """
+
+    def __init__(
+        self,
+        crawler: IAsyncTicketCrawler,
+        interval: float = 0.5,
+        lead_seconds: float = 5,
+        window_seconds: float = 120,
+        snapshot_store: ISnapshotStore | None = None,
+    ) -> None:
+        """
+        Initialize async burst poller
+
+        Args:
+            crawler: Async crawler interface implementation
+            interval: Seconds between poll starts
+            lead_seconds: Seconds before the release instant to start polling
+            window_seconds: Seconds after the release instant to keep polling
+            snapshot_store: Records every successful poll (optional)
+        """
+        super().__init__(interval, lead_seconds, window_seconds, snapshot_store)
+        self._crawler = crawler
+
+    async def poll(
+        self,
+        query: TicketQuery,
+        release_at: datetime,
+        is_available: Callable[[TicketQueryResult], bool] = has_available_seat,
+    ) -> BurstResult:
+        """Async variant of BurstPoller.poll()"""
+        end_at = release_at + self._window
+        burst = BurstResult(query=query, release_at=release_at)
+
+        wait = self._lead_wait(release_at)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+        logger.info(f"Burst polling every {self._interval}s until {end_at:%H:%M:%S}")
+
+        loop = asyncio.get_running_loop()
+        while datetime.now() < end_at:
+            poll_started = loop.time()
+            burst.polls += 1
+
+            try:
+                result = await self._crawler.fetch_tickets(query)
+            except Exception as e:
+                self._on_error(burst, e)
+            else:
+                if self._on_result(burst, result, is_available):
+                    return burst
+
+            remaining = self._interval - (loop.time() - poll_started)
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+
+        return self._on_window_closed(burst)
@@ -0,0 +1,160 @@
+"""Crawl planning - compiles watch targets into the minimal set of list page requests"""
+
+from collections.abc import Callable, Collection, Iterable
+from concurrent.futures import ThreadPoolExecutor
+
+from loguru import logger
+
+from src.domain.models import TicketQuery, TicketQueryResult, WatchTarget
+
+PageKey = tuple[str, str, str]
+FetchFunc = Callable[[TicketQuery, Collection[str]], TicketQueryResult]
+
+
+class CrawlPlan:
+    """Distinct list page requests and the watch targets each one serves"""
+
+    def __init__(self, pages: dict[PageKey, list[tuple[WatchTarget, str]]]) -> None:
+        """
+        Initialize plan
+
+        Args:
+            pages: (departure, arrival, date) -> [(target, resolved date)]
+        """
+        self._pages = pages
+
+    @property
+    def queries(self) -> list[TicketQuery]:
+        """One list page query per distinct route and date"""
+        return [
+            TicketQuery(departure_station=departure, arrival_station=arrival, departure_date=date, train_number=None)
+            for departure, arrival, date in self._pages
+        ]
+
+    @property
+    def target_count(self) -> int:
+        """Number of watch targets covered by the plan"""
+        return sum(len(targets) for targets in self._pages.values())
+
+    def targets(self, query: TicketQuery) -> list[tuple[WatchTarget, str]]:
+        """Watch targets (with their resolved date) served by a list page query"""
+        return self._pages.get(CrawlPlanner.page_key(query), [])
+
+    def train_numbers(self, query: TicketQuery) -> list[str]:
+        """Distinct train numbers watched on a list page"""
+        return sorted({target.train_number for target, _ in self.targets(query)})
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+
+class CrawlPlanner:
+    """
+    Runs a watch list with one request per distinct list page
+
+    Targets on the same route and date share one Ctrip list page, so the page
+    is fetched once (filtered to all watched trains) and the parsed result is
+    fanned back out to every target. Request count grows with routes x dates,
+    not with the number of watched trains.
+    """
+
+    def __init__(self, fetch: FetchFunc, max_workers: int = 4) -> None:
+        """
+        Initialize planner
+
+        Args:
+            fetch: Fetches one list page for the given train numbers (e.g. with retry)
+            max_workers: Maximum list pages fetched concurrently
+        """
+        self._fetch = fetch
+        self._max_workers = max_workers
+
+    @staticmethod
+    def page_key(query: TicketQuery) -> PageKey:
+        """Key of the list page a query needs (the train number does not change the page)"""
+        return (query.departure_station.strip(), query.arrival_station.strip(), query.departure_date)
+
+    @staticmethod
+    def compile(targets: Iterable[WatchTarget], resolve_date: Callable[[int], str]) -> CrawlPlan:
+        """
+        Group watch targets by the list page they need
+
+        Args:
+            targets: Watch targets
+            resolve_date: Converts days_ahead to a YYYY-MM-DD date
+
+        Returns:
+            Crawl plan with one entry per distinct (route, date)
+        """
+        pages: dict[PageKey, list[tuple[WatchTarget, str]]] = {}
+        dates: dict[int, str] = {}
+
+        for target in dict.fromkeys(targets):
+            if target.days_ahead not in dates:
+                dates[target.days_ahead] = resolve_date(target.days_ahead)
+            date = dates[target.days_ahead]
+
+            key = (target.departure_station.strip(), target.arrival_station.strip(), date)
+            pages.setdefault(key, []).append((target, date))
+
+        plan = CrawlPlan(pages)
+        logger.info(f"Crawl plan: {plan.target_count} target(s) -> {len(plan)} list page request(s)")
+        return plan
+
+    def execute(self, plan: CrawlPlan) -> dict[WatchTarget, TicketQueryResult | Exception]:
+        """
+        Fetch every planned page once and fan results out to the targets
+
+        Args:
+            plan: Compiled crawl plan
+
+        Returns:
+            Result per watch target, or the exception raised while fetching its page
+        """
+        queries = plan.queries
+        if not queries:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(self._max_workers, len(queries))) as executor:
+            futures = [executor.submit(self._fetch, query, plan.train_numbers(query)) for query in queries]
+
+        results: dict[WatchTarget, TicketQueryResult | Exception] = {}
+        for query, future in zip(queries, futures, strict=True):
+            try:
+                page_result = future.result()
+            except Exception as e:
+                logger.error(
+                    f"Failed to fetch {query.departure_station} -> {query.arrival_station} "
+                    f"on {query.departure_date}: {e}"
+                )
+                for target, _ in plan.targets(query):
+                    results[target] = e
+                continue
+
+            for target, date in plan.targets(query):
+                results[target] = self._fan_out(page_result, target, date)
+
+        return results
+
+    def run(
+        self,
+        targets: Iterable[WatchTarget],
+        resolve_date: Callable[[int], str],
+    ) -> dict[WatchTarget, TicketQueryResult | Exception]:
+        """Compile and execute a watch list"""
+        return self.execute(self.compile(targets, resolve_date))
+
+    @staticmethod
+    def _fan_out(page_result: TicketQueryResult, target: WatchTarget, date: str) -> TicketQueryResult:
+        """Narrow a shared list page result to one target's train"""
+        return page_result.model_copy(
+            update={
+                "query": TicketQuery(
+                    departure_station=target.departure_station,
+                    arrival_station=target.arrival_station,
+                    departure_date=date,
+                    train_number=target.train_number,
+                ),
+                "trains": [train for train in page_result.trains if train.train_number == target.train_number],
+            }
+        )
@@ -0,0 +1,253 @@
+"""Columnar snapshot history analytics (NumPy)"""
+
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+
+import numpy as np
+
+from src.domain.interfaces import ISnapshotStore
+from src.domain.models import SeatSnapshot, SeatType
+
+# Seat type code = index in this tuple
+SEAT_TYPES: tuple[SeatType, ...] = tuple(SeatType)
+_SEAT_CODES = {seat_type.value: code for code, seat_type in enumerate(SEAT_TYPES)}
+
+PRICE_CHANGE_DTYPE = np.dtype(
+    [
+        ("time", "datetime64[us]"),
+        ("train", "u2"),
+        ("departure_date", "datetime64[D]"),
+        ("seat_type", "u1"),
+        ("old_price", "i4"),
+        ("new_price", "i4"),
+    ]
+)
+
+
+class SeatHistory:
+    """
+    Snapshot history held as parallel NumPy columns, one entry per seat per poll
+
+    Loading months of high-frequency polls as Pydantic models costs a few
+    hundred bytes and an object per row; here a row is ~20 bytes across fixed
+    width arrays, and every query below is a handful of vectorized passes.
+    Trains are stored as codes into train_numbers, seat types as codes into
+    SEAT_TYPES.
+    """
+
+    def __init__(
+        self,
+        time: np.ndarray,
+        train: np.ndarray,
+        train_numbers: Sequence[str],
+        departure_date: np.ndarray,
+        seat_type: np.ndarray,
+        price: np.ndarray,
+        inventory: np.ndarray,
+        bookable: np.ndarray,
+    ) -> None:
+        """
+        Initialize history from columns of equal length
+
+        Args:
+            time: Poll times (datetime64[us])
+            train: Train codes (index into train_numbers)
+            train_numbers: Distinct train numbers
+            departure_date: Departure dates (datetime64[D])
+            seat_type: Seat type codes (index into SEAT_TYPES)
+            price: Prices (yuan)
+            inventory: Inventories (99 means sufficient)
+            bookable: Bookable flags
+        """
+        columns = (time, train, departure_date, seat_type, price, inventory, bookable)
+        if len({len(column) for column in columns}) > 1:
+            raise ValueError("history columns must have the same length")
+
+        self.time = time
+        self.train = train
+        self.train_numbers = list(train_numbers)
+        self.departure_date = departure_date
+        self.seat_type = seat_type
+        self.price = price
+        self.inventory = inventory
+        self.bookable = bookable
+
+    @classmethod
+    def from_records(cls, records: Iterable[Sequence]) -> "SeatHistory":
+        """
+        Build columns from raw snapshot rows (see ISnapshotStore.history_records)
+
+        Args:
+            records: (query_time ISO, departure, arrival, date, train, seat type, price, inventory, bookable)
+
+        Returns:
+            Columnar history
+        """
+        records = list(records)
+        if not records:
+            return cls.empty()
+
+        query_time, _, _, date, train, seat_type, price, inventory, bookable = zip(*records, strict=True)
+
+        train_numbers, train_codes = np.unique(np.asarray(train), return_inverse=True)
+        seat_values, seat_inverse = np.unique(np.asarray(seat_type), return_inverse=True)
+        seat_codes = np.array([_SEAT_CODES[value] for value in seat_values], dtype=np.uint8)[seat_inverse]
+
+        return cls(
+            time=np.asarray(query_time, dtype="datetime64[us]"),
+            train=train_codes.astype(np.uint16),
+            train_numbers=[str(number) for number in train_numbers],
+            departure_date=np.asarray(date, dtype="datetime64[D]"),
+            seat_type=seat_codes,
+            price=np.asarray(price, dtype=np.int32),
+            inventory=np.asarray(inventory, dtype=np.int32),
+            bookable=np.asarray(bookable, dtype=bool),
+        )
+
+    @classmethod
+    def from_snapshots(cls, snapshots: Iterable[SeatSnapshot]) -> "SeatHistory":
+        """Build columns from seat snapshot models"""
+        return cls.from_records(
+            (
+                s.query_time.isoformat(),
+                s.departure_station,
+                s.arrival_station,
+                s.departure_date,
+                s.train_number,
+                s.seat_type.value,
+                s.price,
+                s.inventory,
+                s.bookable,
+            )
+            for s in snapshots
+        )
+
+    @classmethod
+    def empty(cls) -> "SeatHistory":
+        """History without rows"""
+        return cls(
+            time=np.array([], dtype="datetime64[us]"),
+            train=np.array([], dtype=np.uint16),
+            train_numbers=[],
+            departure_date=np.array([], dtype="datetime64[D]"),
+            seat_type=np.array([], dtype=np.uint8),
+            price=np.array([], dtype=np.int32),
+            inventory=np.array([], dtype=np.int32),
+            bookable=np.array([], dtype=bool),
+        )
+
+    @property
+    def available(self) -> np.ndarray:
+        """Per-row availability (bookable with inventory left)"""
+        return self.bookable & (self.inventory > 0)
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+    def select(
+        self,
+        train_number: str | None = None,
+        departure_date: str | None = None,
+        seat_type: SeatType | None = None,
+    ) -> "SeatHistory":
+        """
+        Rows matching every given filter
+
+        Args:
+            train_number: Only this train
+            departure_date: Only this departure date (YYYY-MM-DD)
+            seat_type: Only this seat type
+
+        Returns:
+            Filtered history (train codes keep referring to the same train_numbers)
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if train_number is not None:
+            if train_number not in self.train_numbers:
+                return self._take(np.zeros(len(self), dtype=bool))
+            mask &= self.train == self.train_numbers.index(train_number)
+        if departure_date is not None:
+            mask &= self.departure_date == np.datetime64(departure_date, "D")
+        if seat_type is not None:
+            mask &= self.seat_type == SEAT_TYPES.index(seat_type)
+        return self._take(mask)
+
+    def availability_timeline(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Whether any seat was available at each poll
+
+        Returns:
+            (distinct poll times ascending, availability per poll time)
+        """
+        times, inverse = np.unique(self.time, return_inverse=True)
+        available = np.zeros(len(times), dtype=bool)
+        np.logical_or.at(available, inverse, self.available)
+        return times, available
+
+    def first_available(self) -> dict[str, datetime]:
+        """
+        First poll time with an available seat, per departure date
+
+        Returns:
+            YYYY-MM-DD -> first availability time (dates never available are omitted)
+        """
+        mask = self.available
+        dates = self.departure_date[mask]
+        times = self.time[mask]
+
+        order = np.lexsort((times, dates))
+        dates, times = dates[order], times[order]
+        first_dates, first_index = np.unique(dates, return_index=True)
+
+        return {str(date): time.astype(datetime) for date, time in zip(first_dates, times[first_index], strict=True)}
+
+    def price_changes(self) -> np.ndarray:
+        """
+        Price changes between consecutive polls of the same train, date and seat type
+
+        Returns:
+            Structured array (PRICE_CHANGE_DTYPE) ordered by series, then time
+        """
+        order = np.lexsort((self.time, self.seat_type, self.departure_date, self.train))
+        train = self.train[order]
+        date = self.departure_date[order]
+        seat_type = self.seat_type[order]
+        price = self.price[order]
+
+        same_series = (train[1:] == train[:-1]) & (date[1:] == date[:-1]) & (seat_type[1:] == seat_type[:-1])
+        changed = np.flatnonzero(same_series & (price[1:] != price[:-1])) + 1
+
+        changes = np.empty(len(changed), dtype=PRICE_CHANGE_DTYPE)
+        changes["time"] = self.time[order][changed]
+        changes["train"] = train[changed]
+        changes["departure_date"] = date[changed]
+        changes["seat_type"] = seat_type[changed]
+        changes["old_price"] = price[changed - 1]
+        changes["new_price"] = price[changed]
+        return changes
+
+    def _take(self, mask: np.ndarray) -> "SeatHistory":
+        return SeatHistory(
+            time=self.time[mask],
+            train=self.train[mask],
+            train_numbers=self.train_numbers,
+            departure_date=self.departure_date[mask],
+            seat_type=self.seat_type[mask],
+            price=self.price[mask],
+            inventory=self.inventory[mask],
+            bookable=self.bookable[mask],
+        )
+
+
+def load_history(
+    store: ISnapshotStore,
+    train_number: str,
+    departure_date: str | None = None,
+    since: datetime | None = None,
+    departure_station: str | None = None,
+    arrival_station: str | None = None,
+) -> SeatHistory:
+    """Load a train's snapshot history (optionally on one route) from a store into columns"""
+    return SeatHistory.from_records(
+        store.history_records(train_number, departure_date, since, departure_station, arrival_station)
+    )
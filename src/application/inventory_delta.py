@@ -0,0 +1,108 @@
+"""Inventory change detection between polls"""
+
+import threading
+
+from src.domain.models import InventoryEvent, InventoryEventType, SeatInfo, SeatType, TicketQueryResult
+
+SeatKey = tuple[str, str, SeatType]
+
+
+class InventoryDeltaEngine:
+    """
+    Keeps the last known seat state per (train, date, seat type) and emits change events
+
+    A seat seen for the first time only emits an event when it is available, so
+    the first poll of a sold-out train is silent. Seats missing from a result keep
+    their last state; a partial or blocked page never looks like a sell-out.
+    """
+
+    def __init__(self) -> None:
+        self._state: dict[SeatKey, SeatInfo] = {}
+        self._lock = threading.Lock()
+
+    def diff(self, result: TicketQueryResult) -> list[InventoryEvent]:
+        """
+        Compare a result with the last known state and record it
+
+        Args:
+            result: Ticket query result
+
+        Returns:
+            Events in result order (empty when nothing changed)
+        """
+        with self._lock:
+            events = self._events(result)
+            self._record(result)
+        return events
+
+    def peek(self, result: TicketQueryResult) -> list[InventoryEvent]:
+        """
+        Compare a result with the last known state without recording it
+
+        Pair with record() once the events were acted on, so a failure in
+        between reports the same events again on the next poll.
+        """
+        with self._lock:
+            return self._events(result)
+
+    def record(self, result: TicketQueryResult) -> None:
+        """Record a result as the last known state"""
+        with self._lock:
+            self._record(result)
+
+    def _events(self, result: TicketQueryResult) -> list[InventoryEvent]:
+        """Events between the last known state and a result (caller holds the lock)"""
+        date = result.query.departure_date
+        events: list[InventoryEvent] = []
+
+        for train in result.trains:
+            for seat in train.seats:
+                key = (train.train_number, date, seat.seat_type)
+                previous = self._state.get(key)
+
+                for event_type in self._compare(previous, seat):
+                    events.append(
+                        InventoryEvent(
+                            event_type=event_type,
+                            train_number=train.train_number,
+                            departure_date=date,
+                            seat_type=seat.seat_type,
+                            previous=previous,
+                            current=seat,
+                        )
+                    )
+
+        return events
+
+    def _record(self, result: TicketQueryResult) -> None:
+        """Store the seats of a result (caller holds the lock)"""
+        date = result.query.departure_date
+        for train in result.trains:
+            for seat in train.seats:
+                self._state[(train.train_number, date, seat.seat_type)] = seat
+
+    def forget(self, departure_date: str) -> None:
+        """Drop state for a date (e.g. once it is in the past)"""
+        with self._lock:
+            for key in [key for key in self._state if key[1] == departure_date]:
+                del self._state[key]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._state)
+
+    @staticmethod
+    def _compare(previous: SeatInfo | None, current: SeatInfo) -> list[InventoryEventType]:
+        """Event types between two states of one seat"""
+        if previous is None or not previous.is_available:
+            return [InventoryEventType.APPEARED] if current.is_available else []
+
+        if not current.is_available:
+            return [InventoryEventType.SOLD_OUT]
+
+        events = []
+        if current.inventory < previous.inventory:
+            events.append(InventoryEventType.INVENTORY_DROPPED)
+        if current.price != previous.price:
+            events.append(InventoryEventType.PRICE_CHANGED)
+        return events
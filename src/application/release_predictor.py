@@ -0,0 +1,117 @@
+"""Ticket release time prediction from snapshot history"""
+
+from datetime import datetime, time, timedelta
+
+import numpy as np
+from loguru import logger
+
+from src.application.history_analytics import SeatHistory
+from src.domain.models import ReleasePrediction
+
+_DAY_SECONDS = 24 * 3600
+
+
+class ReleaseTimePredictor:
+    """
+    Learns when a train's tickets are released from its snapshot history
+
+    Each departure date's polls are reduced to an availability series (any seat
+    available per poll). A release is the first change point from unavailable to
+    available, kept only when the two polls around it are at most max_gap
+    apart; a flip seen across a long gap says little about when it happened.
+    The release instant is estimated as the midpoint of those two polls, and
+    the prediction is the median time of day over all observed releases.
+    """
+
+    def __init__(self, min_observations: int = 3, max_gap_seconds: float = 600) -> None:
+        """
+        Initialize predictor
+
+        Args:
+            min_observations: Observed releases required before predicting
+            max_gap_seconds: Maximum seconds between the polls bracketing a release
+        """
+        if min_observations < 1:
+            raise ValueError("min_observations must be at least 1")
+
+        self._min_observations = min_observations
+        self._max_gap = np.timedelta64(int(max_gap_seconds * 1_000_000), "us")
+
+    def release_instants(self, history: SeatHistory) -> np.ndarray:
+        """
+        Estimated release instant per departure date with an observed release
+
+        Args:
+            history: Snapshot history of one train
+
+        Returns:
+            Release instants (datetime64[us]) ordered by departure date
+        """
+        if len(history) == 0:
+            return np.array([], dtype="datetime64[us]")
+
+        # One row per (date, poll time): available if any seat is
+        order = np.lexsort((history.time, history.departure_date))
+        dates = history.departure_date[order]
+        times = history.time[order]
+        starts = np.flatnonzero(np.r_[True, (dates[1:] != dates[:-1]) | (times[1:] != times[:-1])])
+        poll_dates = dates[starts]
+        poll_times = times[starts]
+        poll_available = np.logical_or.reduceat(history.available[order], starts)
+
+        # Unavailable -> available flips within one date, bracketed by close polls
+        flips = np.flatnonzero(
+            (poll_dates[1:] == poll_dates[:-1])
+            & poll_available[1:]
+            & ~poll_available[:-1]
+            & (poll_times[1:] - poll_times[:-1] <= self._max_gap)
+        )
+        # The first flip of each date is its release; later ones are restocks
+        _, first = np.unique(poll_dates[flips + 1], return_index=True)
+        flips = flips[first]
+
+        before = poll_times[flips]
+        releases: np.ndarray = before + (poll_times[flips + 1] - before) / 2
+        return releases
+
+    def predict(self, history: SeatHistory, train_number: str) -> ReleasePrediction | None:
+        """
+        Predict a train's release time of day
+
+        Args:
+            history: Snapshot history (rows of other trains are ignored)
+            train_number: Train number
+
+        Returns:
+            Prediction, or None with fewer than min_observations observed releases
+        """
+        instants = self.release_instants(history.select(train_number=train_number))
+        if len(instants) < self._min_observations:
+            logger.info(
+                f"Not enough observed releases for {train_number} "
+                f"({len(instants)}/{self._min_observations}), keeping the configured schedule"
+            )
+            return None
+
+        # Microseconds since midnight; releases are assumed not to straddle midnight
+        time_of_day = (instants - instants.astype("datetime64[D]")).astype(np.int64)
+        median = float(np.median(time_of_day))
+        spread = float(np.median(np.abs(time_of_day - median)))
+
+        prediction = ReleasePrediction(
+            train_number=train_number,
+            release_time=self._to_time(median),
+            observations=len(instants),
+            spread_seconds=spread / 1_000_000,
+        )
+        logger.info(
+            f"Predicted release for {train_number}: {prediction.release_time:%H:%M:%S} "
+            f"(±{prediction.spread_seconds:.0f}s over {prediction.observations} release(s))"
+        )
+        return prediction
+
+    @staticmethod
+    def _to_time(microseconds: float) -> time:
+        """Time of day from microseconds since midnight (rounded to the second)"""
+        seconds = round(microseconds / 1_000_000) % _DAY_SECONDS
+        return (datetime.min + timedelta(seconds=seconds)).time()
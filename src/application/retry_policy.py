@@ -0,0 +1,188 @@
+"""Retry policy with Fibonacci backoff, full jitter and an overall deadline"""
+
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from loguru import logger
+
+from src.domain.exceptions import RetryExhaustedException
+
+T = TypeVar("T")
+
+
+class RetryPolicy:
+    """
+    Retry budget for one operation
+
+    Waits follow the Fibonacci sequence (1s, 1s, 2s, 3s, 5s...) with full jitter,
+    i.e. a random wait in [0, fib(n)], so watchers released at the same instant do
+    not retry in lockstep. No attempt is started after the overall deadline.
+    Empty results and errors are classified separately and can each be retried
+    or not. run() blocks the calling thread; run_async() only suspends the
+    calling coroutine, so other jobs on the event loop keep running.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        deadline: float | None = None,
+        jitter: bool = True,
+        max_delay: float = 30.0,
+        retry_on_empty: bool = True,
+        retry_on_error: bool = True,
+        retryable: tuple[type[BaseException], ...] = (Exception,),
+    ) -> None:
+        """
+        Initialize retry policy
+
+        Args:
+            max_attempts: Maximum attempts, including the first
+            deadline: Overall time budget in seconds from the first attempt (None for no limit)
+            jitter: Randomize each wait in [0, fib(n)] (full jitter)
+            max_delay: Upper bound for a single wait in seconds
+            retry_on_empty: Retry when the result is empty
+            retry_on_error: Retry when the operation raises
+            retryable: Exception types worth retrying (others fail immediately)
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self._max_attempts = max_attempts
+        self._deadline = deadline or None
+        self._jitter = jitter
+        self._max_delay = max_delay
+        self._retry_on_empty = retry_on_empty
+        self._retry_on_error = retry_on_error
+        self._retryable = retryable
+
+    @property
+    def max_attempts(self) -> int:
+        """Maximum attempts, including the first"""
+        return self._max_attempts
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Wait before the attempt following `attempt`
+
+        Args:
+            attempt: Number of the attempt that just finished (1-based)
+
+        Returns:
+            Seconds to wait
+        """
+        fib_a, fib_b = 1, 1
+        for _ in range(attempt - 1):
+            fib_a, fib_b = fib_b, fib_a + fib_b
+
+        base = min(fib_a, self._max_delay)
+        return random.uniform(0, base) if self._jitter else base
+
+    def run(
+        self,
+        func: Callable[[], T],
+        is_empty: Callable[[T], bool] = lambda result: not result,
+        operation: str = "complete operation",
+    ) -> T:
+        """
+        Call func until it returns a non-empty result or the budget runs out
+
+        Args:
+            func: Operation to attempt
+            is_empty: Classifies a result as empty (worth retrying)
+            operation: Description used in logs and errors
+
+        Returns:
+            First non-empty result, or the last (empty) result when the budget runs out
+
+        Raises:
+            RetryExhaustedException: Raised when the last attempt failed with an error
+        """
+        started = time.monotonic()
+
+        attempt = 0
+        delay: float | None
+
+        # Every path ends in return/raise once attempts or the deadline run out
+        while True:
+            attempt += 1
+            logger.info(f"Attempting to {operation} (attempt {attempt}/{self._max_attempts})...")
+            try:
+                result = func()
+            except Exception as e:
+                delay = self._on_error(e, attempt, started, operation)
+            else:
+                delay = self._on_result(result, is_empty, attempt, started)
+                if delay is None:
+                    return result
+
+            logger.info(f"Waiting {delay:.2f}s before retry (Fibonacci backoff)...")
+            time.sleep(delay)
+
+    async def run_async(
+        self,
+        func: Callable[[], Awaitable[T]],
+        is_empty: Callable[[T], bool] = lambda result: not result,
+        operation: str = "complete operation",
+    ) -> T:
+        """Async variant of run(); waits without blocking the event loop"""
+        started = time.monotonic()
+
+        attempt = 0
+        delay: float | None
+
+        # Every path ends in return/raise once attempts or the deadline run out
+        while True:
+            attempt += 1
+            logger.info(f"Attempting to {operation} (attempt {attempt}/{self._max_attempts})...")
+            try:
+                result = await func()
+            except Exception as e:
+                delay = self._on_error(e, attempt, started, operation)
+            else:
+                delay = self._on_result(result, is_empty, attempt, started)
+                if delay is None:
+                    return result
+
+            logger.info(f"Waiting {delay:.2f}s before retry (Fibonacci backoff)...")
+            await asyncio.sleep(delay)
+
+    def _on_error(self, error: Exception, attempt: int, started: float, operation: str) -> float:
+        """Return the wait before retrying a failed attempt, or raise when it should not be retried"""
+        logger.warning(f"Attempt {attempt} failed: {error}")
+
+        delay = None
+        if self._retry_on_error and isinstance(error, self._retryable):
+            delay = self._next_delay(attempt, started)
+
+        if delay is None:
+            raise RetryExhaustedException(f"Failed to {operation} after {attempt} attempts") from error
+        return delay
+
+    def _on_result(self, result: T, is_empty: Callable[[T], bool], attempt: int, started: float) -> float | None:
+        """Return the wait before retrying an empty result, or None to accept the result"""
+        if not is_empty(result):
+            return None
+
+        logger.warning(f"Empty result (attempt {attempt}/{self._max_attempts})")
+        if not self._retry_on_empty:
+            return None
+
+        delay = self._next_delay(attempt, started)
+        if delay is None:
+            logger.warning(f"Still empty after {attempt} attempts")
+        return delay
+
+    def _next_delay(self, attempt: int, started: float) -> float | None:
+        """Wait before the next attempt, or None when attempts or the deadline are exhausted"""
+        if attempt >= self._max_attempts:
+            return None
+
+        delay = self.backoff(attempt)
+        if self._deadline is not None and time.monotonic() - started + delay >= self._deadline:
+            logger.warning(f"Retry deadline of {self._deadline:.0f}s reached, giving up")
+            return None
+
+        return delay
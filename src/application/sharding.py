@@ -0,0 +1,126 @@
+"""Watch list sharding across worker processes"""
+
+import hashlib
+from collections.abc import Callable, Iterable
+
+from loguru import logger
+
+from src.application.crawl_planner import CrawlPlanner, PageKey
+from src.domain.exceptions import DomainException
+from src.domain.interfaces import INotifier, IWorkerPool
+from src.domain.models import AnalysisResult, WatchListResult, WatchTarget
+
+# Worker commands: poll a shard without notifying, then remember the last poll once notified
+POLL = "poll"
+REMEMBER = "remember"
+
+
+def shard_index(page: PageKey, shards: int) -> int:
+    """
+    Stable shard of a list page (departure, arrival, date)
+
+    Python's hash() is salted per process, so a digest of the page key is used
+    instead: a page lands on the same worker across runs and restarts, which
+    keeps its inventory history and caches in one process. Every target on a
+    page shares its shard, so the page is still fetched once per run.
+    """
+    digest = hashlib.blake2b("|".join(page).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % shards
+
+
+def partition_targets(
+    targets: Iterable[WatchTarget], shards: int, resolve_date: Callable[[int], str]
+) -> list[list[WatchTarget]]:
+    """Split targets into shards by list page (duplicates removed, order kept within a page)"""
+    if shards < 1:
+        raise ValueError("shards must be at least 1")
+
+    plan = CrawlPlanner.compile(targets, resolve_date)
+    partitions: list[list[WatchTarget]] = [[] for _ in range(shards)]
+    for query in plan.queries:
+        partitions[shard_index(CrawlPlanner.page_key(query), shards)].extend(
+            target for target, _ in plan.targets(query)
+        )
+    return partitions
+
+
+class ShardedTargetMonitor:
+    """
+    Coordinator side of sharded monitoring
+
+    Each worker process polls its shard of the watch list with its own service
+    (fetch, parse and analysis) and reports the analyses back. The coordinator
+    sends one aggregate notification for the whole run, then tells the workers
+    to remember what was notified.
+    """
+
+    def __init__(
+        self,
+        pool: IWorkerPool,
+        notifier: INotifier,
+        resolve_date: Callable[[int], str],
+        timeout: float | None = 600,
+    ) -> None:
+        """
+        Initialize coordinator
+
+        Args:
+            pool: Worker pool, one shard per worker
+            notifier: Sends the aggregate notification of each run
+            resolve_date: Converts days_ahead to a YYYY-MM-DD date (shards are keyed by list page)
+            timeout: Seconds to wait for all shards of one run (None waits forever)
+        """
+        self._pool = pool
+        self._notifier = notifier
+        self._resolve_date = resolve_date
+        self._timeout = timeout
+
+    def monitor(self, targets: Iterable[WatchTarget]) -> dict[WatchTarget, AnalysisResult]:
+        """
+        Monitor a watch list across the worker processes
+
+        Args:
+            targets: Watched trains
+
+        Returns:
+            Analysis per target from every shard that succeeded
+
+        Raises:
+            DomainException: Raised when every non-empty shard failed
+        """
+        shards = partition_targets(targets, self._pool.size, self._resolve_date)
+        busy = sum(1 for shard in shards if shard)
+        if not busy:
+            logger.warning("Watch list is empty")
+            return {}
+
+        logger.info(f"Dispatching {sum(map(len, shards))} target(s) to {busy}/{self._pool.size} worker(s)")
+        results = self._pool.map([(POLL, shard) if shard else None for shard in shards], timeout=self._timeout)
+
+        analyses: dict[WatchTarget, AnalysisResult] = {}
+        new_tickets: list[AnalysisResult] = []
+        polled: list[bool] = []
+        for index, (shard, result) in enumerate(zip(shards, results, strict=True)):
+            polled.append(isinstance(result, WatchListResult))
+            if not shard:
+                continue
+            if isinstance(result, Exception):
+                logger.error(f"Worker {index} failed on {len(shard)} target(s): {result}")
+                continue
+            analyses.update(result.analyses)
+            new_tickets.extend(result.new_tickets)
+
+        if not any(polled):
+            raise DomainException(f"Sharded monitoring failed on all {busy} worker(s)")
+
+        if new_tickets:
+            logger.info("Found tickets! Sending aggregate notification...")
+            self._notifier.send_batch(new_tickets)
+            logger.info("Notification sent successfully")
+
+        remembered = self._pool.map([(REMEMBER, None) if ok else None for ok in polled], timeout=self._timeout)
+        for index, result in enumerate(remembered):
+            if isinstance(result, Exception):
+                logger.warning(f"Worker {index} could not remember its poll, it will notify again: {result}")
+
+        return analyses
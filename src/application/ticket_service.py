@@ -1,13 +1,43 @@
 """Ticket monitoring service (Application Use Case)"""
 
-import time
+import asyncio
+from collections.abc import Collection, Iterable, MutableMapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 from loguru import logger
 
+from src.application.burst_poller import AsyncBurstPoller, BurstPoller
+from src.application.crawl_planner import CrawlPlanner
+from src.application.inventory_delta import InventoryDeltaEngine
+from src.application.retry_policy import RetryPolicy
 from src.domain.exceptions import DomainException
-from src.domain.interfaces import INotifier, ITicketAnalyzer, ITicketCrawler
-from src.domain.models import TicketQuery
+from src.domain.interfaces import IAsyncTicketCrawler, INotifier, ISnapshotStore, ITicketAnalyzer, ITicketCrawler
+from src.domain.models import (
+    AnalysisResult,
+    BurstResult,
+    InventoryEvent,
+    SweepResult,
+    TicketQuery,
+    TicketQueryResult,
+    WatchListResult,
+    WatchTarget,
+)
+
+
+def resolve_target_date(days_ahead: int) -> str:
+    """
+    Departure date of a target N days ahead
+
+    Args:
+        days_ahead: Days ahead (Nth day from today, today is day 1)
+
+    Returns:
+        Date string (YYYY-MM-DD)
+    """
+    # days_ahead means "the Nth day", so actually today + (N-1) days
+    # Example: today is day 1, day 15 = today + 14 days
+    return (datetime.now().date() + timedelta(days=days_ahead - 1)).strftime("%Y-%m-%d")
 
 
 class TicketMonitorService:
@@ -19,6 +49,11 @@ class TicketMonitorService:
         analyzer: ITicketAnalyzer,
         notifier: INotifier,
         max_retries: int = 5,
+        max_workers: int = 4,
+        retry_policy: RetryPolicy | None = None,
+        delta_engine: InventoryDeltaEngine | None = None,
+        snapshot_store: ISnapshotStore | None = None,
+        last_analyses: MutableMapping[tuple, AnalysisResult] | None = None,
     ) -> None:
         """
         Initialize service (dependency injection)
@@ -28,11 +63,23 @@ class TicketMonitorService:
             analyzer: Analyzer interface implementation
             notifier: Notifier interface implementation
             max_retries: Maximum retry attempts (default: 5)
+            max_workers: Maximum dates fetched concurrently in a sweep (default: 4)
+            retry_policy: Retry policy for fetches (default: max_retries attempts, no deadline)
+            delta_engine: Inventory change detection; when set, analysis and notification
+                only run on inventory events (default: analyze every changed payload)
+            snapshot_store: Records every fetched result for history (optional)
+            last_analyses: Last analysis per query, reused when the crawler reports an unchanged
+                payload; pass one shared mapping so the next run's service can reuse it
         """
         self._crawler = crawler
         self._analyzer = analyzer
         self._notifier = notifier
         self._max_retries = max_retries
+        self._max_workers = max_workers
+        self._retry_policy = retry_policy or RetryPolicy(max_attempts=max_retries)
+        self._delta_engine = delta_engine
+        self._snapshot_store = snapshot_store
+        self._last_analyses = last_analyses if last_analyses is not None else {}
 
     def monitor_ticket(
         self,
@@ -42,7 +89,7 @@ class TicketMonitorService:
         days_ahead: int = 15,
     ) -> None:
         """
-        Monitor tickets (core use case) - Supports Fibonacci backoff retry
+        Monitor tickets (core use case) - Supports Fibonacci backoff retry with jitter
 
         Args:
             departure_station: Departure station
@@ -77,96 +124,438 @@ class TicketMonitorService:
             # 3. Fetch ticket data with retry
             result = self._fetch_with_retry(query)
 
-            # 4. AI analysis
-            analysis = self._analyzer.analyze(result)
+            # 4-6. Analyze and notify
+            self._notify_result(result)
 
-            logger.info(f"Analysis complete: has_ticket={analysis.has_ticket}, has_seated={analysis.has_seated_ticket}")
+        except Exception as e:
+            logger.error(f"Ticket monitoring failed: {e}")
+            # Can add failure notification here
+            raise
+
+    async def monitor_ticket_async(
+        self,
+        departure_station: str,
+        arrival_station: str,
+        train_number: str,
+        days_ahead: int,
+        crawler: IAsyncTicketCrawler,
+    ) -> None:
+        """
+        Monitor tickets from a coroutine (core use case on an event loop)
+
+        Retry waits only suspend this coroutine. Analysis and notification are
+        blocking calls and run in a worker thread, off the event loop.
+
+        Args:
+            departure_station: Departure station
+            arrival_station: Arrival station
+            train_number: Train number
+            days_ahead: Days ahead to query
+            crawler: Async crawler used for the fetch
+        """
+        query = TicketQuery(
+            departure_station=departure_station,
+            arrival_station=arrival_station,
+            departure_date=self._calculate_target_date(days_ahead),
+            train_number=train_number,
+        )
+        logger.info(
+            f"Starting ticket monitoring: {train_number}, "
+            f"{departure_station} -> {arrival_station} on {query.departure_date}"
+        )
 
-            # 5. Send notification (only when tickets are available)
-            if analysis.has_ticket:
-                logger.info("Found tickets! Sending notification...")
-                self._notifier.send(analysis)
-                logger.info("Notification sent successfully")
-            else:
-                logger.info("No tickets available, skipping notification")
+        try:
+            result = await self._retry_policy.run_async(
+                lambda: crawler.fetch_tickets(query), is_empty=lambda r: not r.trains, operation="fetch tickets"
+            )
+            self._record_fetch(result)
 
-            logger.info("Ticket monitoring completed successfully")
+            await asyncio.to_thread(self._notify_result, result)
 
         except Exception as e:
             logger.error(f"Ticket monitoring failed: {e}")
-            # Can add failure notification here
             raise
 
-    def _fetch_with_retry(self, query: TicketQuery):
+    def _notify_result(self, result: TicketQueryResult) -> None:
+        """Analyze a fetched result and notify when tickets are available, unless nothing changed"""
+        # Skip analysis and notification if nothing changed since the last poll
+        query_key = self._query_key(result.query)
+        events = self._inventory_events(result)
+        if result.unchanged and query_key in self._last_analyses:
+            logger.info("Ticket data unchanged since last poll, skipping analysis and notification")
+            return
+        if events == []:
+            logger.info("No inventory events since last poll, skipping analysis and notification")
+            self._record_inventory(result)
+            return
+
+        # AI analysis
+        analysis = self._analyzer.analyze(result)
+
+        logger.info(f"Analysis complete: has_ticket={analysis.has_ticket}, has_seated={analysis.has_seated_ticket}")
+
+        # Send notification (only when tickets are available)
+        if analysis.has_ticket:
+            logger.info("Found tickets! Sending notification...")
+            self._notifier.send(analysis)
+            logger.info("Notification sent successfully")
+        else:
+            logger.info("No tickets available, skipping notification")
+
+        # Only remember the analysis once notified, so a failed send is retried on the next poll
+        self._remember(query_key, result, analysis)
+        logger.info("Ticket monitoring completed successfully")
+
+    def monitor_release(
+        self,
+        departure_station: str,
+        arrival_station: str,
+        train_number: str,
+        days_ahead: int,
+        release_at: datetime,
+        poller: BurstPoller,
+    ) -> BurstResult:
         """
-        Retry fetching ticket data with Fibonacci backoff strategy
+        Monitor tickets around a known release instant (burst use case)
 
         Args:
-            query: Ticket query object
+            departure_station: Departure station
+            arrival_station: Arrival station
+            train_number: Train number
+            days_ahead: Days ahead to query
+            release_at: Expected ticket release instant
+            poller: Burst poller driving the high-frequency polls
+
+        Returns:
+            Burst result, including the detection latency
+        """
+        query = self._release_query(departure_station, arrival_station, train_number, days_ahead, release_at)
+        burst = poller.poll(query, release_at)
+        self._notify_burst(burst)
+        return burst
+
+    async def monitor_release_async(
+        self,
+        departure_station: str,
+        arrival_station: str,
+        train_number: str,
+        days_ahead: int,
+        release_at: datetime,
+        poller: AsyncBurstPoller,
+    ) -> BurstResult:
+        """
+        Monitor tickets around a known release instant from a coroutine (burst use case on an event loop)
+
+        Polls only suspend this coroutine; analysis and notification are blocking
+        calls and run in a worker thread, off the event loop.
+
+        Args:
+            departure_station: Departure station
+            arrival_station: Arrival station
+            train_number: Train number
+            days_ahead: Days ahead to query
+            release_at: Expected ticket release instant
+            poller: Async burst poller driving the high-frequency polls
+
+        Returns:
+            Burst result, including the detection latency
+        """
+        query = self._release_query(departure_station, arrival_station, train_number, days_ahead, release_at)
+        burst = await poller.poll(query, release_at)
+        await asyncio.to_thread(self._notify_burst, burst)
+        return burst
+
+    def _release_query(
+        self,
+        departure_station: str,
+        arrival_station: str,
+        train_number: str,
+        days_ahead: int,
+        release_at: datetime,
+    ) -> TicketQuery:
+        """Query polled by a release burst"""
+        query = TicketQuery(
+            departure_station=departure_station,
+            arrival_station=arrival_station,
+            departure_date=self._calculate_target_date(days_ahead),
+            train_number=train_number,
+        )
+
+        logger.info(f"Starting release burst: {train_number} on {query.departure_date}, release at {release_at:%H:%M}")
+        return query
+
+    def _notify_burst(self, burst: BurstResult) -> None:
+        """Analyze and notify the tickets a release burst detected"""
+        if not burst.detected or burst.result is None:
+            logger.info("No tickets detected in the release window, skipping notification")
+            return
+
+        logger.info(f"Detection latency: {burst.detection_latency:+.3f}s")
+
+        self._inventory_events(burst.result)
+        analysis = self._analyzer.analyze(burst.result)
+
+        if analysis.has_ticket:
+            logger.info("Found tickets! Sending notification...")
+            self._notifier.send(analysis)
+            logger.info("Notification sent successfully")
+
+        self._remember(self._query_key(burst.query), burst.result, analysis)
+
+    def sweep_tickets(
+        self,
+        departure_station: str,
+        arrival_station: str,
+        train_number: str,
+        days: Iterable[int],
+        weekdays: Collection[int] | None = None,
+    ) -> SweepResult:
+        """
+        Monitor tickets across several dates in one run (sweep use case)
+
+        Dates are fetched and analyzed concurrently (bounded by max_workers);
+        one aggregate notification covers every date with tickets.
+
+        Args:
+            departure_station: Departure station
+            arrival_station: Arrival station
+            train_number: Train number
+            days: Day numbers to check (today is day 1), e.g. range(1, 16)
+            weekdays: Only check dates on these weekdays (0=Monday), None for all
 
         Returns:
-            Ticket query result
+            Per-date analyses and the dates that failed
 
         Raises:
-            DomainException: Raised after all retries fail
+            DomainException: Raised when every date failed
         """
-        fib_a, fib_b = 1, 1  # Fibonacci sequence initial values
+        dates = sorted({self._calculate_target_date(day) for day in days})
+        if weekdays is not None:
+            dates = [date for date in dates if datetime.strptime(date, "%Y-%m-%d").weekday() in weekdays]
 
-        for attempt in range(1, self._max_retries + 1):
-            try:
-                logger.info(f"Fetching tickets (attempt {attempt}/{self._max_retries})...")
-                result = self._crawler.fetch_tickets(query)
+        logger.info(
+            f"Starting ticket sweep: {train_number}, {departure_station} -> {arrival_station}, {len(dates)} date(s)"
+        )
 
-                # Check if trains found
-                if result.trains:
-                    logger.info(f"Successfully fetched {len(result.trains)} train(s)")
-                    return result
-                else:
-                    logger.warning(f"No trains found (attempt {attempt}/{self._max_retries})")
+        queries = [
+            TicketQuery(
+                departure_station=departure_station,
+                arrival_station=arrival_station,
+                departure_date=date,
+                train_number=train_number,
+            )
+            for date in dates
+        ]
 
-                    # Use Fibonacci backoff if not last attempt
-                    if attempt < self._max_retries:
-                        wait_time = fib_a
-                        logger.info(f"Waiting {wait_time}s before retry (Fibonacci backoff)...")
-                        time.sleep(wait_time)
+        sweep = SweepResult()
+        if not queries:
+            logger.warning("No dates to sweep")
+            return sweep
 
-                        # Update Fibonacci sequence
-                        fib_a, fib_b = fib_b, fib_a + fib_b
+        fresh: list[tuple[TicketQueryResult, AnalysisResult]] = []
+        with ThreadPoolExecutor(max_workers=min(self._max_workers, len(queries))) as executor:
+            futures = [executor.submit(self._analyze_date, query, fresh) for query in queries]
 
+        new_tickets = False
+        for query, future in zip(queries, futures, strict=True):
+            try:
+                analysis, changed = future.result()
+                sweep.analyses.append(analysis)
+                new_tickets = new_tickets or (changed and analysis.has_ticket)
             except Exception as e:
-                logger.warning(f"Attempt {attempt} failed: {e}")
-
-                # Use Fibonacci backoff if not last attempt
-                if attempt < self._max_retries:
-                    wait_time = fib_a
-                    logger.info(f"Waiting {wait_time}s before retry (Fibonacci backoff)...")
-                    time.sleep(wait_time)
-
-                    # Update Fibonacci sequence
-                    fib_a, fib_b = fib_b, fib_a + fib_b
-                else:
-                    # Last attempt failed, raise exception
-                    raise DomainException(f"Failed to fetch tickets after {self._max_retries} attempts") from e
-
-        # All attempts found no tickets, return empty result
-        logger.warning(f"No tickets found after {self._max_retries} attempts")
-        return result
+                logger.error(f"Sweep failed for {query.departure_date}: {e}")
+                sweep.failed_dates.append(query.departure_date)
 
-    def _calculate_target_date(self, days_ahead: int) -> str:
+        if not sweep.analyses:
+            raise DomainException(f"Ticket sweep failed for all {len(queries)} date(s)")
+
+        available = sweep.available
+        logger.info(f"Sweep complete: {len(available)}/{len(queries)} date(s) with tickets")
+
+        # Skip the notification when every date with tickets is unchanged since the last sweep
+        if new_tickets:
+            logger.info("Found tickets! Sending aggregate notification...")
+            self._notifier.send_batch(available)
+            logger.info("Notification sent successfully")
+        elif available:
+            logger.info("Available dates unchanged since last poll, skipping notification")
+
+        for result, analysis in fresh:
+            self._remember(self._query_key(result.query), result, analysis)
+        return sweep
+
+    def monitor_targets(self, targets: Iterable[WatchTarget]) -> dict[WatchTarget, AnalysisResult]:
         """
-        Calculate target date
+        Monitor a watch list with one request per distinct route and date (watch list use case)
 
         Args:
-            days_ahead: Days ahead (Nth day from today, today is day 1)
+            targets: Watched trains (route, train number, days ahead)
 
         Returns:
-            Date string (YYYY-MM-DD)
+            Analysis per target that could be fetched
+
+        Raises:
+            DomainException: Raised when every target failed
         """
-        today = datetime.now().date()
-        # days_ahead means "the Nth day", so actually today + (N-1) days
-        # Example: today is day 1, day 15 = today + 14 days
-        target = today + timedelta(days=days_ahead - 1)
+        run = self.poll_targets(targets)
+
+        if run.new_tickets:
+            logger.info("Found tickets! Sending aggregate notification...")
+            self._notifier.send_batch(run.new_tickets)
+            logger.info("Notification sent successfully")
+
+        self.remember(run)
+        return run.analyses
+
+    def poll_targets(self, targets: Iterable[WatchTarget]) -> WatchListResult:
+        """
+        Fetch and analyze a watch list without notifying
+
+        The caller notifies run.new_tickets and then calls remember(run);
+        until then, the next poll reports the same tickets again.
+
+        Args:
+            targets: Watched trains (route, train number, days ahead)
+
+        Returns:
+            Analyses and the new tickets to notify (empty for an empty watch list)
+
+        Raises:
+            DomainException: Raised when every target failed
+        """
+        planner = CrawlPlanner(self._fetch_with_retry, max_workers=self._max_workers)
+        results = planner.run(targets, self._calculate_target_date)
+        run = WatchListResult()
+        if not results:
+            logger.warning("Watch list is empty")
+            return run
+
+        for target, result in results.items():
+            if isinstance(result, Exception):
+                continue
+
+            analysis, changed = self._analyze_result(result, run.fresh)
+            run.analyses[target] = analysis
+            if changed and analysis.has_ticket:
+                run.new_tickets.append(analysis)
+
+        if not run.analyses:
+            raise DomainException(f"Ticket monitoring failed for all {len(results)} target(s)")
+
+        available = sum(analysis.has_ticket for analysis in run.analyses.values())
+        logger.info(f"Watch list complete: {available}/{len(results)} with tickets")
+        return run
+
+    def remember(self, run: WatchListResult) -> None:
+        """Store the new analyses of a watch list poll once its notification went out"""
+        for result, analysis in run.fresh:
+            self._remember(self._query_key(result.query), result, analysis)
+
+    def _analyze_date(
+        self, query: TicketQuery, fresh: list[tuple[TicketQueryResult, AnalysisResult]]
+    ) -> tuple[AnalysisResult, bool]:
+        """Fetch and analyze one date (see _analyze_result)"""
+        return self._analyze_result(self._fetch_with_retry(query), fresh)
+
+    def _analyze_result(
+        self, result: TicketQueryResult, fresh: list[tuple[TicketQueryResult, AnalysisResult]]
+    ) -> tuple[AnalysisResult, bool]:
+        """
+        Analyze a query result, reusing the last analysis when nothing changed
+
+        Nothing changed when the payload is unchanged or, with a delta engine,
+        when the result produced no inventory events. A new analysis goes into
+        fresh with its result: callers remember both once notified.
+
+        Returns:
+            (analysis, whether it carries news worth notifying: a new analysis,
+            or with a delta engine, at least one inventory event)
+        """
+        query = result.query
+        query_key = self._query_key(query)
+        previous = self._last_analyses.get(query_key)
+        events = self._inventory_events(result)
+        if previous is not None and (result.unchanged or events == []):
+            logger.info(f"Ticket data for {query.train_number} on {query.departure_date} unchanged, reusing analysis")
+            self._record_inventory(result)
+            return previous, False
+
+        analysis = self._analyzer.analyze(result)
+        fresh.append((result, analysis))
+        return analysis, events is None or bool(events)
+
+    def _inventory_events(self, result: TicketQueryResult) -> list[InventoryEvent] | None:
+        """
+        Log the inventory events of a result, without recording it (see _remember)
+
+        Returns:
+            Inventory events since the last poll, None when change detection is off
+        """
+        if self._delta_engine is None:
+            return None
+
+        events = self._delta_engine.peek(result)
+        for event in events:
+            logger.info(f"Inventory event: {event.description}")
+        return events
+
+    def _record_inventory(self, result: TicketQueryResult) -> None:
+        """Record a result with the delta engine, if any"""
+        if self._delta_engine is not None:
+            self._delta_engine.record(result)
+
+    def _remember(self, query_key: tuple, result: TicketQueryResult, analysis: AnalysisResult) -> None:
+        """
+        Store an analysis and record its inventory once its notification went out
+
+        Until then, the next poll sees the same changes and notifies again.
+        """
+        self._last_analyses[query_key] = analysis
+        self._record_inventory(result)
+
+    def _fetch_with_retry(self, query: TicketQuery, train_numbers: Collection[str] | None = None) -> TicketQueryResult:
+        """
+        Fetch ticket data under the retry policy (Fibonacci backoff with jitter and a deadline)
+
+        Args:
+            query: Ticket query object
+            train_numbers: Trains to keep from the list page (defaults to the query's train number)
+
+        Returns:
+            Ticket query result (possibly without trains once the retry budget is spent)
+
+        Raises:
+            DomainException: Raised after all retries fail
+        """
+
+        def fetch() -> TicketQueryResult:
+            if train_numbers is None:
+                return self._crawler.fetch_tickets(query)
+            return self._crawler.fetch_tickets(query, train_numbers)
+
+        result = self._retry_policy.run(fetch, is_empty=lambda r: not r.trains, operation="fetch tickets")
+        self._record_fetch(result)
+        return result
+
+    def _record_fetch(self, result: TicketQueryResult) -> None:
+        """Record a fetched result in the snapshot history and log its outcome"""
+        if self._snapshot_store is not None:
+            self._snapshot_store.record(result)
+
+        if result.trains:
+            logger.info(f"Successfully fetched {len(result.trains)} train(s)")
+        else:
+            logger.warning("No tickets found within the retry budget")
+
+    @staticmethod
+    def _query_key(query: TicketQuery) -> tuple:
+        """Key identifying a monitored (route, date, train)"""
+        return (query.departure_station, query.arrival_station, query.departure_date, query.train_number)
+
+    def _calculate_target_date(self, days_ahead: int) -> str:
+        """Calculate and log the target date (see resolve_target_date)"""
+        target = resolve_target_date(days_ahead)
 
-        logger.info(f"Calculated target (day {days_ahead}): {target.strftime('%Y-%m-%d (%A)')}")
+        logger.info(f"Calculated target (day {days_ahead}): {datetime.strptime(target, '%Y-%m-%d'):%Y-%m-%d (%A)}")
 
-        return target.strftime("%Y-%m-%d")
+        return target
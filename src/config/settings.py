@@ -1,8 +1,12 @@
 """Application settings using Pydantic Settings"""
 
+from typing import Literal
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from src.domain.models import WatchTarget
+
 
 class Settings(BaseSettings):
     """Application settings (strongly typed)"""
@@ -23,6 +27,17 @@ class Settings(BaseSettings):
     arrival_station: str = Field(default="成都南", description="Arrival station")
     train_number: str = Field(default="C3380", description="Train number")
     days_ahead: int = Field(default=15, ge=1, le=30, description="Days ahead to query")
+    watch_targets: list[WatchTarget] = Field(
+        default=[], description="Watch list (overrides the single train above when set)"
+    )
+
+    # === Sweep Configuration ===
+    sweep_start_day: int = Field(default=1, ge=1, le=30, description="First day checked by a sweep (today is day 1)")
+    sweep_end_day: int = Field(default=15, ge=1, le=30, description="Last day checked by a sweep")
+    sweep_weekdays: list[int] = Field(
+        default=[], description="Only sweep dates on these weekdays (0=Monday, empty for all)"
+    )
+    sweep_max_workers: int = Field(default=4, ge=1, le=16, description="Dates fetched concurrently in a sweep")
 
     # === Schedule Configuration ===
     schedule_days_of_week: list[int] = Field(
@@ -31,11 +46,72 @@ class Settings(BaseSettings):
     schedule_hour: int = Field(default=15, ge=0, le=23, description="Schedule hour")
     schedule_minute: int = Field(default=30, ge=0, le=59, description="Schedule minute")
     max_retries: int = Field(default=5, ge=1, le=10, description="Retry count (Fibonacci backoff)")
+    retry_deadline: float = Field(
+        default=60, ge=0, le=600, description="Overall retry budget per fetch in seconds (0=no limit)"
+    )
+    retry_jitter: bool = Field(default=True, description="Randomize retry waits in [0, Fibonacci delay]")
+    scheduler_backend: Literal["blocking", "asyncio"] = Field(
+        default="blocking", description="Scheduler implementation (asyncio runs coroutine jobs on one event loop)"
+    )
+    scheduler_state_path: str = Field(
+        default="", description="SQLite file persisting job run state across restarts (empty disables)"
+    )
+    scheduler_misfire_grace_seconds: int = Field(
+        default=300, ge=0, le=86400, description="How late a missed run (e.g. during a restart) may still start"
+    )
+    warmup_seconds: int = Field(
+        default=30, ge=0, le=600, description="Seconds before each run to pre-warm crawler connections (0=off)"
+    )
+    reuse_clients: bool = Field(
+        default=False, description="Keep crawler, analyzer and notifier alive across runs (long-running mode)"
+    )
+
+    # === Worker Configuration ===
+    worker_processes: int = Field(
+        default=1, ge=1, le=64, description="Worker processes sharing the watch list (1 = single process)"
+    )
+    leader_lock_path: str = Field(
+        default="data/leader.lock", description="Lock file ensuring one coordinator schedules jobs (empty disables)"
+    )
+
+    # === Burst Configuration ===
+    burst_enabled: bool = Field(default=False, description="Poll at high frequency around the release time")
+    burst_interval: float = Field(default=0.5, ge=0.1, le=60, description="Seconds between burst polls")
+    burst_lead_seconds: int = Field(
+        default=5, ge=0, le=300, description="Seconds before the release time to start polling"
+    )
+    burst_window_seconds: int = Field(
+        default=120, ge=1, le=3600, description="Seconds after the release time to keep polling"
+    )
+    burst_predict_release: bool = Field(
+        default=True, description="Center burst polling on the release time learned from snapshot history"
+    )
+    burst_min_observations: int = Field(
+        default=3, ge=1, le=100, description="Observed releases required before the learned time is used"
+    )
+
+    # === Persistence Configuration ===
+    snapshot_db_path: str = Field(
+        default="", description="SQLite database recording every poll as seat-level rows (empty disables)"
+    )
+    snapshot_batch_size: int = Field(
+        default=100, ge=1, le=10000, description="Poll results written per snapshot transaction"
+    )
 
     # === DeepSeek Configuration ===
     deepseek_api_key: str = Field(..., description="DeepSeek API key")
     deepseek_base_url: str = Field(default="https://api.deepseek.com", description="DeepSeek API URL")
     deepseek_model: str = Field(default="deepseek-chat", description="DeepSeek model")
+    analysis_cache_backend: Literal["memory", "sqlite"] = Field(
+        default="memory", description="Where AI analyses are cached (sqlite survives restarts)"
+    )
+    analysis_cache_ttl: float = Field(
+        default=3600, ge=0, le=7 * 86400, description="Seconds an AI analysis is reused for the same seat state (0=off)"
+    )
+    analysis_cache_size: int = Field(default=512, ge=1, description="Maximum cached AI analyses")
+    analysis_cache_path: str = Field(
+        default="data/analysis_cache.db", description="SQLite file of the sqlite analysis cache backend"
+    )
 
     # === Email Configuration ===
     smtp_host: str = Field(..., description="SMTP server address")
@@ -47,6 +123,23 @@ class Settings(BaseSettings):
 
     # === Crawler Configuration ===
     crawler_timeout: int = Field(default=10, ge=1, le=60, description="Crawler timeout (seconds)")
+    crawler_max_concurrency: int = Field(
+        default=8, ge=1, le=64, description="Maximum concurrent requests for the async crawler"
+    )
+    crawler_streaming: bool = Field(
+        default=False, description="Stream responses and stop reading once __NEXT_DATA__ is complete"
+    )
+    crawler_cache_ttl: float = Field(
+        default=1.0, ge=0, le=300, description="Shared response cache TTL in seconds (0 disables)"
+    )
+    crawler_cache_size: int = Field(default=256, ge=1, description="Maximum cached list pages")
+    crawler_rate_limit: float = Field(
+        default=2.0, gt=0, le=50, description="Sustained request rate to the Ctrip host (requests/second)"
+    )
+    crawler_rate_burst: int = Field(default=4, ge=1, le=100, description="Requests allowed in a burst above the rate")
+    crawler_hedge_percentile: float = Field(
+        default=95, ge=0, le=100, description="Latency percentile after which a hedged request is sent (0 disables)"
+    )
 
 
 def load_settings() -> Settings:
@@ -1,13 +1,72 @@
 """Dependency Injection Container"""
 
+import importlib
+from collections.abc import Callable, Iterator
+from typing import Any
+from urllib.parse import urlparse
+
 from dependency_injector import containers, providers
+from loguru import logger
 
-from src.application.ticket_service import TicketMonitorService
+from src.application.inventory_delta import InventoryDeltaEngine
+from src.application.retry_policy import RetryPolicy
 from src.config.settings import Settings
-from src.infrastructure.analyzer import DeepSeekAnalyzer
-from src.infrastructure.crawler import CtripTicketCrawler
-from src.infrastructure.notifier import EmailNotifier
-from src.infrastructure.scheduler import APSchedulerWrapper
+from src.infrastructure.analysis_cache import open_analysis_cache
+from src.infrastructure.cache import TTLCache
+from src.infrastructure.job_state import open_job_state_store
+from src.infrastructure.latency import LatencyTracker
+from src.infrastructure.rate_limiter import AdaptiveRateLimiter
+from src.infrastructure.singleflight import SingleFlight
+from src.infrastructure.snapshot_store import SQLiteSnapshotStore, open_snapshot_store
+
+
+def _lazy(target: str) -> Callable[..., Any]:
+    """
+    Provider target that imports "module:attribute" only when first called
+
+    Adapters pull in openai, requests/bs4, httpx, apscheduler or numpy; importing
+    them here would make every start pay for all of them, even a --once run that
+    never builds a scheduler. dependency_injector resolves string targets at
+    class definition, so the import is deferred through this wrapper instead.
+
+    Args:
+        target: Import path as "package.module:attribute"
+
+    Returns:
+        Callable forwarding its arguments to the imported attribute
+    """
+    module_name, attribute = target.split(":")
+
+    def create(*args: Any, **kwargs: Any) -> Any:
+        return getattr(importlib.import_module(module_name), attribute)(*args, **kwargs)
+
+    create.__name__ = create.__qualname__ = attribute
+    return create
+
+
+def _managed_client(factory: Callable[[], Any]) -> Iterator[Any]:
+    """Resource initializer: one client from factory, closed when the resource shuts down"""
+    client = factory()
+    try:
+        yield client
+    finally:
+        client.close()
+
+
+def _managed_snapshot_store(path: str, batch_size: int) -> Iterator[SQLiteSnapshotStore | None]:
+    """Resource initializer: the poll history store, flushed and closed when the resource shuts down"""
+    store = open_snapshot_store(path, batch_size=batch_size)
+    try:
+        yield store
+    finally:
+        if store is not None:
+            store.close()
+
+
+def _ctrip_host() -> str:
+    from src.infrastructure.crawler import CtripTicketCrawler
+
+    return urlparse(CtripTicketCrawler.BASE_URL).netloc
 
 
 class Container(containers.DeclarativeContainer):
@@ -17,20 +76,85 @@ class Container(containers.DeclarativeContainer):
     config = providers.Singleton(Settings)
 
     # === Infrastructure Layer ===
+    # Shared by every crawler instance so watchers of the same route/date reuse one response
+    response_cache: providers.Singleton[TTLCache[str | bytes]] = providers.Singleton(
+        TTLCache,
+        ttl=config.provided.crawler_cache_ttl,
+        maxsize=config.provided.crawler_cache_size,
+    )
+
+    # Coalesces identical page requests that are in flight at the same time (release-time bursts)
+    single_flight: providers.Singleton[SingleFlight[str | bytes]] = providers.Singleton(SingleFlight)
+
+    # One limiter for the Ctrip host, shared by sync and async crawlers
+    rate_limiter = providers.Singleton(
+        AdaptiveRateLimiter,
+        host=providers.Callable(_ctrip_host),
+        rate=config.provided.crawler_rate_limit,
+        burst=config.provided.crawler_rate_burst,
+        max_concurrency=config.provided.crawler_max_concurrency,
+    )
+
+    # Last payload fingerprint per poll target and last analysis per query. Process-wide, so
+    # the crawler and service built for each run still recognize the previous run's payload
+    last_results: providers.Singleton[dict] = providers.Singleton(dict)
+    last_analyses: providers.Singleton[dict] = providers.Singleton(dict)
+
+    # Recent latency per host, so hedge delays adapt across crawler instances
+    latency_tracker = providers.Singleton(LatencyTracker)
+
+    # Poll history (None when SNAPSHOT_DB_PATH is empty); one writer thread per process.
+    # A resource, so shutdown_resources() closes it only if a run opened it
+    snapshot_store = providers.Resource(
+        _managed_snapshot_store,
+        path=config.provided.snapshot_db_path,
+        batch_size=config.provided.snapshot_batch_size,
+    )
+
     crawler = providers.Factory(
-        CtripTicketCrawler,
+        _lazy("src.infrastructure.crawler:CtripTicketCrawler"),
         timeout=config.provided.crawler_timeout,
+        stream=config.provided.crawler_streaming,
+        response_cache=response_cache,
+        single_flight=single_flight,
+        rate_limiter=rate_limiter,
+        hedge_percentile=config.provided.crawler_hedge_percentile,
+        latency_tracker=latency_tracker,
+        last_results=last_results,
+    )
+
+    async_crawler = providers.Factory(
+        _lazy("src.infrastructure.async_crawler:AsyncCtripTicketCrawler"),
+        timeout=config.provided.crawler_timeout,
+        max_concurrency=config.provided.crawler_max_concurrency,
+        stream=config.provided.crawler_streaming,
+        response_cache=response_cache,
+        single_flight=single_flight,
+        rate_limiter=rate_limiter,
+        hedge_percentile=config.provided.crawler_hedge_percentile,
+        latency_tracker=latency_tracker,
+        last_results=last_results,
+    )
+
+    # Reused LLM answers per seat state, shared by every analyzer instance
+    analysis_cache = providers.Singleton(
+        open_analysis_cache,
+        backend=config.provided.analysis_cache_backend,
+        ttl=config.provided.analysis_cache_ttl,
+        maxsize=config.provided.analysis_cache_size,
+        path=config.provided.analysis_cache_path,
     )
 
     analyzer = providers.Factory(
-        DeepSeekAnalyzer,
+        _lazy("src.infrastructure.analyzer:DeepSeekAnalyzer"),
         api_key=config.provided.deepseek_api_key,
         base_url=config.provided.deepseek_base_url,
         model=config.provided.deepseek_model,
+        analysis_cache=analysis_cache,
     )
 
     notifier = providers.Factory(
-        EmailNotifier,
+        _lazy("src.infrastructure.notifier:EmailNotifier"),
         smtp_host=config.provided.smtp_host,
         smtp_port=config.provided.smtp_port,
         smtp_user=config.provided.smtp_user,
@@ -39,13 +163,100 @@ class Container(containers.DeclarativeContainer):
         to_addrs=config.provided.email_to,
     )
 
-    scheduler = providers.Singleton(APSchedulerWrapper)
+    # === Long-running mode (REUSE_CLIENTS) ===
+    # One client per process, kept across runs so the requests session and the OpenAI
+    # HTTP pool keep their connections; see shared_clients() for health checks
+    shared_crawler = providers.Resource(_managed_client, crawler.provider)
+    shared_analyzer = providers.Resource(_managed_client, analyzer.provider)
+    shared_notifier = providers.Resource(_managed_client, notifier.provider)
+
+    # Job run state across restarts (None when SCHEDULER_STATE_PATH is empty)
+    job_state_store = providers.Singleton(open_job_state_store, path=config.provided.scheduler_state_path)
+
+    scheduler = providers.Selector(
+        config.provided.scheduler_backend,
+        blocking=providers.Singleton(
+            _lazy("src.infrastructure.scheduler:APSchedulerWrapper"),
+            job_state=job_state_store,
+            misfire_grace_seconds=config.provided.scheduler_misfire_grace_seconds,
+        ),
+        asyncio=providers.Singleton(
+            _lazy("src.infrastructure.scheduler:AsyncIOSchedulerWrapper"),
+            job_state=job_state_store,
+            misfire_grace_seconds=config.provided.scheduler_misfire_grace_seconds,
+        ),
+    )
 
     # === Application Layer ===
+    retry_policy = providers.Factory(
+        RetryPolicy,
+        max_attempts=config.provided.max_retries,
+        deadline=config.provided.retry_deadline,
+        jitter=config.provided.retry_jitter,
+    )
+
+    # Shared across runs so inventory changes are detected between scheduled polls
+    delta_engine = providers.Singleton(InventoryDeltaEngine)
+
+    release_predictor = providers.Factory(
+        _lazy("src.application.release_predictor:ReleaseTimePredictor"),
+        min_observations=config.provided.burst_min_observations,
+    )
+
+    burst_poller = providers.Factory(
+        _lazy("src.application.burst_poller:BurstPoller"),
+        crawler=crawler,
+        interval=config.provided.burst_interval,
+        lead_seconds=config.provided.burst_lead_seconds,
+        window_seconds=config.provided.burst_window_seconds,
+        snapshot_store=snapshot_store,
+    )
+
+    async_burst_poller = providers.Factory(
+        _lazy("src.application.burst_poller:AsyncBurstPoller"),
+        crawler=async_crawler,
+        interval=config.provided.burst_interval,
+        lead_seconds=config.provided.burst_lead_seconds,
+        window_seconds=config.provided.burst_window_seconds,
+        snapshot_store=snapshot_store,
+    )
+
     ticket_service = providers.Factory(
-        TicketMonitorService,
+        _lazy("src.application.ticket_service:TicketMonitorService"),
         crawler=crawler,
         analyzer=analyzer,
         notifier=notifier,
         max_retries=config.provided.max_retries,
+        max_workers=config.provided.sweep_max_workers,
+        retry_policy=retry_policy,
+        delta_engine=delta_engine,
+        snapshot_store=snapshot_store,
+        last_analyses=last_analyses,
     )
+
+
+def shared_clients(container: Container) -> dict[str, Any]:
+    """
+    Long-lived crawler, analyzer and notifier, recreating any that became unhealthy
+
+    Meant to be called before each run in long-running mode: a client whose
+    health check fails (e.g. its last request could not connect) is closed and
+    replaced, so one broken connection pool does not fail every later run.
+
+    Args:
+        container: Application container
+
+    Returns:
+        Keyword arguments for container.ticket_service()
+    """
+    clients = {}
+    for name, resource in (
+        ("crawler", container.shared_crawler),
+        ("analyzer", container.shared_analyzer),
+        ("notifier", container.shared_notifier),
+    ):
+        if resource.initialized and not resource().healthy():
+            logger.warning(f"Shared {name} failed its health check, recreating it")
+            resource.shutdown()
+        clients[name] = resource()
+    return clients
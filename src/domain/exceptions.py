@@ -29,3 +29,9 @@ class ConfigurationException(DomainException):
     """Configuration exception"""
 
     pass
+
+
+class RetryExhaustedException(DomainException):
+    """Retry attempts or deadline exhausted"""
+
+    pass
@@ -1,21 +1,29 @@
 """Domain interfaces (Abstract Base Classes)"""
 
 from abc import ABC, abstractmethod
-from typing import Protocol
+from collections.abc import Callable, Collection
+from datetime import datetime
+from typing import Any, Protocol
 
-from src.domain.models import AnalysisResult, TicketQuery, TicketQueryResult
+from src.domain.exceptions import CrawlerException
+from src.domain.models import AnalysisResult, SeatSnapshot, TicketQuery, TicketQueryResult
 
 
 class ITicketCrawler(ABC):
     """Ticket crawler interface"""
 
     @abstractmethod
-    def fetch_tickets(self, query: TicketQuery) -> TicketQueryResult:
+    def fetch_tickets(
+        self,
+        query: TicketQuery,
+        train_numbers: Collection[str] | None = None,
+    ) -> TicketQueryResult:
         """
         Fetch ticket information
 
         Args:
             query: Query conditions
+            train_numbers: Only return these trains (defaults to query.train_number when set)
 
         Returns:
             Query result
@@ -25,6 +33,60 @@ class ITicketCrawler(ABC):
         """
         pass
 
+    def healthy(self) -> bool:
+        """Whether the crawler can keep serving requests (a long-lived one is recreated otherwise)"""
+        return True
+
+    def close(self) -> None:
+        """Release pooled connections"""
+        pass
+
+
+class IAsyncTicketCrawler(ABC):
+    """Async ticket crawler interface"""
+
+    @abstractmethod
+    async def fetch_tickets(
+        self,
+        query: TicketQuery,
+        train_numbers: Collection[str] | None = None,
+    ) -> TicketQueryResult:
+        """
+        Fetch ticket information
+
+        Args:
+            query: Query conditions
+            train_numbers: Only return these trains (defaults to query.train_number when set)
+
+        Returns:
+            Query result
+
+        Raises:
+            CrawlerException: Raised when crawling fails
+        """
+        pass
+
+    @abstractmethod
+    async def fetch_many(
+        self,
+        queries: list[TicketQuery],
+        return_exceptions: bool = False,
+    ) -> list[TicketQueryResult | CrawlerException]:
+        """
+        Fetch ticket information for several queries concurrently
+
+        Args:
+            queries: Query conditions
+            return_exceptions: Return failures in place instead of raising the first one
+
+        Returns:
+            Query results in the same order as queries
+
+        Raises:
+            CrawlerException: Raised when a query fails and return_exceptions is False
+        """
+        pass
+
 
 class ITicketAnalyzer(ABC):
     """Ticket analyzer interface"""
@@ -45,6 +107,14 @@ class ITicketAnalyzer(ABC):
         """
         pass
 
+    def healthy(self) -> bool:
+        """Whether the analyzer's API client is still usable (a long-lived one is recreated otherwise)"""
+        return True
+
+    def close(self) -> None:
+        """Release the API client's connections"""
+        pass
+
 
 class INotifier(ABC):
     """Notifier interface"""
@@ -62,6 +132,104 @@ class INotifier(ABC):
         """
         pass
 
+    def send_batch(self, analyses: list[AnalysisResult]) -> None:
+        """
+        Send one notification covering several analyses
+
+        Defaults to one send() per analysis; implementations can aggregate.
+
+        Args:
+            analyses: Analysis results (e.g. one per swept date)
+
+        Raises:
+            NotifierException: Raised when sending fails
+        """
+        for analysis in analyses:
+            self.send(analysis)
+
+    def healthy(self) -> bool:
+        """Whether the notifier can keep sending (a long-lived one is recreated otherwise)"""
+        return True
+
+    def close(self) -> None:
+        """Release open connections"""
+        pass
+
+
+class ISnapshotStore(ABC):
+    """Ticket snapshot history store interface"""
+
+    @abstractmethod
+    def record(self, result: TicketQueryResult) -> None:
+        """
+        Record a query result (must not block the crawl path)
+
+        Args:
+            result: Query result
+        """
+        pass
+
+    @abstractmethod
+    def history(
+        self,
+        train_number: str,
+        departure_date: str | None = None,
+        since: datetime | None = None,
+        departure_station: str | None = None,
+        arrival_station: str | None = None,
+    ) -> list[SeatSnapshot]:
+        """
+        Recorded seat snapshots of a train, oldest first
+
+        Args:
+            train_number: Train number
+            departure_date: Only this departure date (default: all dates)
+            since: Only snapshots polled at or after this time
+            departure_station: Only this queried departure station (default: every route)
+            arrival_station: Only this queried arrival station (default: every route)
+
+        Returns:
+            Seat snapshots ordered by poll time
+        """
+        pass
+
+    def history_records(
+        self,
+        train_number: str,
+        departure_date: str | None = None,
+        since: datetime | None = None,
+        departure_station: str | None = None,
+        arrival_station: str | None = None,
+    ) -> list[tuple]:
+        """
+        Same rows as history(), as plain tuples (for bulk loading into columns)
+
+        Returns:
+            (query_time ISO, departure, arrival, date, train, seat type, price, inventory, bookable) per row
+        """
+        return [
+            (
+                s.query_time.isoformat(),
+                s.departure_station,
+                s.arrival_station,
+                s.departure_date,
+                s.train_number,
+                s.seat_type.value,
+                s.price,
+                s.inventory,
+                s.bookable,
+            )
+            for s in self.history(train_number, departure_date, since, departure_station, arrival_station)
+        ]
+
+    def flush(self) -> None:
+        """Wait until every recorded result is persisted"""
+        pass
+
+    def close(self) -> None:
+        """Persist pending results and release resources"""
+        pass
+
 
 class IScheduler(Protocol):
     """Scheduler interface (using Protocol for structural typing)"""
@@ -71,7 +239,11 @@ class IScheduler(Protocol):
         day_of_week: int,
         hour: int,
         minute: int,
-        job_func: callable,
+        job_func: Callable,
+        warmup_func: Callable | None = None,
+        warmup_seconds: int = 0,
+        lead_seconds: int = 0,
+        job_id: str | None = None,
     ) -> None:
         """
         Schedule weekly job
@@ -81,9 +253,38 @@ class IScheduler(Protocol):
             hour: Hour
             minute: Minute
             job_func: Job function to execute
+            warmup_func: Optional function to run warmup_seconds before the job
+            warmup_seconds: Seconds before the job to run warmup_func
+            lead_seconds: Start the job this many seconds before the given time
+            job_id: Stable job ID, so persisted run state still matches after the time changes
         """
         ...
 
+    def schedule_cron_job(
+        self,
+        job_id: str,
+        job_func: Callable,
+        day_of_week: int | str | None = None,
+        hour: int | str | None = None,
+        minute: int | str | None = None,
+        second: int | str = 0,
+        max_instances: int = 1,
+        coalesce: bool = True,
+    ) -> None:
+        """Schedule a job on a cron trigger"""
+        ...
+
+    def schedule_interval_job(
+        self,
+        job_id: str,
+        job_func: Callable,
+        seconds: float,
+        max_instances: int = 1,
+        coalesce: bool = True,
+    ) -> None:
+        """Schedule a job every given number of seconds"""
+        ...
+
     def start(self) -> None:
         """Start scheduler"""
         ...
@@ -91,3 +292,28 @@ class IScheduler(Protocol):
     def shutdown(self) -> None:
         """Shutdown scheduler"""
         ...
+
+
+class IWorkerPool(Protocol):
+    """Worker pool interface (task i runs on worker i)"""
+
+    @property
+    def size(self) -> int:
+        """Number of workers"""
+        ...
+
+    def map(self, payloads: list[Any | None], timeout: float | None = None) -> list[Any]:
+        """Run payload i on worker i; failures are returned as exceptions in place"""
+        ...
+
+
+class IAnalysisCache(Protocol):
+    """AI analysis cache interface: canonical seat-state key -> (summary, recommendation)"""
+
+    def get(self, key: str) -> tuple[str, str] | None:
+        """Cached analysis, None when missing or expired"""
+        ...
+
+    def set(self, key: str, value: tuple[str, str]) -> None:
+        """Store an analysis (size and TTL bounds are up to the backend)"""
+        ...
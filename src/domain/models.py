@@ -1,6 +1,6 @@
 """Domain models with strong typing using Pydantic"""
 
-from datetime import datetime
+from datetime import date, datetime, time
 from enum import Enum
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -74,6 +74,17 @@ class TicketQuery(BaseModel):
     train_number: str | None = Field(None, description="Specified train number")
 
 
+class WatchTarget(BaseModel):
+    """Monitored train on a route, N days ahead"""
+
+    model_config = ConfigDict(frozen=True)
+
+    departure_station: str = Field(description="Departure station")
+    arrival_station: str = Field(description="Arrival station")
+    train_number: str = Field(description="Train number")
+    days_ahead: int = Field(default=15, ge=1, le=30, description="Days ahead to query (today is day 1)")
+
+
 class TicketQueryResult(BaseModel):
     """Ticket query result model"""
 
@@ -82,6 +93,7 @@ class TicketQueryResult(BaseModel):
     query: TicketQuery = Field(description="Query conditions")
     trains: list[TrainInfo] = Field(description="Found train list")
     query_time: datetime = Field(default_factory=datetime.now, description="Query time")
+    unchanged: bool = Field(default=False, description="Whether the train payload matched the previous poll")
 
     @property
     def found_trains(self) -> bool:
@@ -89,6 +101,42 @@ class TicketQueryResult(BaseModel):
         return len(self.trains) > 0
 
 
+class SeatSnapshot(BaseModel):
+    """One seat of one train as observed by one poll (a row of the snapshot history)"""
+
+    model_config = ConfigDict(frozen=True)
+
+    query_time: datetime = Field(description="Poll time")
+    departure_station: str = Field(description="Queried departure station")
+    arrival_station: str = Field(description="Queried arrival station")
+    departure_date: str = Field(description="Departure date")
+    train_number: str = Field(description="Train number")
+    seat_type: SeatType = Field(description="Seat type")
+    price: int = Field(ge=0, description="Price (yuan)")
+    inventory: int = Field(ge=0, description="Ticket inventory, 99 means sufficient")
+    bookable: bool = Field(description="Whether bookable")
+
+    @classmethod
+    def from_result(cls, result: TicketQueryResult) -> list["SeatSnapshot"]:
+        """Normalize a query result into seat-level snapshots"""
+        query = result.query
+        return [
+            cls(
+                query_time=result.query_time,
+                departure_station=query.departure_station,
+                arrival_station=query.arrival_station,
+                departure_date=query.departure_date,
+                train_number=train.train_number,
+                seat_type=seat.seat_type,
+                price=seat.price,
+                inventory=seat.inventory,
+                bookable=seat.bookable,
+            )
+            for train in result.trains
+            for seat in train.seats
+        ]
+
+
 class AnalysisResult(BaseModel):
     """AI analysis result model"""
 
@@ -98,3 +146,120 @@ class AnalysisResult(BaseModel):
     recommendation: str = Field(description="Booking recommendation")
     raw_data: TicketQueryResult = Field(description="Raw query data")
     analyzed_at: datetime = Field(default_factory=datetime.now, description="Analysis time")
+
+
+class InventoryEventType(str, Enum):
+    """Inventory change event type"""
+
+    APPEARED = "appeared"
+    SOLD_OUT = "sold_out"
+    INVENTORY_DROPPED = "inventory_dropped"
+    PRICE_CHANGED = "price_changed"
+
+
+class InventoryEvent(BaseModel):
+    """Seat inventory change between two polls"""
+
+    model_config = ConfigDict(frozen=True)
+
+    event_type: InventoryEventType = Field(description="Event type")
+    train_number: str = Field(description="Train number")
+    departure_date: str = Field(description="Departure date")
+    seat_type: SeatType = Field(description="Seat type")
+    previous: SeatInfo | None = Field(default=None, description="Seat state at the previous poll")
+    current: SeatInfo = Field(description="Seat state at this poll")
+    detected_at: datetime = Field(default_factory=datetime.now, description="Detection time")
+
+    @property
+    def description(self) -> str:
+        """Human readable event description"""
+        subject = f"{self.train_number} {self.departure_date} {self.seat_type.value}"
+
+        if self.event_type == InventoryEventType.APPEARED:
+            return f"{subject} available ({self.current.inventory_display}, ¥{self.current.price})"
+        if self.event_type == InventoryEventType.SOLD_OUT:
+            return f"{subject} sold out"
+        if self.event_type == InventoryEventType.INVENTORY_DROPPED:
+            previous = self.previous.inventory_display if self.previous else "?"
+            return f"{subject} inventory {previous} -> {self.current.inventory_display}"
+        previous_price = self.previous.price if self.previous else "?"
+        return f"{subject} price ¥{previous_price} -> ¥{self.current.price}"
+
+
+class SweepResult(BaseModel):
+    """Multi-date sweep result model"""
+
+    analyses: list[AnalysisResult] = Field(default_factory=list, description="Per-date analysis results (date order)")
+    failed_dates: list[str] = Field(default_factory=list, description="Dates that could not be fetched")
+    swept_at: datetime = Field(default_factory=datetime.now, description="Sweep time")
+
+    @property
+    def available(self) -> list[AnalysisResult]:
+        """Analyses of dates with tickets available"""
+        return [analysis for analysis in self.analyses if analysis.has_ticket]
+
+    @property
+    def has_ticket(self) -> bool:
+        """Whether any swept date has tickets"""
+        return any(analysis.has_ticket for analysis in self.analyses)
+
+
+class WatchListResult(BaseModel):
+    """Watch list poll result model (analyzed, not yet notified)"""
+
+    analyses: dict[WatchTarget, AnalysisResult] = Field(
+        default_factory=dict, description="Analysis per target that could be fetched"
+    )
+    new_tickets: list[AnalysisResult] = Field(
+        default_factory=list, description="Analyses with tickets that changed since the last notification"
+    )
+    fresh: list[tuple[TicketQueryResult, AnalysisResult]] = Field(
+        default_factory=list, description="New analyses with their results, remembered once notified"
+    )
+
+
+class BurstResult(BaseModel):
+    """Release-window burst polling result model"""
+
+    query: TicketQuery = Field(description="Polled query")
+    release_at: datetime = Field(description="Expected ticket release instant")
+    result: TicketQueryResult | None = Field(default=None, description="Last successful poll result")
+    polls: int = Field(default=0, ge=0, description="Number of polls sent")
+    errors: int = Field(default=0, ge=0, description="Number of failed polls")
+    detected_at: datetime | None = Field(default=None, description="When tickets were first seen")
+
+    @property
+    def detected(self) -> bool:
+        """Whether tickets appeared within the window"""
+        return self.detected_at is not None
+
+    @property
+    def detection_latency(self) -> float | None:
+        """Seconds from the release instant to detection (negative if seen before it)"""
+        if self.detected_at is None:
+            return None
+        return (self.detected_at - self.release_at).total_seconds()
+
+
+class ReleasePrediction(BaseModel):
+    """Learned ticket release time of day for a train"""
+
+    model_config = ConfigDict(frozen=True)
+
+    train_number: str = Field(description="Train number")
+    release_time: time = Field(description="Predicted release time of day")
+    observations: int = Field(ge=1, description="Observed releases the prediction is based on")
+    spread_seconds: float = Field(ge=0, description="Median absolute deviation of the observed releases")
+
+    def at(self, day: date) -> datetime:
+        """Predicted release instant on a given day"""
+        return datetime.combine(day, self.release_time)
+
+
+class JobState(BaseModel):
+    """Persisted run state of a scheduled job"""
+
+    job_id: str = Field(description="Scheduler job ID")
+    last_run_at: datetime | None = Field(default=None, description="Scheduled time of the last finished run")
+    last_status: str | None = Field(default=None, description="Outcome of the last run (success/error)")
+    next_run_at: datetime | None = Field(default=None, description="Next scheduled run time")
@@ -0,0 +1,169 @@
+"""Analysis cache backends (in-memory and SQLite)"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Literal
+
+from loguru import logger
+
+from src.domain.interfaces import IAnalysisCache
+from src.infrastructure.cache import TTLCache
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS analysis_cache (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_analysis_cache_accessed_at ON analysis_cache (accessed_at);
+"""
+
+
+class SQLiteAnalysisCache:
+    """
+    Size-bounded LRU cache with TTL kept in SQLite, surviving restarts
+
+    Same get/set contract as TTLCache, so a scheduler that restarts between
+    polls (or a new --once process) still skips the LLM for a seat state it
+    already analyzed. Expiry uses wall-clock time; the least recently read
+    entries are evicted beyond maxsize.
+    """
+
+    def __init__(self, path: str | Path, ttl: float, maxsize: int = 512) -> None:
+        """
+        Initialize cache
+
+        Args:
+            path: Database file path (parent directories are created)
+            ttl: Entry lifetime in seconds (0 disables caching)
+            maxsize: Maximum number of entries before the least recently used are evicted
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+        with self._connection() as conn:
+            conn.executescript(_SCHEMA)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether entries are kept at all"""
+        return self._ttl > 0
+
+    @property
+    def hits(self) -> int:
+        """Number of lookups served from the cache"""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of lookups not served from the cache"""
+        return self._misses
+
+    def get(self, key: str) -> tuple[str, str] | None:
+        """Return the cached value, or None when missing or expired"""
+        now = time.time()
+        with self._connection() as conn:
+            row = conn.execute("SELECT value, expires_at FROM analysis_cache WHERE key = ?", (key,)).fetchone()
+
+            if row is None or row[1] <= now:
+                if row is not None:
+                    conn.execute("DELETE FROM analysis_cache WHERE key = ?", (key,))
+                self._misses += 1
+                return None
+
+            conn.execute("UPDATE analysis_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            self._hits += 1
+
+        summary, recommendation = json.loads(row[0])
+        return summary, recommendation
+
+    def set(self, key: str, value: tuple[str, str]) -> None:
+        """Store a value, dropping expired entries and evicting the least recently used when full"""
+        if not self.enabled:
+            return
+
+        now = time.time()
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO analysis_cache (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(list(value), ensure_ascii=False), now + self._ttl, now),
+            )
+            conn.execute("DELETE FROM analysis_cache WHERE expires_at <= ?", (now,))
+            conn.execute(
+                "DELETE FROM analysis_cache WHERE key IN ("
+                "SELECT key FROM analysis_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self._maxsize,),
+            )
+
+    def clear(self) -> None:
+        """Remove all entries (counters are kept)"""
+        with self._connection() as conn:
+            conn.execute("DELETE FROM analysis_cache")
+
+    def stats(self) -> dict[str, float]:
+        """Snapshot of cache counters"""
+        lookups = self._hits + self._misses
+        return {
+            "size": len(self),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+        }
+
+    def __len__(self) -> int:
+        with self._connection() as conn:
+            count: int = conn.execute("SELECT COUNT(*) FROM analysis_cache").fetchone()[0]
+        return count
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Serialized connection committed on success and always closed"""
+        with self._lock:
+            conn = sqlite3.connect(self._path, timeout=30)
+            try:
+                with conn:
+                    yield conn
+            finally:
+                conn.close()
+
+
+def open_analysis_cache(
+    backend: Literal["memory", "sqlite"],
+    ttl: float,
+    maxsize: int = 512,
+    path: str = "",
+) -> IAnalysisCache | None:
+    """
+    Open the configured analysis cache
+
+    Args:
+        backend: "memory" (per process) or "sqlite" (on disk at path, shared across restarts)
+        ttl: Entry lifetime in seconds (0 disables the cache)
+        maxsize: Maximum number of cached analyses
+        path: Database file path for the sqlite backend
+
+    Returns:
+        Cache, or None when disabled
+    """
+    if ttl <= 0:
+        return None
+    if backend == "sqlite":
+        if not path:
+            raise ValueError("analysis cache path is required for the sqlite backend")
+        logger.info(f"Caching AI analyses in {path} (ttl={ttl:.0f}s, max {maxsize})")
+        return SQLiteAnalysisCache(path, ttl=ttl, maxsize=maxsize)
+    return TTLCache(ttl=ttl, maxsize=maxsize)
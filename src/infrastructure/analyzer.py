@@ -1,11 +1,18 @@
 """DeepSeek AI analyzer implementation"""
 
+import bisect
+import hashlib
+import json
+
 from loguru import logger
-from openai import OpenAI
+from openai import APIConnectionError, OpenAI
 
 from src.domain.exceptions import AnalyzerException
-from src.domain.interfaces import ITicketAnalyzer
-from src.domain.models import AnalysisResult, SeatType, TicketQueryResult
+from src.domain.interfaces import IAnalysisCache, ITicketAnalyzer
+from src.domain.models import AnalysisResult, SeatType, TicketQueryResult, TrainInfo
+
+# Inventory bucket = number of bounds <= inventory: sold out, 1-4, 5-19, 20-98, sufficient (99)
+_INVENTORY_BUCKETS = (1, 5, 20, 99)
 
 
 class DeepSeekAnalyzer(ITicketAnalyzer):
@@ -16,6 +23,7 @@ class DeepSeekAnalyzer(ITicketAnalyzer):
         api_key: str,
         base_url: str = "https://api.deepseek.com",
         model: str = "deepseek-chat",
+        analysis_cache: IAnalysisCache | None = None,
     ) -> None:
         """
         Initialize analyzer
@@ -24,9 +32,23 @@ class DeepSeekAnalyzer(ITicketAnalyzer):
             api_key: DeepSeek API key
             base_url: API base URL
             model: Model name
+            analysis_cache: Reuses AI answers while a train's seat state is unchanged
         """
         self._client = OpenAI(api_key=api_key, base_url=base_url)
         self._model = model
+        self._analysis_cache = analysis_cache
+        # Set when the last API call could not connect (the client's HTTP pool is then suspect)
+        self._connection_failed = False
+        self._closed = False
+
+    def healthy(self) -> bool:
+        """Whether the client is open and its last API call could connect"""
+        return not self._closed and not self._connection_failed
+
+    def close(self) -> None:
+        """Close the client's HTTP connection pool"""
+        self._closed = True
+        self._client.close()
 
     def analyze(self, result: TicketQueryResult) -> AnalysisResult:
         """Analyze ticket data"""
@@ -77,6 +99,14 @@ class DeepSeekAnalyzer(ITicketAnalyzer):
         """Generate analysis and recommendations using AI"""
         train = result.trains[0]
 
+        cache = self._analysis_cache
+        cache_key = self._cache_key(train) if cache is not None else None
+        if cache is not None and cache_key is not None:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Seat state of {train.train_number} already analyzed, reusing cached AI analysis")
+                return cached
+
         # Build prompt
         prompt = self._build_prompt(train)
 
@@ -95,6 +125,7 @@ class DeepSeekAnalyzer(ITicketAnalyzer):
                 max_tokens=500,
             )
 
+            self._connection_failed = False
             content = response.choices[0].message.content or ""
 
             # Simple split of summary and recommendation
@@ -102,12 +133,47 @@ class DeepSeekAnalyzer(ITicketAnalyzer):
             summary = parts[0].strip()
             recommendation = parts[1].strip() if len(parts) > 1 else "Recommend booking as soon as possible."
 
+            # Fallback answers are not cached, so the API is retried on the next poll
+            if cache is not None and cache_key is not None:
+                cache.set(cache_key, (summary, recommendation))
+
             return summary, recommendation
 
         except Exception as e:
+            self._connection_failed = isinstance(e, APIConnectionError)
             logger.warning(f"AI analysis failed, using fallback: {e}")
             return self._fallback_analysis(train)
 
+    def _cache_key(self, train: TrainInfo) -> str:
+        """
+        Canonical hash of the prompt inputs
+
+        Seats are sorted and inventories reduced to buckets, so polls that only
+        differ in seat order or by a ticket or two reuse one analysis.
+        """
+        state = {
+            "model": self._model,
+            "train": [
+                train.train_number,
+                train.departure_station,
+                train.arrival_station,
+                train.departure_time,
+                train.arrival_time,
+                train.duration,
+            ],
+            "seats": sorted(
+                [
+                    seat.seat_type.value,
+                    seat.price,
+                    bisect.bisect_right(_INVENTORY_BUCKETS, seat.inventory),
+                    seat.bookable,
+                ]
+                for seat in train.seats
+            ),
+        }
+        canonical = json.dumps(state, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+        return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
     def _build_prompt(self, train) -> str:
         """Build AI prompt"""
         seat_info = "\n".join(
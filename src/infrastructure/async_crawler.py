@@ -0,0 +1,250 @@
+"""Async Ctrip ticket crawler implementation"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Collection, MutableMapping
+from urllib.parse import urlencode
+
+import httpx
+from loguru import logger
+
+from src.domain.exceptions import CrawlerException
+from src.domain.interfaces import IAsyncTicketCrawler
+from src.domain.models import TicketQuery, TicketQueryResult
+from src.infrastructure.cache import TTLCache
+from src.infrastructure.crawler import CtripPageParser, NextDataStreamScanner
+from src.infrastructure.latency import LatencyTracker
+from src.infrastructure.rate_limiter import AdaptiveRateLimiter
+from src.infrastructure.singleflight import SingleFlight
+
+
+class AsyncCtripTicketCrawler(CtripPageParser, IAsyncTicketCrawler):
+    """Async Ctrip train ticket crawler with bounded concurrent fetches"""
+
+    def __init__(
+        self,
+        timeout: float = 10,
+        max_concurrency: int = 8,
+        stream: bool = False,
+        detect_unchanged: bool = True,
+        response_cache: TTLCache[str | bytes] | None = None,
+        single_flight: SingleFlight[str | bytes] | None = None,
+        rate_limiter: AdaptiveRateLimiter | None = None,
+        hedge_percentile: float | None = None,
+        latency_tracker: LatencyTracker | None = None,
+        last_results: MutableMapping[tuple, tuple[str, TicketQueryResult]] | None = None,
+    ) -> None:
+        """
+        Initialize async crawler
+
+        Args:
+            timeout: Per-request timeout in seconds
+            max_concurrency: Maximum number of requests in flight at once
+            stream: Read the body in chunks and stop once __NEXT_DATA__ is complete
+            detect_unchanged: Reuse the last result when a poll returns an identical train payload
+            response_cache: Page cache shared by crawlers watching the same route/date
+            single_flight: Coalesces identical in-flight page requests across crawlers
+            rate_limiter: Adaptive limiter for requests to the Ctrip host
+            hedge_percentile: Send a second request once the first is slower than this
+                latency percentile (None or 0 disables hedging)
+            latency_tracker: Latency samples per host, shared between crawlers
+            last_results: Last (payload fingerprint, result) per poll target; pass one shared
+                mapping so a crawler built for the next run still detects an unchanged payload
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        super().__init__(
+            detect_unchanged=detect_unchanged,
+            response_cache=response_cache,
+            single_flight=single_flight,
+            rate_limiter=rate_limiter,
+            hedge_percentile=hedge_percentile,
+            latency_tracker=latency_tracker,
+            last_results=last_results,
+        )
+
+        self._timeout = timeout
+        self._max_concurrency = max_concurrency
+        self._stream = stream
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._client = httpx.AsyncClient(
+            headers=self.DEFAULT_HEADERS,
+            timeout=httpx.Timeout(timeout),
+            limits=httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency),
+            follow_redirects=True,
+        )
+
+    async def __aenter__(self) -> "AsyncCtripTicketCrawler":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client"""
+        await self._client.aclose()
+
+    async def warm_up(self) -> bool:
+        """
+        Prepare connections ahead of a scheduled run
+
+        Returns:
+            Whether warm-up succeeded (failures are logged, never raised)
+        """
+        start = time.perf_counter()
+
+        try:
+            response = await asyncio.wait_for(self._client.get(self._origin()), timeout=self._timeout)
+            await response.aread()
+
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            logger.info(f"Async crawler warmed up in {elapsed_ms:.0f}ms ({len(self._client.cookies)} cookie(s))")
+            return True
+
+        except Exception as e:
+            logger.warning(f"Async crawler warm-up failed: {e}")
+            return False
+
+    async def fetch_tickets(
+        self,
+        query: TicketQuery,
+        train_numbers: Collection[str] | None = None,
+    ) -> TicketQueryResult:
+        """Fetch ticket information"""
+        logger.info(f"Fetching tickets: {query.departure_station} -> {query.arrival_station} on {query.departure_date}")
+
+        try:
+            html_content = await self._fetch_html(query)
+            return self._build_result(query, html_content, train_numbers)
+
+        except Exception as e:
+            logger.error(f"Crawler failed: {e}")
+            raise CrawlerException(f"Failed to fetch tickets: {e}") from e
+
+    async def fetch_many(
+        self,
+        queries: list[TicketQuery],
+        return_exceptions: bool = False,
+    ) -> list[TicketQueryResult | CrawlerException]:
+        """Fetch ticket information for several queries concurrently"""
+        logger.info(f"Fetching {len(queries)} queries (max_concurrency={self._max_concurrency})")
+
+        results = await asyncio.gather(
+            *(self.fetch_tickets(query) for query in queries),
+            return_exceptions=return_exceptions,
+        )
+
+        # fetch_tickets wraps every failure in CrawlerException; anything else (cancellation) propagates
+        outcomes: list[TicketQueryResult | CrawlerException] = []
+        for result in results:
+            if not isinstance(result, TicketQueryResult | CrawlerException):
+                raise result
+            outcomes.append(result)
+        return outcomes
+
+    async def _fetch_html(self, query: TicketQuery) -> str | bytes:
+        """Fetch HTML page (served from the response cache, coalesced with identical in-flight requests)"""
+        cached = self._get_cached_page(query)
+        if cached is not None:
+            return cached
+
+        if self._single_flight is None:
+            return await self._fetch_uncached(query)
+
+        return await self._single_flight.do_async(self._page_key(query), lambda: self._fetch_uncached(query))
+
+    async def _fetch_uncached(self, query: TicketQuery) -> str | bytes:
+        """Fetch the page from Ctrip (bounded by the concurrency limit) and share it through the response cache"""
+        params = self._build_params(query)
+
+        logger.info(f"Fetching URL: {self.BASE_URL}?{urlencode(params)}")
+
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire_async()
+
+        try:
+            async with self._semaphore:
+                # wait_for bounds the whole request, including time spent in the connection pool queue
+                fetch = self._fetch_streaming if self._stream else self._fetch_page
+                html = await asyncio.wait_for(self._fetch_hedged(lambda: fetch(params)), timeout=self._timeout)
+        except BaseException as e:
+            self._release_rate_limit(error=e)
+            raise
+
+        self._release_rate_limit(html)
+        self._cache_page(query, html)
+
+        return html
+
+    async def _fetch_hedged(self, fetch: Callable[[], Awaitable[str | bytes]]) -> str | bytes:
+        """
+        Run fetch, sending an identical second request if the first is slow
+
+        Once the first request has taken longer than the hedge percentile of recent
+        latency, a hedge is started; whichever succeeds first wins and the other is cancelled.
+        The hedge takes its own rate limit token and is skipped when none is free.
+        """
+        delay = self._hedge_delay()
+        if delay is None:
+            return await self._timed(fetch)
+
+        tasks = [asyncio.ensure_future(self._timed(fetch))]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done:
+                return tasks[0].result()
+
+            if not self._acquire_hedge_slot():
+                return await tasks[0]
+
+            self._hedges += 1
+            logger.info(f"No response after {delay * 1000:.0f}ms, sending hedged request")
+            hedge = asyncio.ensure_future(self._timed(fetch))
+            hedge.add_done_callback(self._release_hedge)
+            tasks.append(hedge)
+
+            pending = set(tasks)
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next((task for task in done if task.exception() is None), None)
+                if winner is not None or not pending:
+                    # Both failed: re-raise the last error
+                    return (winner or done.pop()).result()
+
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _timed(self, fetch: Callable[[], Awaitable[str | bytes]]) -> str | bytes:
+        """Await fetch and record its latency on success, timeout or cancellation"""
+        start = time.perf_counter()
+        try:
+            html = await fetch()
+        except (asyncio.CancelledError, TimeoutError, httpx.TimeoutException):
+            # A request cut off by the timeout or a hedge ran at least this long; dropping it biases the percentiles low
+            self._record_latency(time.perf_counter() - start)
+            raise
+        self._record_latency(time.perf_counter() - start)
+        return html
+
+    async def _fetch_page(self, params: dict[str, str]) -> str:
+        """Fetch the whole page body"""
+        response = await self._client.get(self.BASE_URL, params=params)
+        response.raise_for_status()
+
+        return response.text
+
+    async def _fetch_streaming(self, params: dict[str, str]) -> bytes:
+        """Fetch page body in chunks, ending the transfer once __NEXT_DATA__ is complete"""
+        scanner = NextDataStreamScanner()
+
+        async with self._client.stream("GET", self.BASE_URL, params=params) as response:
+            response.raise_for_status()
+
+            async for chunk in response.aiter_bytes():
+                if scanner.feed(chunk):
+                    logger.debug(f"__NEXT_DATA__ complete after {len(scanner.data)} bytes, closing stream")
+                    break
+
+        return scanner.data
@@ -0,0 +1,93 @@
+"""In-process TTL cache implementation"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Generic, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """Thread-safe, size-bounded LRU cache with per-entry TTL and hit/miss counters"""
+
+    def __init__(self, ttl: float, maxsize: int = 128) -> None:
+        """
+        Initialize cache
+
+        Args:
+            ttl: Entry lifetime in seconds (0 disables caching)
+            maxsize: Maximum number of entries before the least recently used is evicted
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._entries: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether entries are kept at all"""
+        return self._ttl > 0
+
+    @property
+    def hits(self) -> int:
+        """Number of lookups served from the cache"""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of lookups not served from the cache"""
+        return self._misses
+
+    def get(self, key: Hashable) -> V | None:
+        """Return the cached value, or None when missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: V) -> None:
+        """Store a value, evicting the least recently used entry when full"""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, float]:
+        """Snapshot of cache counters"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
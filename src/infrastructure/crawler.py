@@ -1,5 +1,18 @@
 """Ctrip ticket crawler implementation"""
 
+import asyncio
+import hashlib
+import json
+import socket
+import threading
+import time
+from collections.abc import Callable, Collection, MutableMapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from datetime import datetime
+from typing import Any, AnyStr, ClassVar
+from urllib.parse import urlparse
+
 import requests
 from bs4 import BeautifulSoup
 from loguru import logger
@@ -7,59 +20,236 @@ from loguru import logger
 from src.domain.exceptions import CrawlerException
 from src.domain.interfaces import ITicketCrawler
 from src.domain.models import SeatInfo, SeatType, TicketQuery, TicketQueryResult, TrainInfo
+from src.infrastructure.cache import TTLCache
+from src.infrastructure.latency import LatencyTracker
+from src.infrastructure.rate_limiter import AdaptiveRateLimiter, RequestOutcome
+from src.infrastructure.singleflight import SingleFlight
+
+NEXT_DATA_ID = "__NEXT_DATA__"
+TRAIN_LIST_KEYS = ("trainInfoList", "trainList")
+_NEXT_DATA_MARKER = f'id="{NEXT_DATA_ID}"'
+
+
+def _slice_next_data(
+    html: AnyStr, marker: AnyStr, tag_open: AnyStr, tag_end: AnyStr, tag_close: AnyStr
+) -> AnyStr | None:
+    """Content of the <script> tag carrying marker, or None (html and the tokens share one type)"""
+    marker_pos = html.find(marker)
+    if marker_pos == -1:
+        return None
 
+    # The id attribute must belong to an opening <script ...> tag
+    tag_start = html.rfind(tag_open, 0, marker_pos)
+    if tag_start == -1 or html.find(tag_end, tag_start, marker_pos) != -1:
+        return None
 
-class CtripTicketCrawler(ITicketCrawler):
-    """Ctrip train ticket crawler implementation"""
+    content_start = html.find(tag_end, marker_pos)
+    if content_start == -1:
+        return None
+    content_end = html.find(tag_close, content_start)
+    if content_end == -1:
+        return None
 
-    BASE_URL = "https://trains.ctrip.com/webapp/train/list"
+    payload = html[content_start + 1 : content_end].strip()
+    return payload or None
+
+
+class NextDataStreamScanner:
+    """Incrementally detects when a streamed page contains the complete __NEXT_DATA__ script"""
 
-    def __init__(self, timeout: int = 10) -> None:
+    _MARKER = _NEXT_DATA_MARKER.encode()
+    _CLOSE = b"</script>"
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._marker_pos = -1
+        self._scanned = 0
+        self.complete = False
+
+    @property
+    def data(self) -> bytes:
+        """Bytes received so far"""
+        return bytes(self._buffer)
+
+    def feed(self, chunk: bytes) -> bool:
         """
-        Initialize crawler
+        Append a chunk and check for the closing script tag
 
         Args:
-            timeout: Request timeout in seconds
+            chunk: Next chunk of the response body
+
+        Returns:
+            Whether the __NEXT_DATA__ script block is complete
         """
-        self._timeout = timeout
-        self._session = requests.Session()
-        self._session.headers.update(
-            {
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0.0.0 Safari/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-                "Referer": "https://www.ctrip.com/",
-            }
-        )
+        if self.complete:
+            return True
 
-    def fetch_tickets(self, query: TicketQuery) -> TicketQueryResult:
-        """Fetch ticket information"""
-        logger.info(f"Fetching tickets: {query.departure_station} -> {query.arrival_station} on {query.departure_date}")
+        self._buffer += chunk
 
-        try:
-            html_content = self._fetch_html(query)
-            trains = self._parse_trains(html_content)
+        # Only rescan the tail that could hold a match split across chunks
+        if self._marker_pos == -1:
+            self._marker_pos = self._buffer.find(self._MARKER, max(0, self._scanned - len(self._MARKER)))
+            if self._marker_pos == -1:
+                self._scanned = len(self._buffer)
+                return False
+            self._scanned = self._marker_pos
 
-            # If train number is specified, only return that train
-            if query.train_number:
-                trains = [t for t in trains if t.train_number == query.train_number]
+        start = max(self._marker_pos, self._scanned - len(self._CLOSE))
+        self.complete = self._buffer.find(self._CLOSE, start) != -1
+        self._scanned = len(self._buffer)
 
-            logger.info(f"Found {len(trains)} trains")
+        return self.complete
 
-            return TicketQueryResult(
-                query=query,
-                trains=trains,
-            )
 
-        except Exception as e:
-            logger.error(f"Crawler failed: {e}")
-            raise CrawlerException(f"Failed to fetch tickets: {e}") from e
+class CtripPageParser:
+    """Shared Ctrip list page request building and parsing (used by sync and async crawlers)"""
+
+    BASE_URL = "https://trains.ctrip.com/webapp/train/list"
+
+    DEFAULT_HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
+        "Referer": "https://www.ctrip.com/",
+    }
+
+    # Key path where the train list was last found; pages rarely change layout between polls.
+    # Shared by every crawler (sync and async) in the process, so per-run crawler instances
+    # start from the path learned by earlier runs
+    _train_list_path: ClassVar[tuple[str | int, ...] | None] = None
+
+    def __init__(
+        self,
+        detect_unchanged: bool = True,
+        response_cache: TTLCache[str | bytes] | None = None,
+        single_flight: SingleFlight[str | bytes] | None = None,
+        rate_limiter: AdaptiveRateLimiter | None = None,
+        hedge_percentile: float | None = None,
+        latency_tracker: LatencyTracker | None = None,
+        last_results: MutableMapping[tuple, tuple[str, TicketQueryResult]] | None = None,
+    ) -> None:
+        """
+        Initialize parser state
+
+        Args:
+            detect_unchanged: Reuse the last result when a poll returns an identical train payload
+            response_cache: Page cache shared by crawlers watching the same route/date
+            single_flight: Coalesces identical in-flight page requests across crawlers
+            rate_limiter: Adaptive limiter for requests to the Ctrip host
+            hedge_percentile: Send a second request once the first is slower than this
+                latency percentile (None or 0 disables hedging)
+            latency_tracker: Latency samples per host, shared between crawlers
+            last_results: Last (payload fingerprint, result) per poll target; pass one shared
+                mapping so a crawler built for the next run still detects an unchanged payload
+        """
+        self._detect_unchanged = detect_unchanged
+        self._response_cache = response_cache
+        self._single_flight = single_flight
+        self._rate_limiter = rate_limiter
+        self._hedge_percentile = hedge_percentile or None
+        if latency_tracker is None and self._hedge_percentile is not None:
+            latency_tracker = LatencyTracker()
+        self._latency_tracker = latency_tracker
+        self._hedges = 0
+        # Last (fingerprint, result) per poll target
+        self._last_results = last_results if last_results is not None else {}
+
+    def _origin(self) -> str:
+        """Scheme and host of the list page, used for connection warm-up"""
+        parsed = urlparse(self.BASE_URL)
+        return f"{parsed.scheme}://{parsed.netloc}/"
+
+    @property
+    def hedges(self) -> int:
+        """Number of hedged (duplicate) requests sent"""
+        return self._hedges
+
+    def _host(self) -> str:
+        """Host of the list page, used as the latency tracking key"""
+        return urlparse(self.BASE_URL).hostname or ""
+
+    def _hedge_delay(self) -> float | None:
+        """Seconds to wait before hedging, or None when hedging is off or latency is not known yet"""
+        if self._hedge_percentile is None or self._latency_tracker is None:
+            return None
+        return self._latency_tracker.percentile(self._host(), self._hedge_percentile)
+
+    def _acquire_hedge_slot(self) -> bool:
+        """Take a rate limit token for a hedged request without waiting (False: do not hedge)"""
+        if self._rate_limiter is None or self._rate_limiter.try_acquire():
+            return True
+        logger.info("No rate limit token free, not sending a hedged request")
+        return False
+
+    def _release_hedge(self, future: "Future[str | bytes] | asyncio.Future[str | bytes]") -> None:
+        """Return a finished hedged request's rate limit slot (also when it was cancelled before it ran)"""
+        if future.cancelled():
+            if self._rate_limiter is not None:
+                self._rate_limiter.release(RequestOutcome.CANCELLED)
+        elif (error := future.exception()) is not None:
+            self._release_rate_limit(error=error)
+        else:
+            self._release_rate_limit(future.result())
+
+    def _record_latency(self, seconds: float) -> None:
+        """Record a request latency"""
+        if self._latency_tracker is not None:
+            self._latency_tracker.record(self._host(), seconds)
+
+    @staticmethod
+    def _page_key(query: TicketQuery) -> tuple[str, str, str]:
+        """Normalized list page key (train number does not change the page)"""
+        return (
+            query.departure_station.strip(),
+            query.arrival_station.strip(),
+            query.departure_date,
+        )
+
+    def _get_cached_page(self, query: TicketQuery) -> str | bytes | None:
+        """Return a fresh cached page for the query, if any"""
+        if self._response_cache is None:
+            return None
 
-    def _fetch_html(self, query: TicketQuery) -> str:
-        """Fetch HTML page"""
-        params = {
+        html = self._response_cache.get(self._page_key(query))
+        if html is not None:
+            logger.info(f"Response cache hit for {query.departure_station} -> {query.arrival_station}")
+        return html
+
+    def _cache_page(self, query: TicketQuery, html: str | bytes) -> None:
+        """Cache a page for other watchers of the same route/date (only real list pages)"""
+        if self._response_cache is None:
+            return
+
+        if self._has_next_data(html):
+            self._response_cache.set(self._page_key(query), html)
+
+    @staticmethod
+    def _has_next_data(html: str | bytes) -> bool:
+        """Whether the page carries the __NEXT_DATA__ payload (block pages do not)"""
+        if isinstance(html, bytes):
+            return NEXT_DATA_ID.encode() in html
+        return NEXT_DATA_ID in html
+
+    def _release_rate_limit(self, html: str | bytes | None = None, error: BaseException | None = None) -> None:
+        """Report a finished request to the rate limiter"""
+        if self._rate_limiter is None:
+            return
+
+        if error is not None:
+            status = getattr(getattr(error, "response", None), "status_code", None)
+            throttled = isinstance(status, int) and (status == 429 or status >= 500)
+            outcome = RequestOutcome.THROTTLED if throttled else RequestOutcome.ERROR
+        else:
+            # An empty page is how Ctrip usually answers when it starts blocking
+            outcome = RequestOutcome.SUCCESS if html and self._has_next_data(html) else RequestOutcome.THROTTLED
+
+        self._rate_limiter.release(outcome)
+
+    def _build_params(self, query: TicketQuery) -> dict[str, str]:
+        """Build list page query parameters"""
+        return {
             "ticketType": "0",
             "dStation": query.departure_station,
             "aStation": query.arrival_station,
@@ -70,64 +260,199 @@ class CtripTicketCrawler(ITicketCrawler):
             "highSpeedOnly": "1",
         }
 
-        # Build complete URL for logging
-        from urllib.parse import urlencode
+    def _build_result(
+        self,
+        query: TicketQuery,
+        html: str | bytes,
+        train_numbers: Collection[str] | None = None,
+    ) -> TicketQueryResult:
+        """Parse page and build query result (reusing the last result when the payload is unchanged)"""
+        # If train number is specified, only build models for that train
+        if train_numbers is None and query.train_number:
+            train_numbers = (query.train_number,)
+
+        raw_trains = self._extract_train_data(html, train_numbers)
+
+        key = self._result_key(query, train_numbers)
+        fingerprint = self._fingerprint(raw_trains) if self._detect_unchanged else None
+        if fingerprint is not None:
+            previous = self._last_results.get(key)
+            if previous is not None and previous[0] == fingerprint:
+                logger.info("Train payload unchanged since last poll, reusing cached result")
+                return previous[1].model_copy(update={"unchanged": True, "query_time": datetime.now()})
+
+        trains = self._parse_raw_trains(raw_trains)
+
+        logger.info(f"Found {len(trains)} trains")
+
+        result = TicketQueryResult(
+            query=query,
+            trains=trains,
+        )
+        if fingerprint is not None:
+            self._last_results[key] = (fingerprint, result)
+
+        return result
+
+    @staticmethod
+    def _result_key(query: TicketQuery, train_numbers: Collection[str] | None) -> tuple:
+        """Key identifying one (route, date, train filter) poll target"""
+        return (
+            query.departure_station,
+            query.arrival_station,
+            query.departure_date,
+            frozenset(train_numbers) if train_numbers is not None else None,
+        )
 
-        full_url = f"{self.BASE_URL}?{urlencode(params)}"
-        logger.info(f"Fetching URL: {full_url}")
+    @staticmethod
+    def _fingerprint(raw_trains: list[dict]) -> str:
+        """Stable hash of the raw train payload"""
+        canonical = json.dumps(raw_trains, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
 
-        response = self._session.get(
-            self.BASE_URL,
-            params=params,
-            timeout=self._timeout,
-        )
-        response.raise_for_status()
+    def _parse_trains(self, html: str | bytes, train_numbers: Collection[str] | None = None) -> list[TrainInfo]:
+        """
+        Parse train list
 
-        return response.text
+        Args:
+            html: Raw page text or bytes
+            train_numbers: Only validate trains with these numbers (all trains when None)
 
-    def _parse_trains(self, html: str) -> list[TrainInfo]:
-        """Parse train list"""
-        import json
+        Returns:
+            Parsed trains
+        """
+        return self._parse_raw_trains(self._extract_train_data(html, train_numbers))
+
+    def _extract_train_data(self, html: str | bytes, train_numbers: Collection[str] | None = None) -> list[dict]:
+        """Extract raw train dicts from the page, filtered on the raw train number"""
+        data = self._load_next_data(html)
+        if data is None:
+            return []
+
+        # Find trainList
+        train_list = self._locate_train_list(data)
+        if not train_list:
+            return []
+
+        wanted = frozenset(train_numbers) if train_numbers is not None else None
+
+        # Check the raw train number before paying for model validation
+        return [
+            train_data
+            for train_data in train_list
+            if wanted is None or (isinstance(train_data, dict) and train_data.get("trainNumber") in wanted)
+        ]
+
+    def _parse_raw_trains(self, raw_trains: list[dict]) -> list[TrainInfo]:
+        """Validate raw train dicts into models"""
+        try:
+            return [self._parse_train(train_data) for train_data in raw_trains]
+        except KeyError as e:
+            logger.warning(f"Failed to parse __NEXT_DATA__: {e}")
+            return []
+
+    def _load_next_data(self, html: str | bytes) -> Any | None:
+        """Decode the __NEXT_DATA__ JSON, scanning the raw page first and falling back to BeautifulSoup"""
+        payload = self._extract_next_data(html)
+        if payload is not None:
+            try:
+                return json.loads(payload)
+            except json.JSONDecodeError as e:
+                logger.debug(f"Fast __NEXT_DATA__ scan failed, falling back to DOM parse: {e}")
+
+        # Without the id anywhere in the page a DOM parse cannot find the script either
+        has_id = NEXT_DATA_ID.encode() in html if isinstance(html, bytes) else NEXT_DATA_ID in html
+        if not has_id:
+            return None
 
         soup = BeautifulSoup(html, "lxml")
 
         # Find script tag with id="__NEXT_DATA__"
-        next_data_script = soup.find("script", id="__NEXT_DATA__", type="application/json")
+        next_data_script = soup.find("script", id=NEXT_DATA_ID, type="application/json")
 
         if next_data_script and next_data_script.string:
             try:
-                data = json.loads(next_data_script.string)
-                # Find trainList
-                train_list = self._find_train_list(data)
-                if train_list:
-                    return [self._parse_train(train_data) for train_data in train_list]
-            except (json.JSONDecodeError, KeyError) as e:
+                return json.loads(next_data_script.string)
+            except json.JSONDecodeError as e:
                 logger.warning(f"Failed to parse __NEXT_DATA__: {e}")
 
-        return []
+        return None
 
-    def _find_train_list(self, obj: any, depth: int = 0) -> list | None:
+    def _extract_next_data(self, html: str | bytes) -> str | bytes | None:
+        """
+        Slice the __NEXT_DATA__ JSON payload out of the raw page without building a DOM
+
+        Args:
+            html: Raw page text or bytes
+
+        Returns:
+            JSON payload (same type as html), or None when the script block is not found
+        """
+        if isinstance(html, bytes):
+            return _slice_next_data(html, _NEXT_DATA_MARKER.encode(), b"<script", b">", b"</script>")
+        return _slice_next_data(html, _NEXT_DATA_MARKER, "<script", ">", "</script>")
+
+    def _locate_train_list(self, data: Any) -> list | None:
+        """Find the train list, trying the last learned key path before a full search"""
+        if self._train_list_path is not None:
+            train_list = self._follow_path(data, self._train_list_path)
+            if train_list is not None:
+                return train_list
+            logger.debug(f"Train list not at learned path {self._train_list_path}, searching page")
+
+        found = self._find_train_list_path(data)
+        if found is None:
+            return None
+
+        train_list, path = found
+        if train_list and path != self._train_list_path:
+            logger.info(f"Learned train list path: {'.'.join(map(str, path))}")
+            CtripPageParser._train_list_path = path
+
+        return train_list
+
+    @staticmethod
+    def _follow_path(data: Any, path: tuple[str | int, ...]) -> list | None:
+        """Follow a key path into decoded JSON, returning the list at its end"""
+        node = data
+        for key in path:
+            if isinstance(key, int):
+                if not isinstance(node, list) or key >= len(node):
+                    return None
+            elif not isinstance(node, dict) or key not in node:
+                return None
+            node = node[key]
+
+        return node if isinstance(node, list) else None
+
+    def _find_train_list(self, obj: Any, depth: int = 0) -> list | None:
         """Recursively find trainInfoList or trainList"""
+        found = self._find_train_list_path(obj, depth)
+        return found[0] if found else None
+
+    def _find_train_list_path(
+        self, obj: Any, depth: int = 0, path: tuple[str | int, ...] = ()
+    ) -> tuple[list, tuple[str | int, ...]] | None:
+        """Recursively find trainInfoList or trainList, returning the list and its key path"""
         if depth > 10:  # Prevent recursion too deep
             return None
 
         if isinstance(obj, dict):
             # Find trainInfoList or trainList keys
-            if "trainInfoList" in obj and isinstance(obj["trainInfoList"], list):
-                return obj["trainInfoList"]
-            if "trainList" in obj and isinstance(obj["trainList"], list):
-                return obj["trainList"]
+            for key in TRAIN_LIST_KEYS:
+                if key in obj and isinstance(obj[key], list):
+                    return obj[key], (*path, key)
 
             # Recursive search
-            for value in obj.values():
-                result = self._find_train_list(value, depth + 1)
-                if result:
+            for key, value in obj.items():
+                result = self._find_train_list_path(value, depth + 1, (*path, key))
+                if result and result[0]:
                     return result
 
         elif isinstance(obj, list):
-            for item in obj:
-                result = self._find_train_list(item, depth + 1)
-                if result:
+            for index, item in enumerate(obj):
+                result = self._find_train_list_path(item, depth + 1, (*path, index))
+                if result and result[0]:
                     return result
 
         return None
@@ -166,3 +491,242 @@ class CtripTicketCrawler(ITicketCrawler):
             inventory=data["seatInventory"],
             bookable=data["seatBookable"],
         )
+
+
+class CtripTicketCrawler(CtripPageParser, ITicketCrawler):
+    """Ctrip train ticket crawler implementation"""
+
+    # Created on first hedge and shared, since per-run crawlers are never closed
+    _hedge_executor: ClassVar[ThreadPoolExecutor | None] = None
+    _hedge_executor_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self,
+        timeout: int = 10,
+        stream: bool = False,
+        chunk_size: int = 16384,
+        detect_unchanged: bool = True,
+        response_cache: TTLCache[str | bytes] | None = None,
+        single_flight: SingleFlight[str | bytes] | None = None,
+        rate_limiter: AdaptiveRateLimiter | None = None,
+        hedge_percentile: float | None = None,
+        latency_tracker: LatencyTracker | None = None,
+        last_results: MutableMapping[tuple, tuple[str, TicketQueryResult]] | None = None,
+    ) -> None:
+        """
+        Initialize crawler
+
+        Args:
+            timeout: Request timeout in seconds
+            stream: Read the body in chunks and stop once __NEXT_DATA__ is complete
+            chunk_size: Chunk size in bytes for streaming reads
+            detect_unchanged: Reuse the last result when a poll returns an identical train payload
+            response_cache: Page cache shared by crawlers watching the same route/date
+            single_flight: Coalesces identical in-flight page requests across crawlers
+            rate_limiter: Adaptive limiter for requests to the Ctrip host
+            hedge_percentile: Send a second request once the first is slower than this
+                latency percentile (None or 0 disables hedging)
+            latency_tracker: Latency samples per host, shared between crawlers
+            last_results: Last (payload fingerprint, result) per poll target; pass one shared
+                mapping so a crawler built for the next run still detects an unchanged payload
+        """
+        super().__init__(
+            detect_unchanged=detect_unchanged,
+            response_cache=response_cache,
+            single_flight=single_flight,
+            rate_limiter=rate_limiter,
+            hedge_percentile=hedge_percentile,
+            latency_tracker=latency_tracker,
+            last_results=last_results,
+        )
+        self._timeout = timeout
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._session = requests.Session()
+        self._session.headers.update(self.DEFAULT_HEADERS)
+        # Set when the last request could not connect (stale pool, dropped TLS session)
+        self._connection_failed = False
+        self._closed = False
+
+    def warm_up(self) -> bool:
+        """
+        Prepare connections ahead of a scheduled run
+
+        Resolves DNS, opens a pooled keep-alive connection to the Ctrip host and
+        collects its cookies, so the first real request skips the handshakes.
+
+        Returns:
+            Whether warm-up succeeded (failures are logged, never raised)
+        """
+        origin = self._origin()
+        host = urlparse(origin).hostname or ""
+        start = time.perf_counter()
+
+        try:
+            socket.getaddrinfo(host, 443, proto=socket.IPPROTO_TCP)
+
+            response = self._session.get(origin, timeout=self._timeout)
+            # Reading the body returns the connection to the pool for reuse
+            _ = response.content
+
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            logger.info(f"Crawler warmed up in {elapsed_ms:.0f}ms ({len(self._session.cookies)} cookie(s))")
+            return True
+
+        except Exception as e:
+            self._connection_failed = isinstance(e, requests.ConnectionError)
+            logger.warning(f"Crawler warm-up failed: {e}")
+            return False
+
+    def healthy(self) -> bool:
+        """Whether the session is open and its last request could connect"""
+        return not self._closed and not self._connection_failed
+
+    def close(self) -> None:
+        """Close the session's pooled connections"""
+        self._closed = True
+        self._session.close()
+
+    @classmethod
+    def _hedge_pool(cls) -> ThreadPoolExecutor:
+        """Threads running the original and the hedged request side by side, shared by all crawlers"""
+        with cls._hedge_executor_lock:
+            if cls._hedge_executor is None:
+                cls._hedge_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="crawler-hedge")
+            return cls._hedge_executor
+
+    def fetch_tickets(
+        self,
+        query: TicketQuery,
+        train_numbers: Collection[str] | None = None,
+    ) -> TicketQueryResult:
+        """Fetch ticket information"""
+        logger.info(f"Fetching tickets: {query.departure_station} -> {query.arrival_station} on {query.departure_date}")
+
+        try:
+            html_content = self._fetch_html(query)
+            return self._build_result(query, html_content, train_numbers)
+
+        except Exception as e:
+            logger.error(f"Crawler failed: {e}")
+            raise CrawlerException(f"Failed to fetch tickets: {e}") from e
+
+    def _fetch_html(self, query: TicketQuery) -> str | bytes:
+        """Fetch HTML page (served from the response cache, coalesced with identical in-flight requests)"""
+        cached = self._get_cached_page(query)
+        if cached is not None:
+            return cached
+
+        if self._single_flight is None:
+            return self._fetch_uncached(query)
+
+        return self._single_flight.do(self._page_key(query), lambda: self._fetch_uncached(query))
+
+    def _fetch_uncached(self, query: TicketQuery) -> str | bytes:
+        """Fetch the page from Ctrip and share it through the response cache"""
+        params = self._build_params(query)
+
+        # Build complete URL for logging
+        from urllib.parse import urlencode
+
+        full_url = f"{self.BASE_URL}?{urlencode(params)}"
+        logger.info(f"Fetching URL: {full_url}")
+
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
+
+        try:
+            fetch = self._fetch_streaming if self._stream else self._fetch_page
+            html = self._fetch_hedged(lambda: fetch(params))
+        except BaseException as e:
+            self._connection_failed = isinstance(e, requests.ConnectionError)
+            self._release_rate_limit(error=e)
+            raise
+
+        self._connection_failed = False
+        self._release_rate_limit(html)
+        self._cache_page(query, html)
+
+        return html
+
+    def _fetch_hedged(self, fetch: Callable[[], str | bytes]) -> str | bytes:
+        """
+        Run fetch, sending an identical second request if the first is slow
+
+        Once the first request has taken longer than the hedge percentile of recent
+        latency, a hedge is started and whichever succeeds first wins. A blocking
+        requests call cannot be interrupted, so the loser is abandoned and finishes
+        in the background (bounded by the request timeout). The hedge takes its own
+        rate limit token and is skipped when none is free.
+        """
+        delay = self._hedge_delay()
+        if delay is None:
+            return self._timed(fetch)
+
+        pool = self._hedge_pool()
+        primary = pool.submit(self._timed, fetch)
+        try:
+            return primary.result(timeout=delay)
+        except FutureTimeoutError:
+            pass
+
+        if not self._acquire_hedge_slot():
+            return primary.result()
+
+        self._hedges += 1
+        logger.info(f"No response after {delay * 1000:.0f}ms, sending hedged request")
+        hedge = pool.submit(self._timed, fetch)
+        hedge.add_done_callback(self._release_hedge)
+
+        pending = {primary, hedge}
+        while True:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            winner = next((future for future in done if future.exception() is None), None)
+            if winner is not None or not pending:
+                for other in pending:
+                    other.cancel()
+                # Both failed: re-raise the last error
+                return (winner or done.pop()).result()
+
+    def _timed(self, fetch: Callable[[], str | bytes]) -> str | bytes:
+        """Run fetch and record its latency on success or timeout"""
+        start = time.perf_counter()
+        try:
+            html = fetch()
+        except requests.Timeout:
+            # Dropping timed-out requests would bias the percentiles low, just when the host is slow
+            self._record_latency(time.perf_counter() - start)
+            raise
+        self._record_latency(time.perf_counter() - start)
+        return html
+
+    def _fetch_page(self, params: dict[str, str]) -> str:
+        """Fetch the whole page body"""
+        response = self._session.get(
+            self.BASE_URL,
+            params=params,
+            timeout=self._timeout,
+        )
+        response.raise_for_status()
+
+        return response.text
+
+    def _fetch_streaming(self, params: dict[str, str]) -> bytes:
+        """Fetch page body in chunks, ending the transfer once __NEXT_DATA__ is complete"""
+        scanner = NextDataStreamScanner()
+
+        with self._session.get(
+            self.BASE_URL,
+            params=params,
+            timeout=self._timeout,
+            stream=True,
+        ) as response:
+            response.raise_for_status()
+
+            for chunk in response.iter_content(chunk_size=self._chunk_size):
+                if scanner.feed(chunk):
+                    # Leaving the block closes the response and drops the rest of the body
+                    logger.debug(f"__NEXT_DATA__ complete after {len(scanner.data)} bytes, closing stream")
+                    break
+
+        return scanner.data
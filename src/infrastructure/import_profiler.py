@@ -0,0 +1,127 @@
+"""Per-module import timing for startup profiling"""
+
+import sys
+import threading
+import time
+from importlib.abc import Loader, MetaPathFinder
+from importlib.machinery import ModuleSpec
+from types import ModuleType
+from typing import Any
+
+
+class _TimedLoader(Loader):
+    """Wraps a module loader and reports how long executing the module took"""
+
+    def __init__(self, loader: Loader, profiler: "ImportProfiler") -> None:
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec: ModuleSpec) -> ModuleType | None:
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        self._profiler._enter()
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit(module.__name__, time.perf_counter() - start)
+
+    def __getattr__(self, name: str) -> Any:
+        # Resource readers, get_code(), is_package() etc. of the wrapped loader
+        return getattr(self._loader, name)
+
+
+class ImportProfiler(MetaPathFinder):
+    """
+    Records self and cumulative import time per module while installed
+
+    Sits first on sys.meta_path, lets the regular finders locate each module and
+    wraps the loader they return, so only the module body execution is timed
+    (like python -X importtime). Time spent importing a module's own imports is
+    counted in its cumulative time but not its self time.
+    """
+
+    def __init__(self) -> None:
+        # module -> (self seconds, cumulative seconds)
+        self._timings: dict[str, tuple[float, float]] = {}
+        self._total = 0.0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @property
+    def timings(self) -> dict[str, tuple[float, float]]:
+        """Module name -> (self seconds, cumulative seconds), in import order"""
+        with self._lock:
+            return dict(self._timings)
+
+    @property
+    def total(self) -> float:
+        """Seconds spent in top-level imports (nested ones are included in their importer)"""
+        with self._lock:
+            return self._total
+
+    def install(self) -> "ImportProfiler":
+        """Start timing imports"""
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+        return self
+
+    def uninstall(self) -> None:
+        """Stop timing imports (recorded timings are kept)"""
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname: str, path: Any, target: ModuleType | None = None) -> ModuleSpec | None:
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimedLoader(spec.loader, self)
+            return spec
+        return None
+
+    def report(self, limit: int = 25) -> str:
+        """
+        Slowest imports as a text table
+
+        Args:
+            limit: Number of modules listed (by cumulative time)
+
+        Returns:
+            Table of self/cumulative milliseconds per module
+        """
+        timings = sorted(self.timings.items(), key=lambda item: item[1][1], reverse=True)
+        lines = [
+            f"Imported {len(timings)} module(s) in {self.total * 1000:.0f} ms",
+            f"{'self ms':>9} {'cum ms':>9}  module",
+        ]
+        lines += [
+            f"{self_time * 1000:9.1f} {cumulative * 1000:9.1f}  {name}"
+            for name, (self_time, cumulative) in timings[:limit]
+        ]
+        return "\n".join(lines)
+
+    def _enter(self) -> None:
+        stack = self._stack()
+        stack.append(0.0)
+
+    def _exit(self, name: str, elapsed: float) -> None:
+        stack = self._stack()
+        children = stack.pop()
+        with self._lock:
+            self._timings[name] = (elapsed - children, elapsed)
+            if not stack:
+                self._total += elapsed
+        if stack:
+            stack[-1] += elapsed
+
+    def _stack(self) -> list[float]:
+        """Time spent in nested imports, per import in progress on this thread"""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
@@ -0,0 +1,110 @@
+"""SQLite store for scheduler job run state"""
+
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+from loguru import logger
+
+from src.domain.models import JobState
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS job_state (
+    job_id TEXT PRIMARY KEY,
+    last_run_at TEXT,
+    last_status TEXT,
+    next_run_at TEXT
+);
+"""
+
+
+class SQLiteJobStateStore:
+    """
+    Last-run and next-run times per scheduler job, kept across restarts
+
+    Job functions are closures over the container, so they cannot be pickled
+    into a persistent APScheduler job store; jobs are re-registered on every
+    start and only their run state lives here. That is enough to tell that a
+    run came due while the process was down.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """
+        Initialize store
+
+        Args:
+            path: Database file path (parent directories are created)
+        """
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+        with self._connection() as conn:
+            conn.executescript(_SCHEMA)
+
+    def get(self, job_id: str) -> JobState | None:
+        """Run state of a job, None if it never ran or was never scheduled"""
+        with self._connection() as conn:
+            row = conn.execute(
+                "SELECT job_id, last_run_at, last_status, next_run_at FROM job_state WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return self._from_row(row) if row else None
+
+    def all(self) -> list[JobState]:
+        """Run state of every known job"""
+        with self._connection() as conn:
+            rows = conn.execute(
+                "SELECT job_id, last_run_at, last_status, next_run_at FROM job_state ORDER BY job_id"
+            ).fetchall()
+        return [self._from_row(row) for row in rows]
+
+    def record_run(self, job_id: str, run_at: datetime, status: str) -> None:
+        """Record a finished run (run_at is the time the run was scheduled for)"""
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT INTO job_state (job_id, last_run_at, last_status) VALUES (?, ?, ?) "
+                "ON CONFLICT(job_id) DO UPDATE SET last_run_at = excluded.last_run_at, "
+                "last_status = excluded.last_status",
+                (job_id, run_at.isoformat(), status),
+            )
+
+    def record_next_run(self, job_id: str, next_run_at: datetime | None) -> None:
+        """Record when a job is due next (None when it will not run again)"""
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT INTO job_state (job_id, next_run_at) VALUES (?, ?) "
+                "ON CONFLICT(job_id) DO UPDATE SET next_run_at = excluded.next_run_at",
+                (job_id, next_run_at.isoformat() if next_run_at else None),
+            )
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Serialized connection committed on success and always closed"""
+        with self._lock:
+            conn = sqlite3.connect(self._path, timeout=30)
+            try:
+                with conn:
+                    yield conn
+            finally:
+                conn.close()
+
+    @staticmethod
+    def _from_row(row: tuple) -> JobState:
+        job_id, last_run_at, last_status, next_run_at = row
+        return JobState(
+            job_id=job_id,
+            last_run_at=datetime.fromisoformat(last_run_at) if last_run_at else None,
+            last_status=last_status,
+            next_run_at=datetime.fromisoformat(next_run_at) if next_run_at else None,
+        )
+
+
+def open_job_state_store(path: str) -> SQLiteJobStateStore | None:
+    """Open the job state store at path, or None when it is disabled (empty path)"""
+    if not path:
+        return None
+    logger.info(f"Persisting scheduler job state to {path}")
+    return SQLiteJobStateStore(path)
@@ -0,0 +1,65 @@
+"""Per-host request latency tracking"""
+
+import math
+import threading
+from collections import deque
+
+
+class LatencyTracker:
+    """Thread-safe sliding window of recent request latencies per host"""
+
+    def __init__(self, window: int = 200, min_samples: int = 20) -> None:
+        """
+        Initialize tracker
+
+        Args:
+            window: Number of most recent samples kept per host
+            min_samples: Samples required before percentiles are reported
+        """
+        if window < 1 or not 1 <= min_samples <= window:
+            raise ValueError("window must be positive and min_samples between 1 and window")
+
+        self._window = window
+        self._min_samples = min_samples
+        self._samples: dict[str, deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, host: str, seconds: float) -> None:
+        """Record one request latency"""
+        with self._lock:
+            samples = self._samples.get(host)
+            if samples is None:
+                samples = self._samples[host] = deque(maxlen=self._window)
+            samples.append(seconds)
+
+    def percentile(self, host: str, percentile: float) -> float | None:
+        """
+        Latency percentile for a host (nearest-rank)
+
+        Args:
+            host: Host name
+            percentile: Percentile in (0, 100]
+
+        Returns:
+            Latency in seconds, or None until enough samples were recorded
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(host, ()))
+
+        if len(samples) < self._min_samples:
+            return None
+
+        rank = max(1, math.ceil(percentile / 100 * len(samples)))
+        return samples[rank - 1]
+
+    def stats(self, host: str) -> dict[str, float]:
+        """Snapshot of latency percentiles for a host"""
+        with self._lock:
+            count = len(self._samples.get(host, ()))
+
+        stats: dict[str, float] = {"samples": count}
+        for p in (50, 90, 99):
+            value = self.percentile(host, p)
+            if value is not None:
+                stats[f"p{p}"] = value
+        return stats
@@ -0,0 +1,82 @@
+"""Local leader election with an exclusive file lock"""
+
+import fcntl
+import os
+from pathlib import Path
+from typing import IO
+
+from loguru import logger
+
+
+class FileLeaderLock:
+    """
+    Exclusive flock on a file: only the holder coordinates (schedules jobs)
+
+    The kernel drops the lock when the holder exits, even on a crash, so a
+    standby process blocked in acquire(blocking=True) takes over without
+    stale-lock cleanup. The holder's PID is written to the file for operators.
+    Locks are per host: containers must share the file (a volume) to exclude
+    each other.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """
+        Initialize lock
+
+        Args:
+            path: Lock file path (parent directories are created)
+        """
+        self._path = Path(path)
+        self._file: IO[str] | None = None
+
+    @property
+    def held(self) -> bool:
+        """Whether this process holds the lock"""
+        return self._file is not None
+
+    def acquire(self, blocking: bool = False) -> bool:
+        """
+        Try to become leader
+
+        Args:
+            blocking: Wait until the current leader releases the lock
+
+        Returns:
+            Whether the lock is held
+        """
+        if self._file is not None:
+            return True
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        file = open(self._path, "a+")  # Held open for the lifetime of the lock
+        try:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        except BlockingIOError:
+            file.close()
+            return False
+        except BaseException:
+            file.close()
+            raise
+
+        file.seek(0)
+        file.truncate()
+        file.write(f"{os.getpid()}\n")
+        file.flush()
+        self._file = file
+        logger.info(f"Acquired leader lock {self._path} (pid {os.getpid()})")
+        return True
+
+    def release(self) -> None:
+        """Give up leadership"""
+        if self._file is None:
+            return
+        fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        self._file.close()
+        self._file = None
+
+    def __enter__(self) -> "FileLeaderLock":
+        self.acquire(blocking=True)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.release()
@@ -59,6 +59,28 @@ class EmailNotifier(INotifier):
             logger.error(f"Failed to send email: {e}")
             raise NotifierException(f"Failed to send notification: {e}") from e
 
+    def send_batch(self, analyses: list[AnalysisResult]) -> None:
+        """Send one email covering several analyses (e.g. a multi-date sweep)"""
+        if not analyses:
+            return
+        if len(analyses) == 1:
+            self.send(analyses[0])
+            return
+
+        logger.info(f"Sending aggregate email notification ({len(analyses)} results) to {', '.join(self._to_addrs)}")
+
+        try:
+            subject = self._build_batch_subject(analyses)
+            plain_text, html_body = self._build_batch_body(analyses)
+
+            self._send_email(subject, plain_text, html_body)
+
+            logger.info("Email sent successfully")
+
+        except Exception as e:
+            logger.error(f"Failed to send email: {e}")
+            raise NotifierException(f"Failed to send notification: {e}") from e
+
     def _format_relative_date(self, date_str: str) -> str:
         """Format date as relative time (today, tomorrow, weekday)"""
         try:
@@ -226,6 +248,75 @@ class EmailNotifier(INotifier):
     </div>
 </body>
 </html>
+"""
+
+        return plain_text, html
+
+    def _build_batch_subject(self, analyses: list[AnalysisResult]) -> str:
+        """Build aggregate email subject - train numbers and relative dates with tickets"""
+        dates_by_train: dict[str | None, list[str]] = {}
+        for analysis in analyses:
+            query = analysis.raw_data.query
+            dates_by_train.setdefault(query.train_number, []).append(self._format_relative_date(query.departure_date))
+
+        if len(dates_by_train) == 1:
+            # Format: ✅ C3380 3d: 明天 下周一 下下周三
+            [(train_number, dates)] = dates_by_train.items()
+            return f"✅ {train_number} {len(dates)}d: {' '.join(dates)}"
+
+        # Format: ✅ C3380 明天 下周一; G1 明天 (a watch list)
+        return "✅ " + "; ".join(f"{train_number} {' '.join(dates)}" for train_number, dates in dates_by_train.items())
+
+    def _build_batch_body(self, analyses: list[AnalysisResult]) -> tuple[str, str]:
+        """Build aggregate email body - returns (plain_text, html)"""
+        plain_text = "\n\n---\n\n".join(
+            self._build_plain_text(
+                analysis,
+                analysis.raw_data.trains[0] if analysis.raw_data.trains else None,
+                analysis.raw_data.query,
+            )
+            for analysis in analyses
+        )
+
+        sections = ""
+        for analysis in analyses:
+            query = analysis.raw_data.query
+            train = analysis.raw_data.trains[0] if analysis.raw_data.trains else None
+            departure = f" {train.departure_time}" if train else ""
+
+            sections += f"""
+        <div class="content">
+            <h3>🚄 {query.train_number} 📅 {query.departure_date} ({self._format_relative_date(query.departure_date)}){departure}</h3>
+            <p><strong>{analysis.summary}</strong></p>
+            <p>💡 {analysis.recommendation}</p>
+        </div>
+"""
+
+        html = f"""
+<html>
+<head>
+    <style>
+        body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
+        .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
+        .header {{ background: #4CAF50; color: white; padding: 20px; border-radius: 5px; }}
+        .content {{ background: #f9f9f9; padding: 20px; margin: 20px 0; border-radius: 5px; }}
+        .footer {{ text-align: center; color: #666; font-size: 12px; margin-top: 20px; }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h2>🚄 Train Ticket Monitor Notification</h2>
+            <p>Tickets available for {len(analyses)} train dates</p>
+        </div>
+{sections}
+        <div class="footer">
+            <p>Early Bird Train Automatic Monitoring System</p>
+            <p>This email is automatically sent by the system, please do not reply</p>
+        </div>
+    </div>
+</body>
+</html>
 """
 
         return plain_text, html
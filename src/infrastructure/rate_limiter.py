@@ -0,0 +1,177 @@
+"""Adaptive per-host rate limiter"""
+
+import asyncio
+import math
+import threading
+import time
+from enum import Enum
+
+from loguru import logger
+
+
+class RequestOutcome(str, Enum):
+    """Outcome of a rate-limited request"""
+
+    SUCCESS = "success"
+    THROTTLED = "throttled"  # HTTP 429/5xx or an empty/blocked page
+    ERROR = "error"  # Other failures (no congestion signal)
+    CANCELLED = "cancelled"  # Abandoned before finishing, e.g. the losing hedged request (no signal)
+
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket limiter with AIMD-controlled concurrency for one host
+
+    Requests need a token (refilled at `rate` per second up to `burst`) and a
+    free concurrency slot. The concurrency limit grows additively while
+    requests succeed (about +additive_increase per limit's worth of successes,
+    as in TCP congestion avoidance) and is cut multiplicatively on throttling.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        rate: float = 2.0,
+        burst: int = 4,
+        initial_concurrency: float = 2,
+        min_concurrency: float = 1,
+        max_concurrency: float = 8,
+        additive_increase: float = 1.0,
+        multiplicative_decrease: float = 0.5,
+    ) -> None:
+        """
+        Initialize rate limiter
+
+        Args:
+            host: Host the limiter protects (for logs and metrics)
+            rate: Token refill rate (requests per second)
+            burst: Token bucket capacity
+            initial_concurrency: Starting concurrency limit (clamped to the bounds)
+            min_concurrency: Lower bound of the concurrency limit
+            max_concurrency: Upper bound of the concurrency limit
+            additive_increase: Limit increase per full window of successes
+            multiplicative_decrease: Factor applied to the limit on throttling (0-1)
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+        if not 1 <= min_concurrency <= max_concurrency:
+            raise ValueError("concurrency bounds must satisfy 1 <= min <= max")
+        if not 0 < multiplicative_decrease < 1:
+            raise ValueError("multiplicative_decrease must be between 0 and 1")
+
+        self._host = host
+        self._rate = rate
+        self._burst = burst
+        self._min_concurrency = min_concurrency
+        self._max_concurrency = max_concurrency
+        self._additive_increase = additive_increase
+        self._multiplicative_decrease = multiplicative_decrease
+
+        self._cond = threading.Condition()
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._limit = float(min(max(initial_concurrency, min_concurrency), max_concurrency))
+        self._in_flight = 0
+
+        self._counts = {outcome: 0 for outcome in RequestOutcome}
+        self._acquired = 0
+        self._total_wait = 0.0
+
+    @property
+    def host(self) -> str:
+        """Host the limiter protects"""
+        return self._host
+
+    @property
+    def concurrency_limit(self) -> float:
+        """Current AIMD concurrency limit"""
+        return self._limit
+
+    def acquire(self) -> None:
+        """Block until a token and a concurrency slot are available"""
+        start = time.monotonic()
+
+        with self._cond:
+            while (wait := self._try_acquire()) > 0:
+                self._cond.wait(wait)
+            self._total_wait += time.monotonic() - start
+
+    def try_acquire(self) -> bool:
+        """Take a token and a concurrency slot only if both are free now (never waits)"""
+        with self._cond:
+            return self._try_acquire() == 0
+
+    async def acquire_async(self) -> None:
+        """Wait (without blocking the event loop) until a token and a concurrency slot are available"""
+        start = time.monotonic()
+
+        while True:
+            with self._cond:
+                wait = self._try_acquire()
+                if wait == 0:
+                    self._total_wait += time.monotonic() - start
+                    return
+            await asyncio.sleep(wait)
+
+    def release(self, outcome: RequestOutcome) -> None:
+        """
+        Free the concurrency slot and adapt the limit
+
+        Args:
+            outcome: How the request went
+        """
+        with self._cond:
+            self._in_flight = max(0, self._in_flight - 1)
+            self._counts[outcome] += 1
+
+            if outcome == RequestOutcome.SUCCESS:
+                self._limit = min(self._max_concurrency, self._limit + self._additive_increase / self._limit)
+            elif outcome == RequestOutcome.THROTTLED:
+                self._limit = max(self._min_concurrency, self._limit * self._multiplicative_decrease)
+                logger.warning(f"Throttled by {self._host}, concurrency limit -> {self._limit:.2f}")
+
+            self._cond.notify_all()
+
+    def metrics(self) -> dict[str, float]:
+        """Snapshot of limiter state"""
+        with self._cond:
+            self._refill()
+            return {
+                "concurrency_limit": self._limit,
+                "in_flight": self._in_flight,
+                "tokens": self._tokens,
+                "rate": self._rate,
+                "acquired": self._acquired,
+                "successes": self._counts[RequestOutcome.SUCCESS],
+                "throttled": self._counts[RequestOutcome.THROTTLED],
+                "errors": self._counts[RequestOutcome.ERROR],
+                "cancelled": self._counts[RequestOutcome.CANCELLED],
+                "total_wait_seconds": self._total_wait,
+            }
+
+    def _refill(self) -> None:
+        """Add tokens for the time elapsed since the last refill (lock held)"""
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._last_refill) * self._rate)
+        self._last_refill = now
+
+    def _try_acquire(self) -> float:
+        """
+        Take a token and a slot if both are free (lock held)
+
+        Returns:
+            0 when acquired, otherwise seconds to wait before trying again
+        """
+        self._refill()
+
+        if self._in_flight >= math.floor(self._limit):
+            # Woken by release(); the timeout only guards against missed notifications
+            return 0.05
+
+        if self._tokens < 1:
+            return (1 - self._tokens) / self._rate
+
+        self._tokens -= 1
+        self._in_flight += 1
+        self._acquired += 1
+        return 0
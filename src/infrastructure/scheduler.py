@@ -1,17 +1,59 @@
 """APScheduler implementation"""
 
+import asyncio
 from collections.abc import Callable
+from datetime import datetime
 
+from apscheduler.events import (
+    EVENT_JOB_ERROR,
+    EVENT_JOB_EXECUTED,
+    EVENT_JOB_MISSED,
+    EVENT_SCHEDULER_STARTED,
+    JobExecutionEvent,
+    SchedulerEvent,
+)
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.schedulers.base import BaseScheduler
 from apscheduler.schedulers.blocking import BlockingScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from loguru import logger
 
+from src.infrastructure.job_state import SQLiteJobStateStore
+
+# Suffix of the one-off job that replays a run missed while the process was down
+_RECOVERY_SUFFIX = "__recovery"
+
 
 class APSchedulerWrapper:
-    """APScheduler wrapper, implements IScheduler interface"""
+    """
+    APScheduler wrapper, implements IScheduler interface
+
+    With a job state store, each job's last-run and next-run times are persisted.
+    On start, a job whose stored next run came due while the process was down
+    (and was not run) is replayed immediately if it is at most
+    misfire_grace_seconds late; later than that, the run is logged and skipped.
+    """
+
+    def __init__(self, job_state: SQLiteJobStateStore | None = None, misfire_grace_seconds: int = 300) -> None:
+        """
+        Initialize scheduler
+
+        Args:
+            job_state: Persists job run state across restarts (optional)
+            misfire_grace_seconds: How late a run may still start, in-process or after a restart
+        """
+        self._scheduler = self._create_scheduler()
+        self._job_state = job_state
+        self._misfire_grace = misfire_grace_seconds
+
+        if job_state is not None:
+            self._scheduler.add_listener(self._on_job_event, EVENT_JOB_EXECUTED | EVENT_JOB_ERROR | EVENT_JOB_MISSED)
+            self._scheduler.add_listener(self._on_started, EVENT_SCHEDULER_STARTED)
 
-    def __init__(self) -> None:
-        self._scheduler = BlockingScheduler()
+    @staticmethod
+    def _create_scheduler() -> BaseScheduler:
+        return BlockingScheduler()
 
     def schedule_weekly_job(
         self,
@@ -19,6 +61,10 @@ class APSchedulerWrapper:
         hour: int,
         minute: int,
         job_func: Callable,
+        warmup_func: Callable | None = None,
+        warmup_seconds: int = 0,
+        lead_seconds: int = 0,
+        job_id: str | None = None,
     ) -> None:
         """
         Schedule weekly job
@@ -28,20 +74,62 @@ class APSchedulerWrapper:
             hour: Hour
             minute: Minute
             job_func: Job function to execute
+            warmup_func: Optional function to run warmup_seconds before the job
+            warmup_seconds: Seconds before the job to run warmup_func
+            lead_seconds: Start the job this many seconds before the given time (e.g. burst polling)
+            job_id: Stable job ID, so persisted run state still matches after the time changes
+                (default: weekly_job_<day>_<hour>_<minute>)
         """
+        if job_id is None:
+            job_id = f"weekly_job_{day_of_week}_{hour}_{minute}"
+            warmup_id = f"weekly_warmup_{day_of_week}_{hour}_{minute}"
+        else:
+            warmup_id = f"{job_id}_warmup"
+
+        job_day, job_hour, job_minute, job_second = self._offset_weekly_time(day_of_week, hour, minute, lead_seconds)
         trigger = CronTrigger(
-            day_of_week=day_of_week,
-            hour=hour,
-            minute=minute,
+            day_of_week=job_day,
+            hour=job_hour,
+            minute=job_minute,
+            second=job_second,
         )
 
         self._scheduler.add_job(
             job_func,
             trigger=trigger,
-            id=f"weekly_job_{day_of_week}_{hour}_{minute}",
+            id=job_id,
+            misfire_grace_time=self._misfire_grace,
+            coalesce=True,
         )
 
-        logger.info(f"Scheduled weekly job: day_of_week={day_of_week}, time={hour:02d}:{minute:02d}")
+        logger.info(
+            f"Scheduled weekly job: day_of_week={job_day}, "
+            f"time={job_hour:02d}:{job_minute:02d}:{job_second:02d}"
+            + (f" ({lead_seconds}s before {hour:02d}:{minute:02d})" if lead_seconds else "")
+        )
+
+        if warmup_func is not None and warmup_seconds > 0:
+            warmup_day, warmup_hour, warmup_minute, warmup_second = self._offset_weekly_time(
+                day_of_week, hour, minute, lead_seconds + warmup_seconds
+            )
+
+            self._scheduler.add_job(
+                warmup_func,
+                trigger=CronTrigger(
+                    day_of_week=warmup_day,
+                    hour=warmup_hour,
+                    minute=warmup_minute,
+                    second=warmup_second,
+                ),
+                id=warmup_id,
+                misfire_grace_time=self._misfire_grace,
+                coalesce=True,
+            )
+
+            logger.info(
+                f"Scheduled warm-up {warmup_seconds}s before job: day_of_week={warmup_day}, "
+                f"time={warmup_hour:02d}:{warmup_minute:02d}:{warmup_second:02d}"
+            )
 
     def schedule_multiple_weekly_jobs(
         self,
@@ -49,6 +137,10 @@ class APSchedulerWrapper:
         hour: int,
         minute: int,
         job_func: Callable,
+        warmup_func: Callable | None = None,
+        warmup_seconds: int = 0,
+        lead_seconds: int = 0,
+        job_id: str | None = None,
     ) -> None:
         """
         Schedule multiple weekly jobs
@@ -58,6 +150,10 @@ class APSchedulerWrapper:
             hour: Hour
             minute: Minute
             job_func: Job function to execute
+            warmup_func: Optional function to run warmup_seconds before each job
+            warmup_seconds: Seconds before each job to run warmup_func
+            lead_seconds: Start each job this many seconds before the given time
+            job_id: Stable job ID prefix, each day's job is <job_id>_<day> (default: derived from the day and time)
         """
         for day in days_of_week:
             self.schedule_weekly_job(
@@ -65,16 +161,206 @@ class APSchedulerWrapper:
                 hour=hour,
                 minute=minute,
                 job_func=job_func,
+                warmup_func=warmup_func,
+                warmup_seconds=warmup_seconds,
+                lead_seconds=lead_seconds,
+                job_id=f"{job_id}_{day}" if job_id is not None else None,
             )
 
         logger.info(f"Scheduled {len(days_of_week)} weekly job(s): days={days_of_week}, time={hour:02d}:{minute:02d}")
 
+    def schedule_cron_job(
+        self,
+        job_id: str,
+        job_func: Callable,
+        day_of_week: int | str | None = None,
+        hour: int | str | None = None,
+        minute: int | str | None = None,
+        second: int | str = 0,
+        max_instances: int = 1,
+        coalesce: bool = True,
+    ) -> None:
+        """
+        Schedule a job on a cron trigger
+
+        Args:
+            job_id: Job ID (an existing job with the same ID is replaced)
+            job_func: Job function to execute
+            day_of_week: Cron day_of_week field (0=Monday, None for every day)
+            hour: Cron hour field (None for every hour)
+            minute: Cron minute field (None for every minute)
+            second: Cron second field
+            max_instances: Maximum concurrently running instances of this job
+            coalesce: Run missed executions once instead of once per missed time
+        """
+        trigger = CronTrigger(day_of_week=day_of_week, hour=hour, minute=minute, second=second)
+        self._scheduler.add_job(
+            job_func,
+            trigger=trigger,
+            id=job_id,
+            max_instances=max_instances,
+            coalesce=coalesce,
+            misfire_grace_time=self._misfire_grace,
+            replace_existing=True,
+        )
+        logger.info(f"Scheduled cron job {job_id}: {trigger}")
+
+    def schedule_interval_job(
+        self,
+        job_id: str,
+        job_func: Callable,
+        seconds: float,
+        max_instances: int = 1,
+        coalesce: bool = True,
+    ) -> None:
+        """
+        Schedule a job every given number of seconds
+
+        Args:
+            job_id: Job ID (an existing job with the same ID is replaced)
+            job_func: Job function to execute
+            seconds: Interval in seconds
+            max_instances: Maximum concurrently running instances of this job
+            coalesce: Run missed executions once instead of once per missed time
+        """
+        self._scheduler.add_job(
+            job_func,
+            trigger=IntervalTrigger(seconds=seconds),
+            id=job_id,
+            max_instances=max_instances,
+            coalesce=coalesce,
+            misfire_grace_time=self._misfire_grace,
+            replace_existing=True,
+        )
+        logger.info(f"Scheduled interval job {job_id}: every {seconds}s")
+
+    @staticmethod
+    def _offset_weekly_time(day_of_week: int, hour: int, minute: int, seconds_before: int) -> tuple[int, int, int, int]:
+        """
+        Shift a weekly time earlier, wrapping across days and the week
+
+        Returns:
+            (day_of_week, hour, minute, second)
+        """
+        week_seconds = 7 * 24 * 3600
+        total = ((day_of_week * 24 + hour) * 60 + minute) * 60 - seconds_before
+        total %= week_seconds
+
+        day, remainder = divmod(total, 24 * 3600)
+        shifted_hour, remainder = divmod(remainder, 3600)
+        shifted_minute, second = divmod(remainder, 60)
+
+        return day, shifted_hour, shifted_minute, second
+
     def start(self) -> None:
         """Start scheduler"""
         logger.info("Starting scheduler...")
+        self._recover_missed_runs()
         self._scheduler.start()
 
     def shutdown(self) -> None:
         """Shutdown scheduler"""
         logger.info("Shutting down scheduler...")
         self._scheduler.shutdown()
+
+    def _recover_missed_runs(self) -> None:
+        """Replay runs that came due while the process was down (call before starting)"""
+        if self._job_state is None:
+            return
+
+        now = datetime.now().astimezone()
+        for job in self._scheduler.get_jobs():
+            state = self._job_state.get(job.id)
+            if state is None or state.next_run_at is None or state.next_run_at > now:
+                continue
+            if state.last_run_at is not None and state.last_run_at >= state.next_run_at:
+                continue
+
+            late = (now - state.next_run_at).total_seconds()
+            if late > self._misfire_grace:
+                logger.warning(
+                    f"Job {job.id} missed its run at {state.next_run_at:%Y-%m-%d %H:%M:%S} ({late:.0f}s ago)"
+                )
+                continue
+
+            logger.warning(f"Job {job.id} missed its run {late:.0f}s ago during downtime, running it now")
+            # No trigger: runs once as soon as the scheduler starts
+            self._scheduler.add_job(job.func, id=f"{job.id}{_RECOVERY_SUFFIX}", name=job.name)
+
+    def _on_started(self, event: SchedulerEvent) -> None:
+        """Persist the next run time of every job"""
+        if self._job_state is None:
+            return
+
+        for job in self._scheduler.get_jobs():
+            if not job.id.endswith(_RECOVERY_SUFFIX):
+                self._job_state.record_next_run(job.id, job.next_run_time)
+
+    def _on_job_event(self, event: JobExecutionEvent) -> None:
+        """Persist the outcome of a run and the job's next run time"""
+        if self._job_state is None:
+            return
+
+        job_id = event.job_id.removesuffix(_RECOVERY_SUFFIX)
+        try:
+            if event.code != EVENT_JOB_MISSED:
+                status = "error" if event.exception else "success"
+                self._job_state.record_run(job_id, event.scheduled_run_time, status)
+
+            job = self._scheduler.get_job(job_id)
+            if job is not None:
+                self._job_state.record_next_run(job_id, job.next_run_time)
+        except Exception as e:
+            logger.error(f"Failed to persist state of job {job_id}: {e}")
+
+
+class AsyncIOSchedulerWrapper(APSchedulerWrapper):
+    """
+    APScheduler on an asyncio event loop, implements IScheduler interface
+
+    Coroutine jobs (async def) run natively on the loop, so many concurrent
+    jobs share one thread; plain functions run in the loop's default executor.
+    start() blocks like the blocking wrapper; run() is the awaitable form for
+    callers that already own an event loop.
+    """
+
+    def __init__(self, job_state: SQLiteJobStateStore | None = None, misfire_grace_seconds: int = 300) -> None:
+        """
+        Initialize scheduler
+
+        Args:
+            job_state: Persists job run state across restarts (optional)
+            misfire_grace_seconds: How late a run may still start, in-process or after a restart
+        """
+        super().__init__(job_state=job_state, misfire_grace_seconds=misfire_grace_seconds)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._stopped: asyncio.Event | None = None
+
+    @staticmethod
+    def _create_scheduler() -> BaseScheduler:
+        return AsyncIOScheduler()
+
+    async def run(self) -> None:
+        """Run the scheduler on the current event loop until shutdown() is called"""
+        self._loop = asyncio.get_running_loop()
+        self._stopped = asyncio.Event()
+        self._recover_missed_runs()
+        self._scheduler.start()
+        try:
+            await self._stopped.wait()
+        finally:
+            if self._scheduler.running:
+                self._scheduler.shutdown(wait=False)
+                # The scheduler shuts down in a loop callback; let it run
+                await asyncio.sleep(0)
+
+    def start(self) -> None:
+        """Start scheduler (blocks, running its own event loop)"""
+        logger.info("Starting asyncio scheduler...")
+        asyncio.run(self.run())
+
+    def shutdown(self) -> None:
+        """Shutdown scheduler (safe to call from any thread)"""
+        logger.info("Shutting down asyncio scheduler...")
+        if self._loop is not None and self._stopped is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._stopped.set)
@@ -0,0 +1,113 @@
+"""Single-flight request coalescing"""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+from loguru import logger
+
+V = TypeVar("V")
+
+
+class _Call(Generic[V]):
+    """In-flight call shared by the leader and its waiters"""
+
+    # Set by the leader before done is set (unless it failed with error)
+    result: V
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.error: BaseException | None = None
+
+
+class SingleFlight(Generic[V]):
+    """
+    Coalesces concurrent calls with the same key into one execution
+
+    While a call for a key is in flight, later callers wait for its result
+    (or exception) instead of running the function again. Works for threads
+    via do() and for coroutines on one event loop via do_async().
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call[V]] = {}
+        self._async_calls: dict[Hashable, asyncio.Future] = {}
+        self._coalesced = 0
+
+    @property
+    def coalesced(self) -> int:
+        """Number of calls served by another caller's in-flight execution"""
+        return self._coalesced
+
+    def do(self, key: Hashable, fn: Callable[[], V]) -> V:
+        """
+        Run fn once per key across concurrent threads
+
+        Args:
+            key: Coalescing key
+            fn: Function to execute if no call for key is in flight
+
+        Returns:
+            Result of the (possibly shared) execution
+        """
+        with self._lock:
+            in_flight = self._calls.get(key)
+            if in_flight is None:
+                call: _Call[V] = _Call()
+                self._calls[key] = call
+            else:
+                self._coalesced += 1
+
+        if in_flight is not None:
+            logger.debug(f"Joining in-flight request for {key}")
+            in_flight.done.wait()
+            if in_flight.error is not None:
+                raise in_flight.error
+            return in_flight.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[V]]) -> V:
+        """
+        Run fn once per key across concurrent coroutines
+
+        Args:
+            key: Coalescing key
+            fn: Coroutine function to await if no call for key is in flight
+
+        Returns:
+            Result of the (possibly shared) execution
+        """
+        future = self._async_calls.get(key)
+        if future is not None:
+            self._coalesced += 1
+            logger.debug(f"Joining in-flight request for {key}")
+            # Shield so one waiter being cancelled does not cancel the shared call
+            return await asyncio.shield(future)
+
+        future = self._async_calls[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await fn()
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark as retrieved; the leader re-raises it below
+            future.exception()
+            raise
+        finally:
+            del self._async_calls[key]
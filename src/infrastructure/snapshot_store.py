@@ -0,0 +1,250 @@
+"""SQLite snapshot history store with a batching background writer"""
+
+import queue
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from loguru import logger
+
+from src.domain.interfaces import ISnapshotStore
+from src.domain.models import SeatSnapshot, SeatType, TicketQueryResult
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS seat_snapshots (
+    id INTEGER PRIMARY KEY,
+    query_time TEXT NOT NULL,
+    departure_station TEXT NOT NULL,
+    arrival_station TEXT NOT NULL,
+    departure_date TEXT NOT NULL,
+    train_number TEXT NOT NULL,
+    seat_type TEXT NOT NULL,
+    price INTEGER NOT NULL,
+    inventory INTEGER NOT NULL,
+    bookable INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_seat_snapshots_train_date_time
+    ON seat_snapshots (train_number, departure_date, query_time);
+"""
+
+_INSERT = """
+INSERT INTO seat_snapshots (
+    query_time, departure_station, arrival_station, departure_date,
+    train_number, seat_type, price, inventory, bookable
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_COLUMNS = "query_time, departure_station, arrival_station, departure_date, train_number, seat_type, price, inventory, bookable"
+
+Row = tuple[str, str, str, str, str, str, int, int, int]
+
+
+class SQLiteSnapshotStore(ISnapshotStore):
+    """
+    Records every query result as seat-level rows in SQLite
+
+    record() only normalizes the result and enqueues it; a daemon writer thread
+    drains the queue and inserts up to batch_size results per transaction, so
+    a burst poll never waits on disk. The database runs in WAL mode, letting
+    history() read while the writer commits. When the queue is full, results
+    are dropped (and counted) rather than blocking the caller.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        batch_size: int = 100,
+        flush_interval: float = 0.5,
+        max_pending: int = 10_000,
+    ) -> None:
+        """
+        Initialize store and start the writer thread
+
+        Args:
+            path: Database file path (parent directories are created)
+            batch_size: Maximum results written per transaction
+            flush_interval: Seconds the writer waits for more results before committing a partial batch
+            max_pending: Maximum results queued before new ones are dropped
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._queue: queue.Queue[list[Row] | None] = queue.Queue(maxsize=max_pending)
+        self._dropped = 0
+        self._written = 0
+
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+        finally:
+            conn.close()
+
+        self._writer = threading.Thread(target=self._write_loop, name="snapshot-writer", daemon=True)
+        self._writer.start()
+
+    @property
+    def dropped(self) -> int:
+        """Results dropped because the write queue was full"""
+        return self._dropped
+
+    @property
+    def written(self) -> int:
+        """Seat rows committed so far"""
+        return self._written
+
+    def record(self, result: TicketQueryResult) -> None:
+        """Enqueue a query result for the writer (never blocks)"""
+        rows = [self._to_row(snapshot) for snapshot in SeatSnapshot.from_result(result)]
+        if not rows:
+            return
+
+        try:
+            self._queue.put_nowait(rows)
+        except queue.Full:
+            self._dropped += 1
+            logger.warning(f"Snapshot queue full, dropped result ({self._dropped} dropped so far)")
+
+    def history(
+        self,
+        train_number: str,
+        departure_date: str | None = None,
+        since: datetime | None = None,
+        departure_station: str | None = None,
+        arrival_station: str | None = None,
+    ) -> list[SeatSnapshot]:
+        """Recorded seat snapshots of a train, oldest first"""
+        rows = self.history_records(train_number, departure_date, since, departure_station, arrival_station)
+        return [self._from_row(row) for row in rows]
+
+    def history_records(
+        self,
+        train_number: str,
+        departure_date: str | None = None,
+        since: datetime | None = None,
+        departure_station: str | None = None,
+        arrival_station: str | None = None,
+    ) -> list[Row]:
+        """Recorded rows of a train as raw tuples, oldest first (no model per row)"""
+        sql = f"SELECT {_COLUMNS} FROM seat_snapshots WHERE train_number = ?"
+        params: list[str] = [train_number]
+        if departure_date is not None:
+            sql += " AND departure_date = ?"
+            params.append(departure_date)
+        if since is not None:
+            sql += " AND query_time >= ?"
+            params.append(since.isoformat())
+        if departure_station is not None:
+            sql += " AND departure_station = ?"
+            params.append(departure_station)
+        if arrival_station is not None:
+            sql += " AND arrival_station = ?"
+            params.append(arrival_station)
+        sql += " ORDER BY query_time, id"
+
+        conn = self._connect()
+        try:
+            return conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+
+    def flush(self) -> None:
+        """Wait until every enqueued result is committed"""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Commit pending results and stop the writer"""
+        if not self._writer.is_alive():
+            return
+        self._queue.put(None)
+        self._writer.join()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._path, timeout=30)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _write_loop(self) -> None:
+        """Drain the queue in batches until the stop sentinel arrives"""
+        conn = self._connect()
+        try:
+            while True:
+                item = self._queue.get()
+                batch: list[list[Row]] = []
+                stop = item is None
+                if item is not None:
+                    batch.append(item)
+
+                while not stop and len(batch) < self._batch_size:
+                    try:
+                        item = self._queue.get(timeout=self._flush_interval)
+                    except queue.Empty:
+                        break
+                    if item is None:
+                        stop = True
+                    else:
+                        batch.append(item)
+
+                self._write_batch(conn, batch)
+
+                # Sentinel included: one task_done per queue item taken
+                for _ in range(len(batch) + stop):
+                    self._queue.task_done()
+                if stop:
+                    return
+        finally:
+            conn.close()
+
+    def _write_batch(self, conn: sqlite3.Connection, batch: list[list[Row]]) -> None:
+        rows = [row for rows in batch for row in rows]
+        if not rows:
+            return
+
+        try:
+            with conn:
+                conn.executemany(_INSERT, rows)
+            self._written += len(rows)
+        except sqlite3.Error as e:
+            logger.error(f"Failed to write {len(rows)} snapshot row(s): {e}")
+
+    @staticmethod
+    def _to_row(snapshot: SeatSnapshot) -> Row:
+        return (
+            snapshot.query_time.isoformat(),
+            snapshot.departure_station,
+            snapshot.arrival_station,
+            snapshot.departure_date,
+            snapshot.train_number,
+            snapshot.seat_type.value,
+            snapshot.price,
+            snapshot.inventory,
+            int(snapshot.bookable),
+        )
+
+    @staticmethod
+    def _from_row(row: Row) -> SeatSnapshot:
+        query_time, departure, arrival, date, train_number, seat_type, price, inventory, bookable = row
+        return SeatSnapshot(
+            query_time=datetime.fromisoformat(query_time),
+            departure_station=departure,
+            arrival_station=arrival,
+            departure_date=date,
+            train_number=train_number,
+            seat_type=SeatType(seat_type),
+            price=price,
+            inventory=inventory,
+            bookable=bool(bookable),
+        )
+
+
+def open_snapshot_store(path: str, batch_size: int = 100) -> SQLiteSnapshotStore | None:
+    """Open the snapshot store at path, or None when persistence is disabled (empty path)"""
+    if not path:
+        return None
+    logger.info(f"Recording ticket snapshots to {path}")
+    return SQLiteSnapshotStore(path, batch_size=batch_size)
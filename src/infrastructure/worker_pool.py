@@ -0,0 +1,183 @@
+"""Long-lived worker processes fed over local queues"""
+
+import multiprocessing
+import time
+import traceback
+from collections.abc import Callable, Sequence
+from multiprocessing.context import SpawnContext
+from multiprocessing.process import BaseProcess
+from queue import Empty
+from typing import Any, cast
+
+from loguru import logger
+
+from src.domain.exceptions import DomainException
+
+# Called once in each worker process; returns the function that handles one task there.
+# A handler with a close() method has it called when the worker stops.
+WorkerFactory = Callable[[], Callable[[Any], Any]]
+
+# How often map() checks that workers it waits on are still alive
+_LIVENESS_INTERVAL = 0.5
+
+
+class WorkerError(DomainException):
+    """A task failed (or never answered) in a worker process"""
+
+    pass
+
+
+def _worker_loop(index: int, factory: WorkerFactory, tasks: Any, results: Any) -> None:
+    """Worker process main loop: handle tasks until the None sentinel arrives"""
+    handler = factory()
+    try:
+        while True:
+            task = tasks.get()
+            if task is None:
+                return
+
+            run_id, payload = task
+            try:
+                results.put((run_id, index, True, handler(payload)))
+            except Exception as e:
+                results.put((run_id, index, False, f"{type(e).__name__}: {e}\n{traceback.format_exc()}"))
+    finally:
+        close = getattr(handler, "close", None)
+        if close is not None:
+            close()
+
+
+class ProcessWorkerPool:
+    """
+    Fixed set of worker processes, each with its own task queue
+
+    Task i of a map() always goes to worker i, so callers that partition work
+    stably get process affinity (per-process caches and state stay warm).
+    Workers use the spawn start method: the coordinator runs scheduler and
+    writer threads, which fork would copy in an undefined state. A worker that
+    died (e.g. killed for memory) fails its task and is restarted on the next map().
+    """
+
+    def __init__(self, size: int, factory: WorkerFactory, start_method: str = "spawn") -> None:
+        """
+        Initialize pool (processes start lazily on first use)
+
+        Args:
+            size: Number of worker processes
+            factory: Picklable (module-level) function building each worker's task handler
+            start_method: multiprocessing start method
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+
+        self._size = size
+        self._factory = factory
+        # typeshed types get_context() as BaseContext, which lacks Process; every concrete context has it
+        self._context = cast(SpawnContext, multiprocessing.get_context(start_method))
+        self._processes: list[BaseProcess] = []
+        self._tasks: list[Any] = []
+        self._results: Any = None
+        self._run_id = 0
+
+    @property
+    def size(self) -> int:
+        """Number of worker processes"""
+        return self._size
+
+    def start(self) -> None:
+        """Start the worker processes"""
+        if self._processes:
+            return
+
+        self._results = self._context.Queue()
+        for index in range(self._size):
+            self._spawn(index)
+
+        logger.info(f"Started {self._size} worker process(es)")
+
+    def _spawn(self, index: int) -> None:
+        """Start worker index with a fresh task queue, replacing a dead worker"""
+        tasks = self._context.Queue()
+        process = self._context.Process(
+            target=_worker_loop,
+            args=(index, self._factory, tasks, self._results),
+            name=f"worker-{index}",
+            daemon=True,
+        )
+        process.start()
+
+        if index < len(self._processes):
+            self._tasks[index] = tasks
+            self._processes[index] = process
+        else:
+            self._tasks.append(tasks)
+            self._processes.append(process)
+
+    def map(self, payloads: Sequence[Any | None], timeout: float | None = None) -> list[Any]:
+        """
+        Run payload i on worker i and collect the results
+
+        Args:
+            payloads: One payload per worker (None skips that worker)
+            timeout: Overall seconds to wait for all results (None waits forever)
+
+        Returns:
+            Result per payload; a WorkerError in place of failed or unanswered ones (None for skipped)
+        """
+        if len(payloads) != self._size:
+            raise ValueError(f"expected {self._size} payloads, got {len(payloads)}")
+
+        self.start()
+        self._run_id += 1
+        run_id = self._run_id
+
+        results: list[Any] = [None] * self._size
+        pending = set()
+        for index, payload in enumerate(payloads):
+            if payload is None:
+                continue
+            if not self._processes[index].is_alive():
+                logger.warning(f"Worker {index} exited (code {self._processes[index].exitcode}), restarting it")
+                self._spawn(index)
+            self._tasks[index].put((run_id, payload))
+            pending.add(index)
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while pending:
+            wait = _LIVENESS_INTERVAL if deadline is None else min(_LIVENESS_INTERVAL, deadline - time.monotonic())
+            if wait <= 0:
+                break
+            try:
+                answer_run, index, ok, value = self._results.get(timeout=wait)
+            except Empty:
+                self._fail_dead(pending, results)
+                continue
+            if answer_run != run_id:
+                continue  # late answer from a run that already timed out
+            pending.discard(index)
+            results[index] = value if ok else WorkerError(value)
+
+        for index in pending:
+            results[index] = WorkerError(f"worker {index} did not answer within {timeout}s")
+
+        return results
+
+    def _fail_dead(self, pending: set[int], results: list[Any]) -> None:
+        """Stop waiting on workers that died before answering (they are restarted on the next map)"""
+        for index in [index for index in pending if not self._processes[index].is_alive()]:
+            pending.discard(index)
+            exitcode = self._processes[index].exitcode
+            results[index] = WorkerError(f"worker {index} exited (code {exitcode}) before answering")
+
+    def close(self, timeout: float = 10) -> None:
+        """Stop the worker processes (terminating those that do not exit in time)"""
+        for tasks in self._tasks:
+            tasks.put(None)
+        for process in self._processes:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+
+        self._processes.clear()
+        self._tasks.clear()
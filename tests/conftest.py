@@ -5,9 +5,16 @@ from unittest.mock import Mock
 import pytest
 
 from src.domain.interfaces import INotifier, ITicketAnalyzer, ITicketCrawler
+from src.infrastructure.crawler import CtripPageParser
 from tests.fixtures.mock_data import mock_analysis, mock_query_result
 
 
+@pytest.fixture(autouse=True)
+def _forget_train_list_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep the process-wide learned train list path from leaking between tests"""
+    monkeypatch.setattr(CtripPageParser, "_train_list_path", None)
+
+
 @pytest.fixture
 def mock_crawler() -> Mock:
     """Create mock crawler"""
@@ -0,0 +1,100 @@
+"""Unit tests for analysis cache backends"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.infrastructure.analysis_cache import SQLiteAnalysisCache, open_analysis_cache
+from src.infrastructure.cache import TTLCache
+
+
+class TestSQLiteAnalysisCache:
+    """Test SQLiteAnalysisCache"""
+
+    def test_set_and_get(self, tmp_path):
+        """Test stored analyses are returned with hit/miss counters"""
+        cache = SQLiteAnalysisCache(tmp_path / "cache" / "analysis.db", ttl=60)
+
+        assert cache.get("key") is None
+        cache.set("key", ("🎉 Tickets available", "Book now"))
+
+        assert cache.get("key") == ("🎉 Tickets available", "Book now")
+        assert cache.stats() == {"size": 1, "hits": 1, "misses": 1, "hit_rate": 0.5}
+
+    def test_entries_expire(self, tmp_path):
+        """Test an entry is dropped once its TTL has passed"""
+        cache = SQLiteAnalysisCache(tmp_path / "analysis.db", ttl=60)
+
+        with patch("src.infrastructure.analysis_cache.time.time", return_value=1000.0):
+            cache.set("key", ("summary", "recommendation"))
+        with patch("src.infrastructure.analysis_cache.time.time", return_value=1059.0):
+            assert cache.get("key") is not None
+        with patch("src.infrastructure.analysis_cache.time.time", return_value=1060.0):
+            assert cache.get("key") is None
+
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Test entries beyond maxsize are evicted by last access"""
+        cache = SQLiteAnalysisCache(tmp_path / "analysis.db", ttl=60, maxsize=2)
+
+        with patch("src.infrastructure.analysis_cache.time.time") as mock_time:
+            mock_time.return_value = 1.0
+            cache.set("a", ("a", "a"))
+            mock_time.return_value = 2.0
+            cache.set("b", ("b", "b"))
+            mock_time.return_value = 3.0
+            cache.get("a")
+            mock_time.return_value = 4.0
+            cache.set("c", ("c", "c"))
+
+            assert len(cache) == 2
+            assert cache.get("b") is None
+            assert cache.get("a") == ("a", "a")
+            assert cache.get("c") == ("c", "c")
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test a new process (instance) sees analyses cached by the previous one"""
+        SQLiteAnalysisCache(tmp_path / "analysis.db", ttl=60).set("key", ("summary", "recommendation"))
+
+        assert SQLiteAnalysisCache(tmp_path / "analysis.db", ttl=60).get("key") == ("summary", "recommendation")
+
+    def test_zero_ttl_disables_caching(self, tmp_path):
+        """Test nothing is stored with ttl=0"""
+        cache = SQLiteAnalysisCache(tmp_path / "analysis.db", ttl=0)
+
+        cache.set("key", ("summary", "recommendation"))
+
+        assert not cache.enabled
+        assert cache.get("key") is None
+
+    def test_invalid_maxsize(self, tmp_path):
+        """Test maxsize must be positive"""
+        with pytest.raises(ValueError):
+            SQLiteAnalysisCache(tmp_path / "analysis.db", ttl=60, maxsize=0)
+
+
+class TestOpenAnalysisCache:
+    """Test open_analysis_cache"""
+
+    def test_memory_backend(self):
+        """Test the memory backend is an in-process TTL cache"""
+        assert isinstance(open_analysis_cache("memory", ttl=60), TTLCache)
+
+    def test_sqlite_backend(self, tmp_path):
+        """Test the sqlite backend opens the database at path"""
+        cache = open_analysis_cache("sqlite", ttl=60, path=str(tmp_path / "analysis.db"))
+
+        assert isinstance(cache, SQLiteAnalysisCache)
+        assert (tmp_path / "analysis.db").exists()
+
+    def test_sqlite_backend_requires_path(self):
+        """Test the sqlite backend without a path is rejected"""
+        with pytest.raises(ValueError):
+            open_analysis_cache("sqlite", ttl=60)
+
+    def test_zero_ttl_disables(self, tmp_path):
+        """Test ttl=0 disables the cache for every backend"""
+        assert open_analysis_cache("memory", ttl=0) is None
+        assert open_analysis_cache("sqlite", ttl=0, path=str(tmp_path / "analysis.db")) is None
+        assert not (tmp_path / "analysis.db").exists()
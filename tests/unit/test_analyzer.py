@@ -2,11 +2,13 @@
 
 from unittest.mock import Mock, patch
 
+import httpx
 import pytest
-from openai import OpenAI
+from openai import APIConnectionError, OpenAI
 
 from src.domain.exceptions import AnalyzerException
 from src.infrastructure.analyzer import DeepSeekAnalyzer
+from src.infrastructure.cache import TTLCache
 from tests.fixtures.mock_data import mock_query_result
 
 
@@ -92,6 +94,36 @@ class TestDeepSeekAnalyzer:
         assert analysis.has_ticket is True
         assert analysis.raw_data == result
 
+    def test_connection_error_fails_health_check(self):
+        """Test an API call that cannot connect marks the analyzer unhealthy until one succeeds"""
+        analyzer = DeepSeekAnalyzer(api_key="test-key")
+        analyzer._client = Mock()
+        analyzer._client.chat.completions.create.side_effect = APIConnectionError(
+            request=httpx.Request("POST", "https://api.deepseek.com/chat/completions")
+        )
+        assert analyzer.healthy()
+
+        analysis = analyzer.analyze(mock_query_result(has_tickets=True))
+        assert analysis.has_ticket is True
+        assert not analyzer.healthy()
+
+        analyzer._client.chat.completions.create.side_effect = None
+        analyzer._client.chat.completions.create.return_value = Mock(
+            choices=[Mock(message=Mock(content="Summary\n\nBook now"))]
+        )
+        analyzer.analyze(mock_query_result(has_tickets=True))
+        assert analyzer.healthy()
+
+    def test_close(self):
+        """Test close releases the API client and fails the health check"""
+        analyzer = DeepSeekAnalyzer(api_key="test-key")
+        analyzer._client = Mock()
+
+        analyzer.close()
+
+        analyzer._client.close.assert_called_once()
+        assert not analyzer.healthy()
+
     def test_analyzer_missing_api_key(self):
         """Test missing API key"""
         # DeepSeek analyzer can be created but may fail when called
@@ -136,3 +168,67 @@ class TestAnalyzerConfiguration:
             # OpenAI client initialized successfully
             assert analyzer._client is not None
 
+
+class TestAnalysisCache:
+    """Test AI analysis caching by seat state"""
+
+    @pytest.fixture
+    def analyzer(self):
+        """Analyzer with a mocked API client and an in-memory cache"""
+        analyzer = DeepSeekAnalyzer(api_key="test-key", analysis_cache=TTLCache(ttl=60))
+        analyzer._client = Mock()
+        analyzer._client.chat.completions.create.return_value = Mock(
+            choices=[Mock(message=Mock(content="Summary\n\nBook now"))]
+        )
+        return analyzer
+
+    @staticmethod
+    def _with_seats(result, **changes):
+        """Query result whose first seat is changed"""
+        train = result.trains[0]
+        seats = [train.seats[0].model_copy(update=changes), *train.seats[1:]]
+        return result.model_copy(update={"trains": [train.model_copy(update={"seats": seats})]})
+
+    def test_same_seat_state_skips_api(self, analyzer):
+        """Test a repeated seat state is answered from the cache"""
+        first = analyzer.analyze(mock_query_result(has_tickets=True))
+        second = analyzer.analyze(mock_query_result(has_tickets=True))
+
+        assert analyzer._client.chat.completions.create.call_count == 1
+        assert (second.summary, second.recommendation) == (first.summary, first.recommendation)
+
+    def test_seat_order_does_not_matter(self, analyzer):
+        """Test the key is canonical over seat order"""
+        result = mock_query_result(has_tickets=True)
+        train = result.trains[0]
+        reordered = train.model_copy(update={"seats": list(reversed(train.seats))})
+
+        assert analyzer._cache_key(train) == analyzer._cache_key(reordered)
+
+    def test_inventory_within_bucket_reuses_analysis(self, analyzer):
+        """Test inventory changes inside one bucket keep the key, crossing a bucket changes it"""
+        result = self._with_seats(mock_query_result(has_tickets=True), inventory=7)
+        train = result.trains[0]
+
+        assert analyzer._cache_key(train) == analyzer._cache_key(self._with_seats(result, inventory=12).trains[0])
+        assert analyzer._cache_key(train) != analyzer._cache_key(self._with_seats(result, inventory=3).trains[0])
+        assert analyzer._cache_key(train) != analyzer._cache_key(self._with_seats(result, inventory=0).trains[0])
+
+    def test_price_and_bookable_change_key(self, analyzer):
+        """Test price or bookability changes are analyzed again"""
+        result = mock_query_result(has_tickets=True)
+        train = result.trains[0]
+
+        assert analyzer._cache_key(train) != analyzer._cache_key(self._with_seats(result, price=99).trains[0])
+        assert analyzer._cache_key(train) != analyzer._cache_key(self._with_seats(result, bookable=False).trains[0])
+
+    def test_fallback_not_cached(self, analyzer):
+        """Test a failed API call is retried on the next poll"""
+        response = analyzer._client.chat.completions.create.return_value
+        analyzer._client.chat.completions.create.side_effect = [Exception("API Error"), response]
+
+        analyzer.analyze(mock_query_result(has_tickets=True))
+        analysis = analyzer.analyze(mock_query_result(has_tickets=True))
+
+        assert analyzer._client.chat.completions.create.call_count == 2
+        assert analysis.summary == "Summary"
@@ -0,0 +1,276 @@
+"""Unit tests for AsyncCtripTicketCrawler"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+
+from src.domain.exceptions import CrawlerException
+from src.domain.models import TicketQuery
+from src.infrastructure.async_crawler import AsyncCtripTicketCrawler
+from src.infrastructure.latency import LatencyTracker
+from src.infrastructure.rate_limiter import AdaptiveRateLimiter
+from tests.fixtures.mock_data import mock_ticket_query
+
+NEXT_DATA_HTML = """
+<html>
+    <head>
+        <script id="__NEXT_DATA__" type="application/json">
+        {"props": {"pageProps": {"trainInfoList": [{
+            "trainNumber": "C3380",
+            "departureStationName": "Dayi",
+            "arrivalStationName": "Chengdu South",
+            "departureTime": "08:00",
+            "arrivalTime": "09:00",
+            "duration": "01:00",
+            "startPrice": 15,
+            "seatItemInfoList": [
+                {"seatName": "二等座", "seatPrice": 15, "seatInventory": 99, "seatBookable": true}
+            ]
+        }]}}}
+        </script>
+    </head>
+</html>
+"""
+
+
+def mock_response(text: str = NEXT_DATA_HTML, status_code: int = 200) -> Mock:
+    """Create mock httpx response"""
+    response = Mock()
+    response.status_code = status_code
+    response.text = text
+    if status_code >= 400:
+        response.raise_for_status.side_effect = httpx.HTTPStatusError("error", request=Mock(), response=response)
+    return response
+
+
+class TestAsyncCtripTicketCrawler:
+    """Test async Ctrip ticket crawler"""
+
+    def test_crawler_initialization(self):
+        """Test crawler initialization"""
+        crawler = AsyncCtripTicketCrawler(timeout=5, max_concurrency=4)
+
+        assert crawler._timeout == 5
+        assert crawler._max_concurrency == 4
+        assert "User-Agent" in crawler._client.headers
+
+    def test_invalid_concurrency(self):
+        """Test concurrency limit must be positive"""
+        with pytest.raises(ValueError):
+            AsyncCtripTicketCrawler(max_concurrency=0)
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient.get", new_callable=AsyncMock)
+    async def test_fetch_tickets_success(self, mock_get):
+        """Test successful ticket fetching"""
+        mock_get.return_value = mock_response()
+
+        async with AsyncCtripTicketCrawler() as crawler:
+            result = await crawler.fetch_tickets(mock_ticket_query())
+
+        assert len(result.trains) == 1
+        assert result.trains[0].train_number == "C3380"
+        params = mock_get.call_args.kwargs["params"]
+        assert params["dStation"] == "大邑"
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient.get", new_callable=AsyncMock)
+    async def test_fetch_tickets_http_error(self, mock_get):
+        """Test HTTP error is wrapped in CrawlerException"""
+        mock_get.return_value = mock_response(status_code=500)
+
+        crawler = AsyncCtripTicketCrawler()
+
+        with pytest.raises(CrawlerException) as exc_info:
+            await crawler.fetch_tickets(mock_ticket_query())
+
+        assert "Failed to fetch" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_fetch_tickets_timeout(self):
+        """Test per-request timeout"""
+
+        async def slow_get(*args, **kwargs):
+            await asyncio.sleep(1)
+            return mock_response()
+
+        crawler = AsyncCtripTicketCrawler(timeout=0.01)
+
+        with patch.object(crawler._client, "get", side_effect=slow_get):
+            with pytest.raises(CrawlerException):
+                await crawler.fetch_tickets(mock_ticket_query())
+
+    @pytest.mark.asyncio
+    async def test_fetch_many_preserves_order(self):
+        """Test fetch_many returns results in query order"""
+        dates = ["2024-11-17", "2024-11-18", "2024-11-19"]
+        queries = [
+            TicketQuery(departure_station="大邑", arrival_station="成都南", departure_date=date) for date in dates
+        ]
+
+        crawler = AsyncCtripTicketCrawler()
+
+        with patch.object(crawler._client, "get", new_callable=AsyncMock, return_value=mock_response()):
+            results = await crawler.fetch_many(queries)
+
+        assert [result.query.departure_date for result in results] == dates
+
+    @pytest.mark.asyncio
+    async def test_fetch_many_respects_concurrency_limit(self):
+        """Test no more than max_concurrency requests are in flight"""
+        in_flight = 0
+        peak = 0
+
+        async def tracked_get(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return mock_response()
+
+        crawler = AsyncCtripTicketCrawler(max_concurrency=2)
+        queries = [mock_ticket_query() for _ in range(6)]
+
+        with patch.object(crawler._client, "get", side_effect=tracked_get):
+            results = await crawler.fetch_many(queries)
+
+        assert len(results) == 6
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_fetch_many_return_exceptions(self):
+        """Test failures are returned in place when requested"""
+        crawler = AsyncCtripTicketCrawler()
+        responses = [mock_response(), mock_response(status_code=503)]
+
+        with patch.object(crawler._client, "get", new_callable=AsyncMock, side_effect=responses):
+            results = await crawler.fetch_many([mock_ticket_query(), mock_ticket_query()], return_exceptions=True)
+
+        assert results[0].trains[0].train_number == "C3380"
+        assert isinstance(results[1], CrawlerException)
+
+    @pytest.mark.asyncio
+    async def test_fetch_tickets_streaming(self):
+        """Test streaming mode stops reading once __NEXT_DATA__ is complete"""
+        body = NEXT_DATA_HTML.encode() + b"<body>" + b"x" * 1000 + b"</body>"
+        consumed = []
+
+        async def aiter_bytes():
+            for i in range(0, len(body), 64):
+                consumed.append(i)
+                yield body[i : i + 64]
+
+        response = Mock()
+        response.aiter_bytes = aiter_bytes
+        stream_context = AsyncMock()
+        stream_context.__aenter__.return_value = response
+
+        crawler = AsyncCtripTicketCrawler(stream=True)
+
+        with patch.object(crawler._client, "stream", return_value=stream_context):
+            result = await crawler.fetch_tickets(mock_ticket_query())
+
+        assert result.trains[0].train_number == "C3380"
+        assert len(consumed) < len(range(0, len(body), 64))
+
+
+class TestAsyncHedgedRequests:
+    """Test async hedged requests"""
+
+    @staticmethod
+    def tracker(seconds: float) -> LatencyTracker:
+        """Tracker already holding enough samples of the given latency"""
+        tracker = LatencyTracker(min_samples=1)
+        tracker.record("trains.ctrip.com", seconds)
+        return tracker
+
+    @pytest.mark.asyncio
+    async def test_slow_response_is_hedged_and_loser_cancelled(self):
+        """Test the faster of two requests wins and the slow one is cancelled"""
+        cancelled = asyncio.Event()
+        calls = 0
+
+        async def get(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                try:
+                    await asyncio.sleep(1)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+            return mock_response()
+
+        crawler = AsyncCtripTicketCrawler(hedge_percentile=95, latency_tracker=self.tracker(0.01))
+
+        with patch.object(crawler._client, "get", side_effect=get):
+            result = await crawler.fetch_tickets(mock_ticket_query())
+            await asyncio.sleep(0)
+
+        assert result.trains[0].train_number == "C3380"
+        assert crawler.hedges == 1
+        assert cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_loser_latency_and_slot(self):
+        """Test the cancelled loser is timed and the hedge returns its rate limit slot"""
+        calls = 0
+
+        async def get(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            if calls == 2:
+                await asyncio.sleep(1)
+            return mock_response()
+
+        async def slow_get(*args, **kwargs):
+            await asyncio.sleep(0.05)
+            return await get()
+
+        tracker = self.tracker(0.01)
+        limiter = AdaptiveRateLimiter("trains.ctrip.com", rate=100, burst=4, initial_concurrency=4)
+        crawler = AsyncCtripTicketCrawler(hedge_percentile=95, latency_tracker=tracker, rate_limiter=limiter)
+
+        with patch.object(crawler._client, "get", side_effect=slow_get):
+            await crawler.fetch_tickets(mock_ticket_query())
+            await asyncio.sleep(0)
+
+        metrics = limiter.metrics()
+        assert crawler.hedges == 1
+        # Seed sample, the winner and the cancelled hedge
+        assert tracker.stats("trains.ctrip.com")["samples"] == 3
+        assert metrics["acquired"] == 2
+        assert metrics["cancelled"] == 1
+        assert metrics["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_without_rate_limit_token(self):
+        """Test a slow request is not hedged when the limiter has no token to spare"""
+
+        async def get(*args, **kwargs):
+            await asyncio.sleep(0.05)
+            return mock_response()
+
+        limiter = AdaptiveRateLimiter("trains.ctrip.com", rate=0.1, burst=1)
+        crawler = AsyncCtripTicketCrawler(hedge_percentile=95, latency_tracker=self.tracker(0.01), rate_limiter=limiter)
+
+        with patch.object(crawler._client, "get", side_effect=get) as mock_get:
+            result = await crawler.fetch_tickets(mock_ticket_query())
+
+        assert mock_get.call_count == 1
+        assert crawler.hedges == 0
+        assert result.trains[0].train_number == "C3380"
+
+    @pytest.mark.asyncio
+    async def test_fast_response_is_not_hedged(self):
+        """Test requests faster than the hedge delay are sent once"""
+        crawler = AsyncCtripTicketCrawler(hedge_percentile=95, latency_tracker=self.tracker(1.0))
+
+        with patch.object(crawler._client, "get", new_callable=AsyncMock, return_value=mock_response()) as mock_get:
+            await crawler.fetch_tickets(mock_ticket_query())
+
+        assert mock_get.call_count == 1
+        assert crawler.hedges == 0
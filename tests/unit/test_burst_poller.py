@@ -0,0 +1,160 @@
+"""Unit tests for BurstPoller"""
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.application.burst_poller import AsyncBurstPoller, BurstPoller, has_available_seat
+from tests.fixtures.mock_data import mock_query_result, mock_ticket_query
+
+
+class TestNextRelease:
+    """Test release instant calculation"""
+
+    def test_release_later_today(self):
+        """Test a release later today is used"""
+        now = datetime(2024, 11, 4, 15, 29, 55)
+
+        assert BurstPoller.next_release(15, 30, now) == datetime(2024, 11, 4, 15, 30)
+
+    def test_recent_release_is_current(self):
+        """Test a release within the grace period is still current"""
+        now = datetime(2024, 11, 4, 15, 31)
+
+        assert BurstPoller.next_release(15, 30, now) == datetime(2024, 11, 4, 15, 30)
+
+    def test_past_release_rolls_to_tomorrow(self):
+        """Test a long-past release targets tomorrow"""
+        now = datetime(2024, 11, 4, 23, 59, 55)
+
+        assert BurstPoller.next_release(0, 0, now) == datetime(2024, 11, 5, 0, 0)
+
+    def test_release_second(self):
+        """Test a learned release second is kept"""
+        now = datetime(2024, 11, 4, 15, 29, 55)
+
+        assert BurstPoller.next_release(15, 30, now, second=42) == datetime(2024, 11, 4, 15, 30, 42)
+
+
+class TestBurstPoller:
+    """Test burst polling"""
+
+    def test_invalid_interval(self):
+        """Test interval must be positive"""
+        with pytest.raises(ValueError):
+            BurstPoller(Mock(), interval=0)
+
+    def test_polls_until_tickets_appear(self):
+        """Test polling stops at the first result with tickets"""
+        crawler = Mock()
+        crawler.fetch_tickets.side_effect = [
+            mock_query_result(has_tickets=False),
+            mock_query_result(has_tickets=False),
+            mock_query_result(has_tickets=True),
+        ]
+        poller = BurstPoller(crawler, interval=0.01, lead_seconds=0, window_seconds=5)
+        release_at = datetime.now()
+
+        burst = poller.poll(mock_ticket_query(), release_at)
+
+        assert burst.detected
+        assert burst.polls == 3
+        assert burst.result.trains[0].train_number == "C3380"
+        assert 0 <= burst.detection_latency < 1
+
+    def test_every_poll_is_recorded(self):
+        """Test each successful poll is handed to the snapshot store"""
+        crawler = Mock()
+        crawler.fetch_tickets.side_effect = [
+            mock_query_result(has_tickets=False),
+            RuntimeError("blocked"),
+            mock_query_result(has_tickets=True),
+        ]
+        store = Mock()
+        poller = BurstPoller(crawler, interval=0.01, lead_seconds=0, window_seconds=5, snapshot_store=store)
+
+        poller.poll(mock_ticket_query(), datetime.now())
+
+        assert store.record.call_count == 2
+
+    def test_window_closes_without_tickets(self):
+        """Test polling ends when the window closes"""
+        crawler = Mock()
+        crawler.fetch_tickets.return_value = mock_query_result(has_tickets=False)
+        poller = BurstPoller(crawler, interval=0.02, lead_seconds=0, window_seconds=0.1)
+
+        burst = poller.poll(mock_ticket_query(), datetime.now())
+
+        assert not burst.detected
+        assert burst.detection_latency is None
+        assert 1 <= burst.polls <= 6
+
+    def test_errors_do_not_stop_polling(self):
+        """Test failed polls are counted and polling continues"""
+        crawler = Mock()
+        crawler.fetch_tickets.side_effect = [Exception("Network error"), mock_query_result(has_tickets=True)]
+        poller = BurstPoller(crawler, interval=0.01, lead_seconds=0, window_seconds=5)
+
+        burst = poller.poll(mock_ticket_query(), datetime.now())
+
+        assert burst.detected
+        assert burst.errors == 1
+        assert burst.polls == 2
+
+    def test_waits_for_lead_time(self):
+        """Test polling starts lead_seconds before the release instant"""
+        crawler = Mock()
+        crawler.fetch_tickets.return_value = mock_query_result(has_tickets=True)
+        poller = BurstPoller(crawler, interval=0.01, lead_seconds=0.05, window_seconds=5)
+        release_at = datetime.now() + timedelta(seconds=0.15)
+
+        burst = poller.poll(mock_ticket_query(), release_at)
+
+        # Started ~0.05s before the release, so detection precedes it
+        assert -0.1 < burst.detection_latency < 0
+
+    def test_has_available_seat(self):
+        """Test availability requires a bookable seat"""
+        assert has_available_seat(mock_query_result(has_tickets=True))
+        assert not has_available_seat(mock_query_result(has_tickets=False))
+
+
+class TestAsyncBurstPoller:
+    """Test burst polling from a coroutine"""
+
+    def test_invalid_interval(self):
+        """Test interval must be positive"""
+        with pytest.raises(ValueError):
+            AsyncBurstPoller(Mock(), interval=0)
+
+    @pytest.mark.asyncio
+    async def test_polls_until_tickets_appear(self):
+        """Test polling stops at the first result with tickets, counting failed polls"""
+        crawler = Mock()
+        crawler.fetch_tickets = AsyncMock(
+            side_effect=[
+                mock_query_result(has_tickets=False),
+                Exception("Network error"),
+                mock_query_result(has_tickets=True),
+            ]
+        )
+        poller = AsyncBurstPoller(crawler, interval=0.01, lead_seconds=0, window_seconds=5)
+
+        burst = await poller.poll(mock_ticket_query(), datetime.now())
+
+        assert burst.detected
+        assert burst.polls == 3
+        assert burst.errors == 1
+
+    @pytest.mark.asyncio
+    async def test_window_closes_without_tickets(self):
+        """Test polling gives up once the window has passed"""
+        crawler = Mock()
+        crawler.fetch_tickets = AsyncMock(return_value=mock_query_result(has_tickets=False))
+        poller = AsyncBurstPoller(crawler, interval=0.02, lead_seconds=0, window_seconds=0.1)
+
+        burst = await poller.poll(mock_ticket_query(), datetime.now())
+
+        assert not burst.detected
+        assert 1 <= burst.polls <= 6
@@ -0,0 +1,91 @@
+"""Unit tests for TTLCache"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.infrastructure.cache import TTLCache
+
+
+class TestTTLCache:
+    """Test TTL cache"""
+
+    def test_set_and_get(self):
+        """Test cached values are returned"""
+        cache = TTLCache(ttl=10)
+
+        cache.set("key", "value")
+
+        assert cache.get("key") == "value"
+        assert len(cache) == 1
+
+    def test_missing_key(self):
+        """Test missing keys return None"""
+        cache = TTLCache(ttl=10)
+
+        assert cache.get("missing") is None
+
+    @patch("src.infrastructure.cache.time.monotonic")
+    def test_entry_expires(self, mock_monotonic):
+        """Test entries expire after the TTL"""
+        mock_monotonic.return_value = 100.0
+        cache = TTLCache(ttl=5)
+        cache.set("key", "value")
+
+        mock_monotonic.return_value = 104.9
+        assert cache.get("key") == "value"
+
+        mock_monotonic.return_value = 105.0
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        """Test least recently used entry is evicted when full"""
+        cache = TTLCache(ttl=10, maxsize=2)
+
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" becomes least recently used
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_hit_miss_counters(self):
+        """Test hit and miss counters"""
+        cache = TTLCache(ttl=10)
+        cache.set("key", "value")
+
+        cache.get("key")
+        cache.get("key")
+        cache.get("other")
+
+        assert cache.hits == 2
+        assert cache.misses == 1
+        stats = cache.stats()
+        assert stats["size"] == 1
+        assert stats["hit_rate"] == pytest.approx(2 / 3)
+
+    def test_zero_ttl_disables_cache(self):
+        """Test ttl=0 stores nothing"""
+        cache = TTLCache(ttl=0)
+
+        cache.set("key", "value")
+
+        assert cache.enabled is False
+        assert cache.get("key") is None
+
+    def test_clear(self):
+        """Test clear removes entries"""
+        cache = TTLCache(ttl=10)
+        cache.set("key", "value")
+
+        cache.clear()
+
+        assert len(cache) == 0
+
+    def test_invalid_maxsize(self):
+        """Test maxsize must be positive"""
+        with pytest.raises(ValueError):
+            TTLCache(ttl=10, maxsize=0)
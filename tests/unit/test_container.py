@@ -1,17 +1,22 @@
 """Unit tests for Dependency Injection Container"""
 
 import os
+import subprocess
+import sys
 from unittest.mock import patch
 
 import pytest
 
+from src.application.burst_poller import AsyncBurstPoller, BurstPoller
 from src.application.ticket_service import TicketMonitorService
 from src.config.settings import Settings
-from src.container import Container
+from src.container import Container, shared_clients
 from src.infrastructure.analyzer import DeepSeekAnalyzer
+from src.infrastructure.async_crawler import AsyncCtripTicketCrawler
+from src.infrastructure.cache import TTLCache
 from src.infrastructure.crawler import CtripTicketCrawler
 from src.infrastructure.notifier import EmailNotifier
-from src.infrastructure.scheduler import APSchedulerWrapper
+from src.infrastructure.scheduler import APSchedulerWrapper, AsyncIOSchedulerWrapper
 
 
 class TestContainer:
@@ -90,6 +95,64 @@ class TestContainer:
 
             assert crawler._timeout == 30
 
+    def test_crawlers_share_response_cache(self, container):
+        """Test crawler instances share one response cache"""
+        crawler1 = container.crawler()
+        crawler2 = container.crawler()
+        async_crawler = container.async_crawler()
+
+        assert crawler1._response_cache is not None
+        assert crawler1._response_cache is crawler2._response_cache
+        assert async_crawler._response_cache is crawler1._response_cache
+
+    def test_crawlers_share_rate_limiter(self, container):
+        """Test crawler instances share one limiter for the Ctrip host"""
+        crawler = container.crawler()
+        async_crawler = container.async_crawler()
+
+        assert crawler._rate_limiter is not None
+        assert crawler._rate_limiter is async_crawler._rate_limiter
+        assert crawler._rate_limiter.host == "trains.ctrip.com"
+
+    def test_burst_poller_crawler_can_bypass_cache(self, container):
+        """Test burst pollers get a crawler without the shared response cache"""
+        poller = container.burst_poller(crawler=container.crawler(response_cache=None))
+
+        assert isinstance(poller, BurstPoller)
+        assert poller._crawler._response_cache is None
+        assert poller._crawler._rate_limiter is not None
+
+    def test_async_burst_poller(self, container):
+        """Test async burst pollers get an async crawler"""
+        poller = container.async_burst_poller()
+
+        assert isinstance(poller, AsyncBurstPoller)
+        assert poller._crawler._rate_limiter is container.rate_limiter()
+
+    def test_snapshot_store_disabled_by_default(self, container):
+        """Test no snapshot store is opened without SNAPSHOT_DB_PATH"""
+        assert container.snapshot_store() is None
+        assert container.ticket_service()._snapshot_store is None
+
+    def test_snapshot_store_closed_only_if_opened(self, container):
+        """Test shutdown does not open an unused snapshot store, and closes an opened one"""
+        with patch("src.container.open_snapshot_store") as mock_open:
+            container.shutdown_resources()
+            assert mock_open.call_count == 0
+
+            store = container.snapshot_store()
+            container.shutdown_resources()
+
+        store.close.assert_called_once()
+
+    def test_async_crawler_provider(self, container):
+        """Test async crawler provider"""
+        crawler = container.async_crawler()
+
+        assert isinstance(crawler, AsyncCtripTicketCrawler)
+        assert crawler._timeout == 10
+        assert crawler._max_concurrency == 8
+
     def test_analyzer_provider(self, container):
         """Test analyzer provider"""
         analyzer = container.analyzer()
@@ -98,6 +161,14 @@ class TestContainer:
         assert analyzer._model == "deepseek-chat"
         assert analyzer._client is not None
 
+    def test_analyzers_share_analysis_cache(self, container):
+        """Test analyzer instances share one in-memory analysis cache by default"""
+        analyzer1 = container.analyzer()
+        analyzer2 = container.analyzer()
+
+        assert isinstance(analyzer1._analysis_cache, TTLCache)
+        assert analyzer1._analysis_cache is analyzer2._analysis_cache
+
     def test_analyzer_factory(self, container):
         """Test analyzer is factory"""
         analyzer1 = container.analyzer()
@@ -137,6 +208,26 @@ class TestContainer:
 
         assert scheduler1 is scheduler2
 
+    def test_asyncio_scheduler_backend(self):
+        """Test SCHEDULER_BACKEND=asyncio selects the asyncio scheduler"""
+        with patch.dict(
+            os.environ,
+            {
+                "SCHEDULER_BACKEND": "asyncio",
+                "DEEPSEEK_API_KEY": "test-key",
+                "SMTP_HOST": "smtp.test.com",
+                "SMTP_USER": "test@test.com",
+                "SMTP_PASSWORD": "test-password",
+                "EMAIL_FROM": "from@test.com",
+                "EMAIL_TO": '["to@test.com"]',
+            },
+            clear=True,
+        ):
+            container = Container()
+
+            assert isinstance(container.scheduler(), AsyncIOSchedulerWrapper)
+            assert container.scheduler() is container.scheduler()
+
     def test_ticket_service_provider(self, container):
         """Test ticket service provider"""
         service = container.ticket_service()
@@ -188,3 +279,49 @@ class TestContainer:
         assert scheduler is not None
         assert service is not None
 
+    def test_shared_clients_reused_across_runs(self, container):
+        """Test long-running mode hands every run the same clients"""
+        first = shared_clients(container)
+        second = shared_clients(container)
+
+        assert isinstance(first["crawler"], CtripTicketCrawler)
+        assert isinstance(first["analyzer"], DeepSeekAnalyzer)
+        assert isinstance(first["notifier"], EmailNotifier)
+        assert all(second[name] is client for name, client in first.items())
+        assert container.ticket_service(**second)._crawler is first["crawler"]
+
+    def test_unhealthy_shared_client_recreated(self, container):
+        """Test a client failing its health check is closed and replaced"""
+        crawler = shared_clients(container)["crawler"]
+        analyzer = shared_clients(container)["analyzer"]
+        crawler._connection_failed = True
+
+        clients = shared_clients(container)
+
+        assert clients["crawler"] is not crawler
+        assert clients["crawler"].healthy()
+        assert crawler._closed
+        assert clients["analyzer"] is analyzer
+
+    def test_shutdown_resources_closes_shared_clients(self, container):
+        """Test shutting the container down closes the long-lived clients"""
+        clients = shared_clients(container)
+
+        container.shutdown_resources()
+
+        assert not clients["crawler"].healthy()
+        assert not clients["analyzer"].healthy()
+        assert shared_clients(container)["crawler"] is not clients["crawler"]
+
+    def test_adapters_imported_on_first_resolve(self):
+        """Test importing the container loads no heavy adapter dependency until its provider is resolved"""
+        code = (
+            "import sys\n"
+            "from src.container import Container\n"
+            "Container()\n"
+            "heavy = ['openai', 'requests', 'bs4', 'httpx', 'apscheduler', 'numpy']\n"
+            "print(','.join(name for name in heavy if name in sys.modules))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        assert result.stdout.strip() == ""
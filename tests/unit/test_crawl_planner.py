@@ -0,0 +1,124 @@
+"""Unit tests for CrawlPlanner"""
+
+from unittest.mock import Mock
+
+from src.application.crawl_planner import CrawlPlanner
+from src.domain.models import TicketQueryResult, WatchTarget
+from tests.fixtures.mock_data import mock_trains
+
+
+def resolve_date(days_ahead: int) -> str:
+    """Deterministic date resolver for tests"""
+    return f"2024-11-{days_ahead:02d}"
+
+
+def target(train_number: str = "C3380", days_ahead: int = 15, arrival: str = "成都南") -> WatchTarget:
+    """Create watch target"""
+    return WatchTarget(
+        departure_station="大邑",
+        arrival_station=arrival,
+        train_number=train_number,
+        days_ahead=days_ahead,
+    )
+
+
+def page_result(query, train_numbers) -> TicketQueryResult:
+    """List page result holding one train per requested train number"""
+    trains = [train.model_copy(update={"train_number": number}) for number in train_numbers for train in mock_trains()]
+    return TicketQueryResult(query=query, trains=trains)
+
+
+class TestCrawlPlanCompile:
+    """Test compiling watch targets into list page requests"""
+
+    def test_trains_on_same_page_share_one_request(self):
+        """Test several trains on one route and date compile to one request"""
+        plan = CrawlPlanner.compile([target("C3380"), target("C3382"), target("G1")], resolve_date)
+
+        assert len(plan) == 1
+        assert plan.target_count == 3
+        query = plan.queries[0]
+        assert query.train_number is None
+        assert query.departure_date == "2024-11-15"
+        assert plan.train_numbers(query) == ["C3380", "C3382", "G1"]
+
+    def test_distinct_routes_and_dates(self):
+        """Test request count grows with routes x dates"""
+        targets = [
+            target("C3380", days_ahead=15),
+            target("C3382", days_ahead=15),
+            target("C3380", days_ahead=16),
+            target("C3380", days_ahead=15, arrival="成都"),
+        ]
+
+        plan = CrawlPlanner.compile(targets, resolve_date)
+
+        assert len(plan) == 3
+        assert plan.target_count == 4
+
+    def test_duplicate_targets_are_merged(self):
+        """Test identical targets are planned once"""
+        plan = CrawlPlanner.compile([target(), target()], resolve_date)
+
+        assert plan.target_count == 1
+
+    def test_dates_resolved_once_per_days_ahead(self):
+        """Test the date resolver is called once per distinct days_ahead"""
+        resolver = Mock(side_effect=resolve_date)
+
+        CrawlPlanner.compile([target("C1"), target("C2"), target("C3", days_ahead=3)], resolver)
+
+        assert resolver.call_count == 2
+
+
+class TestCrawlPlanExecute:
+    """Test running a plan and fanning results out"""
+
+    def test_one_fetch_per_page_fanned_out_to_targets(self):
+        """Test each target gets its own narrowed result from the shared page"""
+        fetch = Mock(side_effect=page_result)
+        planner = CrawlPlanner(fetch)
+        targets = [target("C3380"), target("C3382")]
+
+        results = planner.run(targets, resolve_date)
+
+        assert fetch.call_count == 1
+        for watched in targets:
+            result = results[watched]
+            assert result.query.train_number == watched.train_number
+            assert result.query.departure_date == "2024-11-15"
+            assert [train.train_number for train in result.trains] == [watched.train_number]
+
+    def test_failed_page_is_reported_for_its_targets(self):
+        """Test a failing page fails only the targets that depend on it"""
+        error = Exception("Network error")
+
+        def fetch(query, train_numbers):
+            if query.departure_date == "2024-11-16":
+                raise error
+            return page_result(query, train_numbers)
+
+        planner = CrawlPlanner(fetch)
+        ok, failed = target(days_ahead=15), target(days_ahead=16)
+
+        results = planner.run([ok, failed], resolve_date)
+
+        assert isinstance(results[ok], TicketQueryResult)
+        assert results[failed] is error
+
+    def test_unchanged_flag_is_preserved(self):
+        """Test fanned-out results keep the page's unchanged flag"""
+
+        def fetch(query, train_numbers):
+            return page_result(query, train_numbers).model_copy(update={"unchanged": True})
+
+        results = CrawlPlanner(fetch).run([target()], resolve_date)
+
+        assert results[target()].unchanged
+
+    def test_empty_plan(self):
+        """Test an empty watch list sends no requests"""
+        fetch = Mock()
+
+        assert CrawlPlanner(fetch).run([], resolve_date) == {}
+        assert fetch.call_count == 0
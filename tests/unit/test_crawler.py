@@ -1,12 +1,17 @@
 """Unit tests for CtripTicketCrawler"""
 
-from unittest.mock import Mock, patch
+import time
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 import requests
 
 from src.domain.exceptions import CrawlerException
-from src.infrastructure.crawler import CtripTicketCrawler
+from src.infrastructure.async_crawler import AsyncCtripTicketCrawler
+from src.infrastructure.cache import TTLCache
+from src.infrastructure.crawler import CtripTicketCrawler, NextDataStreamScanner
+from src.infrastructure.latency import LatencyTracker
+from src.infrastructure.rate_limiter import AdaptiveRateLimiter
 from tests.fixtures.mock_data import mock_ticket_query
 
 
@@ -152,6 +157,49 @@ class TestCrawlerErrorHandling:
         assert result.query == query
 
 
+class TestCrawlerLifecycle:
+    """Test health check and close (long-running mode)"""
+
+    @patch("requests.Session.get")
+    def test_connection_error_fails_health_check(self, mock_get):
+        """Test a request that cannot connect marks the crawler unhealthy until one succeeds"""
+        crawler = CtripTicketCrawler()
+        assert crawler.healthy()
+
+        mock_get.side_effect = requests.ConnectionError("Connection reset")
+        with pytest.raises(CrawlerException):
+            crawler.fetch_tickets(mock_ticket_query())
+        assert not crawler.healthy()
+
+        mock_get.side_effect = None
+        mock_get.return_value = Mock(status_code=200, text="<html></html>")
+        crawler.fetch_tickets(mock_ticket_query())
+        assert crawler.healthy()
+
+    @patch("requests.Session.get")
+    def test_http_error_keeps_crawler_healthy(self, mock_get):
+        """Test an error response does not count as a broken connection"""
+        mock_response = Mock()
+        mock_response.raise_for_status.side_effect = requests.HTTPError("503")
+        mock_get.return_value = mock_response
+
+        crawler = CtripTicketCrawler()
+        with pytest.raises(CrawlerException):
+            crawler.fetch_tickets(mock_ticket_query())
+
+        assert crawler.healthy()
+
+    def test_close(self):
+        """Test close releases the session and fails the health check"""
+        crawler = CtripTicketCrawler()
+
+        with patch.object(crawler._session, "close") as mock_close:
+            crawler.close()
+
+        mock_close.assert_called_once()
+        assert not crawler.healthy()
+
+
 class TestCrawlerConfiguration:
     """Test crawler configuration"""
 
@@ -525,3 +573,601 @@ class TestCrawlerParsing:
         call_args = mock_get.call_args
         assert call_args.kwargs.get("timeout") == 30
 
+
+
+class TestNextDataExtraction:
+    """Test fast __NEXT_DATA__ extraction"""
+
+    PAGE = (
+        '<html><head><script src="/app.js"></script>'
+        '<script id="__NEXT_DATA__" type="application/json">{"props": {"trainList": []}}</script>'
+        "</head><body></body></html>"
+    )
+
+    def test_extract_from_text(self):
+        """Test payload is sliced out of page text"""
+        crawler = CtripTicketCrawler()
+
+        payload = crawler._extract_next_data(self.PAGE)
+
+        assert payload == '{"props": {"trainList": []}}'
+
+    def test_extract_from_bytes(self):
+        """Test payload is sliced out of raw response bytes"""
+        crawler = CtripTicketCrawler()
+
+        payload = crawler._extract_next_data(self.PAGE.encode())
+
+        assert payload == b'{"props": {"trainList": []}}'
+
+    def test_extract_missing_script(self):
+        """Test missing script block returns None"""
+        crawler = CtripTicketCrawler()
+
+        assert crawler._extract_next_data("<html><body>blocked</body></html>") is None
+
+    def test_extract_marker_outside_script_tag(self):
+        """Test id on a non-script element is ignored"""
+        crawler = CtripTicketCrawler()
+
+        assert crawler._extract_next_data('<div id="__NEXT_DATA__">{}</div>') is None
+
+    def test_extract_unterminated_script(self):
+        """Test truncated page returns None"""
+        crawler = CtripTicketCrawler()
+
+        assert crawler._extract_next_data('<script id="__NEXT_DATA__" type="application/json">{"a"') is None
+
+    @patch("src.infrastructure.crawler.BeautifulSoup")
+    def test_parse_trains_skips_dom_on_fast_path(self, mock_soup):
+        """Test BeautifulSoup is not used when the fast scan succeeds"""
+        crawler = CtripTicketCrawler()
+
+        crawler._parse_trains(self.PAGE)
+
+        assert not mock_soup.called
+
+    @patch("src.infrastructure.crawler.BeautifulSoup")
+    def test_parse_trains_skips_dom_without_next_data(self, mock_soup):
+        """Test BeautifulSoup is not used when the page has no __NEXT_DATA__ at all"""
+        crawler = CtripTicketCrawler()
+
+        assert crawler._parse_trains("<html><body></body></html>") == []
+        assert not mock_soup.called
+
+    def test_parse_trains_falls_back_to_dom(self):
+        """Test BeautifulSoup fallback when the fast scan cannot slice the payload"""
+        crawler = CtripTicketCrawler()
+
+        # Single-quoted id is not matched by the fast scan
+        html = (
+            "<html><head><script id='__NEXT_DATA__' type='application/json'>"
+            '{"props": {"trainList": [{"trainNumber": "C3380", "departureStationName": "Dayi", '
+            '"arrivalStationName": "Chengdu South", "departureTime": "08:00", "arrivalTime": "09:00", '
+            '"duration": "01:00", "startPrice": 15}]}}'
+            "</script></head></html>"
+        )
+
+        trains = crawler._parse_trains(html)
+
+        assert len(trains) == 1
+        assert trains[0].train_number == "C3380"
+
+
+class TestStreamingFetch:
+    """Test streaming fetch mode"""
+
+    PAGE = (
+        b'<html><head><script id="__NEXT_DATA__" type="application/json">'
+        b'{"props": {"trainList": []}}</script></head>'
+        b"<body>" + b"x" * 1000 + b"</body></html>"
+    )
+
+    @staticmethod
+    def chunks(data: bytes, size: int) -> list[bytes]:
+        return [data[i : i + size] for i in range(0, len(data), size)]
+
+    def test_scanner_detects_complete_payload(self):
+        """Test scanner reports completion once the closing tag arrives"""
+        scanner = NextDataStreamScanner()
+
+        results = [scanner.feed(chunk) for chunk in self.chunks(self.PAGE, 7)]
+
+        assert results[-1] is True
+        # Completed well before the end of the page
+        assert results.index(True) < len(results) // 2
+        assert b"</script>" in scanner.data
+
+    def test_scanner_handles_split_markers(self):
+        """Test markers split across chunk boundaries are still found"""
+        for size in (1, 2, 3, 5, 11):
+            scanner = NextDataStreamScanner()
+            completed = any([scanner.feed(chunk) for chunk in self.chunks(self.PAGE, size)])
+            assert completed, f"chunk size {size}"
+
+    def test_scanner_ignores_script_before_marker(self):
+        """Test a closing tag before __NEXT_DATA__ does not end the scan"""
+        scanner = NextDataStreamScanner()
+
+        assert scanner.feed(b'<script src="/a.js"></script>') is False
+        assert scanner.feed(b'<script id="__NEXT_DATA__">{}') is False
+        assert scanner.feed(b"</script>") is True
+
+    @patch("requests.Session.get")
+    def test_streaming_stops_reading_early(self, mock_get):
+        """Test streaming fetch stops consuming chunks once the payload is complete"""
+        consumed = []
+
+        def iter_content(chunk_size):
+            for chunk in self.chunks(self.PAGE, 16):
+                consumed.append(chunk)
+                yield chunk
+
+        mock_response = MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.iter_content.side_effect = iter_content
+        mock_get.return_value = mock_response
+
+        crawler = CtripTicketCrawler(stream=True, chunk_size=16)
+        result = crawler.fetch_tickets(mock_ticket_query())
+
+        assert result.trains == []
+        assert mock_get.call_args.kwargs["stream"] is True
+        assert len(consumed) < len(self.chunks(self.PAGE, 16))
+        assert mock_response.__exit__.called
+
+    @patch("requests.Session.get")
+    def test_streaming_http_error(self, mock_get):
+        """Test HTTP errors are raised in streaming mode"""
+        mock_response = MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.raise_for_status.side_effect = requests.HTTPError("Server error")
+        mock_get.return_value = mock_response
+
+        crawler = CtripTicketCrawler(stream=True)
+
+        with pytest.raises(CrawlerException):
+            crawler.fetch_tickets(mock_ticket_query())
+
+
+class TestTrainListPathCache:
+    """Test learned train list path"""
+
+    @staticmethod
+    def page(train_number: str = "C3380", nested: bool = False) -> dict:
+        train_list = [{"trainNumber": train_number}]
+        if nested:
+            return {"props": {"pageProps": {"data": {"result": {"trainInfoList": train_list}}}}}
+        return {"props": {"pageProps": {"trainInfoList": train_list}}}
+
+    def test_path_learned_on_first_search(self):
+        """Test the key path is recorded after a full search"""
+        crawler = CtripTicketCrawler()
+
+        train_list = crawler._locate_train_list(self.page())
+
+        assert train_list[0]["trainNumber"] == "C3380"
+        assert crawler._train_list_path == ("props", "pageProps", "trainInfoList")
+
+    def test_learned_path_skips_search(self):
+        """Test later pages use the learned path without a recursive walk"""
+        crawler = CtripTicketCrawler()
+        crawler._locate_train_list(self.page())
+
+        with patch.object(crawler, "_find_train_list_path", wraps=crawler._find_train_list_path) as search:
+            train_list = crawler._locate_train_list(self.page("G1"))
+
+        assert train_list[0]["trainNumber"] == "G1"
+        assert not search.called
+
+    def test_path_relearned_on_layout_change(self):
+        """Test the path is updated when the layout changes"""
+        crawler = CtripTicketCrawler()
+        crawler._locate_train_list(self.page())
+
+        train_list = crawler._locate_train_list(self.page("G1", nested=True))
+
+        assert train_list[0]["trainNumber"] == "G1"
+        assert crawler._train_list_path == ("props", "pageProps", "data", "result", "trainInfoList")
+
+    def test_path_through_list_index(self):
+        """Test paths through JSON arrays"""
+        crawler = CtripTicketCrawler()
+        data = [{"someKey": "someValue"}, {"trainList": [{"trainNumber": "C3380"}]}]
+
+        crawler._locate_train_list(data)
+
+        assert crawler._train_list_path == (1, "trainList")
+        assert crawler._follow_path(data, (1, "trainList")) == [{"trainNumber": "C3380"}]
+
+    def test_path_shared_across_crawlers(self):
+        """Test a path learned by one crawler (e.g. last run's) is used by new sync and async crawlers"""
+        CtripTicketCrawler()._locate_train_list(self.page())
+
+        with patch.object(CtripTicketCrawler, "_find_train_list_path") as search:
+            train_list = CtripTicketCrawler()._locate_train_list(self.page("G1"))
+
+        assert train_list[0]["trainNumber"] == "G1"
+        assert not search.called
+        assert AsyncCtripTicketCrawler._train_list_path == ("props", "pageProps", "trainInfoList")
+
+    def test_follow_path_mismatch(self):
+        """Test following a stale path returns None"""
+        crawler = CtripTicketCrawler()
+
+        assert crawler._follow_path({"props": {}}, ("props", "pageProps", "trainInfoList")) is None
+        assert crawler._follow_path([], (0, "trainList")) is None
+        assert crawler._follow_path({"trainList": "oops"}, ("trainList",)) is None
+
+    def test_empty_list_at_learned_path(self):
+        """Test an empty train list at the learned path is trusted without a search"""
+        crawler = CtripTicketCrawler()
+        crawler._locate_train_list(self.page())
+
+        with patch.object(crawler, "_find_train_list_path") as search:
+            train_list = crawler._locate_train_list({"props": {"pageProps": {"trainInfoList": []}}})
+
+        assert train_list == []
+        assert not search.called
+        assert crawler._train_list_path == ("props", "pageProps", "trainInfoList")
+
+
+class TestFilterBeforeValidate:
+    """Test train number filtering on raw data"""
+
+    @staticmethod
+    def page(*train_numbers: str) -> str:
+        import json
+
+        trains = [
+            {
+                "trainNumber": number,
+                "departureStationName": "Dayi",
+                "arrivalStationName": "Chengdu South",
+                "departureTime": "08:00",
+                "arrivalTime": "09:00",
+                "duration": "01:00",
+                "startPrice": 15,
+                "seatItemInfoList": [],
+            }
+            for number in train_numbers
+        ]
+        payload = json.dumps({"props": {"pageProps": {"trainInfoList": trains}}})
+        return f'<script id="__NEXT_DATA__" type="application/json">{payload}</script>'
+
+    def test_only_matching_trains_are_validated(self):
+        """Test models are only built for requested train numbers"""
+        crawler = CtripTicketCrawler()
+
+        with patch.object(crawler, "_parse_train", wraps=crawler._parse_train) as parse_train:
+            trains = crawler._parse_trains(self.page("G1", "C3380", "D5"), train_numbers={"C3380"})
+
+        assert [t.train_number for t in trains] == ["C3380"]
+        assert parse_train.call_count == 1
+
+    def test_match_set_of_train_numbers(self):
+        """Test matching several train numbers keeps page order"""
+        crawler = CtripTicketCrawler()
+
+        trains = crawler._parse_trains(self.page("G1", "C3380", "D5"), train_numbers={"D5", "G1"})
+
+        assert [t.train_number for t in trains] == ["G1", "D5"]
+
+    def test_invalid_unmatched_train_is_skipped(self):
+        """Test malformed trains that are filtered out are never validated"""
+        crawler = CtripTicketCrawler()
+        html = self.page("C3380").replace("[{", '[{"trainNumber": "bad"}, {', 1)
+
+        trains = crawler._parse_trains(html, train_numbers={"C3380"})
+
+        assert [t.train_number for t in trains] == ["C3380"]
+
+    @patch("requests.Session.get")
+    def test_fetch_tickets_uses_query_train_number(self, mock_get):
+        """Test fetch_tickets filters by query.train_number before validation"""
+        mock_response = Mock()
+        mock_response.text = self.page("G1", "C3380")
+        mock_get.return_value = mock_response
+
+        crawler = CtripTicketCrawler()
+
+        result = crawler.fetch_tickets(mock_ticket_query())
+
+        assert [t.train_number for t in result.trains] == ["C3380"]
+
+    @patch("requests.Session.get")
+    def test_fetch_tickets_with_train_numbers(self, mock_get):
+        """Test explicit train_numbers overrides query.train_number"""
+        mock_response = Mock()
+        mock_response.text = self.page("G1", "C3380", "D5")
+        mock_get.return_value = mock_response
+
+        crawler = CtripTicketCrawler()
+
+        result = crawler.fetch_tickets(mock_ticket_query(), train_numbers=["G1", "D5"])
+
+        assert [t.train_number for t in result.trains] == ["G1", "D5"]
+
+
+class TestUnchangedPayloadDetection:
+    """Test content-hash short-circuit for unchanged pages"""
+
+    page = staticmethod(TestFilterBeforeValidate.page)
+
+    def test_identical_payload_reuses_result(self):
+        """Test an identical poll returns the cached result flagged as unchanged"""
+        crawler = CtripTicketCrawler()
+        query = mock_ticket_query()
+
+        first = crawler._build_result(query, self.page("C3380"))
+        with patch.object(crawler, "_parse_train") as parse_train:
+            second = crawler._build_result(query, self.page("C3380"))
+
+        assert first.unchanged is False
+        assert second.unchanged is True
+        assert second.trains == first.trains
+        assert not parse_train.called
+
+    def test_changed_payload_is_parsed(self):
+        """Test a changed payload is parsed again"""
+        crawler = CtripTicketCrawler()
+        query = mock_ticket_query()
+
+        crawler._build_result(query, self.page("C3380"))
+        changed = crawler._build_result(query, self.page("C3380").replace('"startPrice": 15', '"startPrice": 16'))
+
+        assert changed.unchanged is False
+        assert changed.trains[0].start_price == 16
+
+    def test_other_trains_do_not_affect_fingerprint(self):
+        """Test changes to filtered-out trains still count as unchanged"""
+        crawler = CtripTicketCrawler()
+        query = mock_ticket_query()
+
+        crawler._build_result(query, self.page("C3380", "G1"))
+        result = crawler._build_result(query, self.page("C3380", "G2"))
+
+        assert result.unchanged is True
+
+    def test_fingerprints_are_per_date(self):
+        """Test fingerprints are tracked per route and date"""
+        crawler = CtripTicketCrawler()
+        query = mock_ticket_query()
+        other_date = query.model_copy(update={"departure_date": "2024-11-18"})
+
+        crawler._build_result(query, self.page("C3380"))
+        result = crawler._build_result(other_date, self.page("C3380"))
+
+        assert result.unchanged is False
+
+    def test_detection_can_be_disabled(self):
+        """Test detect_unchanged=False always parses"""
+        crawler = CtripTicketCrawler(detect_unchanged=False)
+        query = mock_ticket_query()
+
+        crawler._build_result(query, self.page("C3380"))
+        result = crawler._build_result(query, self.page("C3380"))
+
+        assert result.unchanged is False
+
+
+class TestWarmUp:
+    """Test connection pre-warming"""
+
+    @patch("socket.getaddrinfo")
+    @patch("requests.Session.get")
+    def test_warm_up_success(self, mock_get, mock_getaddrinfo):
+        """Test warm-up resolves DNS and opens a connection to the host"""
+        mock_get.return_value = Mock(content=b"")
+
+        crawler = CtripTicketCrawler(timeout=5)
+
+        assert crawler.warm_up() is True
+        mock_getaddrinfo.assert_called_once()
+        assert mock_getaddrinfo.call_args.args[0] == "trains.ctrip.com"
+        assert mock_get.call_args.args[0] == "https://trains.ctrip.com/"
+        assert mock_get.call_args.kwargs["timeout"] == 5
+
+    @patch("socket.getaddrinfo")
+    @patch("requests.Session.get")
+    def test_warm_up_failure_is_not_raised(self, mock_get, mock_getaddrinfo):
+        """Test warm-up failures are logged, not raised"""
+        mock_get.side_effect = requests.ConnectionError("Connection refused")
+
+        crawler = CtripTicketCrawler()
+
+        assert crawler.warm_up() is False
+
+
+class TestResponseCache:
+    """Test shared response cache"""
+
+    PAGE = TestFilterBeforeValidate.page("C3380", "G1")
+
+    @patch("requests.Session.get")
+    def test_watchers_of_same_route_share_one_request(self, mock_get):
+        """Test crawlers sharing a cache send one request per route/date"""
+        mock_get.return_value = Mock(text=self.PAGE)
+        cache = TTLCache(ttl=60)
+        query = mock_ticket_query()
+
+        first = CtripTicketCrawler(response_cache=cache).fetch_tickets(query)
+        second = CtripTicketCrawler(response_cache=cache).fetch_tickets(query.model_copy(update={"train_number": "G1"}))
+
+        assert mock_get.call_count == 1
+        assert [t.train_number for t in first.trains] == ["C3380"]
+        assert [t.train_number for t in second.trains] == ["G1"]
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    @patch("requests.Session.get")
+    def test_different_dates_are_fetched(self, mock_get):
+        """Test cache key includes the date"""
+        mock_get.return_value = Mock(text=self.PAGE)
+        crawler = CtripTicketCrawler(response_cache=TTLCache(ttl=60))
+        query = mock_ticket_query()
+
+        crawler.fetch_tickets(query)
+        crawler.fetch_tickets(query.model_copy(update={"departure_date": "2024-11-18"}))
+
+        assert mock_get.call_count == 2
+
+    @patch("requests.Session.get")
+    def test_pages_without_train_data_are_not_cached(self, mock_get):
+        """Test blocked or empty pages are not shared"""
+        mock_get.return_value = Mock(text="<html><body>Please verify</body></html>")
+        cache = TTLCache(ttl=60)
+        crawler = CtripTicketCrawler(response_cache=cache)
+
+        crawler.fetch_tickets(mock_ticket_query())
+        crawler.fetch_tickets(mock_ticket_query())
+
+        assert mock_get.call_count == 2
+        assert len(cache) == 0
+
+
+class TestHedgedRequests:
+    """Test hedged requests"""
+
+    PAGE = TestFilterBeforeValidate.page("C3380")
+
+    @staticmethod
+    def tracker(seconds: float) -> LatencyTracker:
+        """Tracker already holding enough samples of the given latency"""
+        tracker = LatencyTracker(min_samples=1)
+        tracker.record("trains.ctrip.com", seconds)
+        return tracker
+
+    @patch("requests.Session.get")
+    def test_no_hedge_without_latency_history(self, mock_get):
+        """Test the first requests are never hedged"""
+        mock_get.return_value = Mock(text=self.PAGE)
+        crawler = CtripTicketCrawler(hedge_percentile=95)
+
+        crawler.fetch_tickets(mock_ticket_query())
+
+        assert mock_get.call_count == 1
+        assert crawler.hedges == 0
+        assert crawler._latency_tracker.stats("trains.ctrip.com")["samples"] == 1
+
+    @patch("requests.Session.get")
+    def test_fast_response_is_not_hedged(self, mock_get):
+        """Test requests faster than the hedge delay are sent once"""
+        mock_get.return_value = Mock(text=self.PAGE)
+        crawler = CtripTicketCrawler(hedge_percentile=95, latency_tracker=self.tracker(1.0))
+
+        crawler.fetch_tickets(mock_ticket_query())
+
+        assert mock_get.call_count == 1
+        assert crawler.hedges == 0
+
+    @patch("requests.Session.get")
+    def test_slow_response_is_hedged(self, mock_get):
+        """Test a slow request is raced against a hedge and the faster wins"""
+        calls = []
+
+        def get(*args, **kwargs):
+            calls.append(None)
+            if len(calls) == 1:
+                time.sleep(0.5)
+                return Mock(text="<html>slow</html>")
+            return Mock(text=self.PAGE)
+
+        mock_get.side_effect = get
+        crawler = CtripTicketCrawler(hedge_percentile=95, latency_tracker=self.tracker(0.01))
+
+        start = time.monotonic()
+        result = crawler.fetch_tickets(mock_ticket_query())
+
+        assert time.monotonic() - start < 0.4
+        assert crawler.hedges == 1
+        assert result.trains[0].train_number == "C3380"
+
+    @patch("requests.Session.get")
+    def test_failed_hedge_falls_back_to_primary(self, mock_get):
+        """Test a failing hedge does not fail the fetch"""
+        calls = []
+
+        def get(*args, **kwargs):
+            calls.append(None)
+            if len(calls) == 1:
+                time.sleep(0.1)
+                return Mock(text=self.PAGE)
+            raise requests.ConnectionError("reset")
+
+        mock_get.side_effect = get
+        crawler = CtripTicketCrawler(hedge_percentile=95, latency_tracker=self.tracker(0.01))
+
+        result = crawler.fetch_tickets(mock_ticket_query())
+
+        assert crawler.hedges == 1
+        assert result.trains[0].train_number == "C3380"
+
+    @patch("requests.Session.get")
+    def test_hedge_takes_rate_limit_token(self, mock_get):
+        """Test the hedge is a rate limited request of its own and returns its slot when done"""
+        calls = []
+
+        def get(*args, **kwargs):
+            calls.append(None)
+            if len(calls) == 1:
+                time.sleep(0.2)
+            return Mock(text=self.PAGE)
+
+        mock_get.side_effect = get
+        limiter = AdaptiveRateLimiter("trains.ctrip.com", rate=100, burst=4, initial_concurrency=4)
+        crawler = CtripTicketCrawler(hedge_percentile=95, latency_tracker=self.tracker(0.01), rate_limiter=limiter)
+
+        crawler.fetch_tickets(mock_ticket_query())
+        time.sleep(0.3)
+
+        metrics = limiter.metrics()
+        assert crawler.hedges == 1
+        assert metrics["acquired"] == 2
+        assert metrics["in_flight"] == 0
+
+    @patch("requests.Session.get")
+    def test_no_hedge_without_rate_limit_token(self, mock_get):
+        """Test a slow request waits for its own response when the limiter has no token to spare"""
+
+        def get(*args, **kwargs):
+            time.sleep(0.1)
+            return Mock(text=self.PAGE)
+
+        mock_get.side_effect = get
+        limiter = AdaptiveRateLimiter("trains.ctrip.com", rate=0.1, burst=1)
+        crawler = CtripTicketCrawler(hedge_percentile=95, latency_tracker=self.tracker(0.01), rate_limiter=limiter)
+
+        result = crawler.fetch_tickets(mock_ticket_query())
+
+        assert mock_get.call_count == 1
+        assert crawler.hedges == 0
+        assert limiter.metrics()["acquired"] == 1
+        assert result.trains[0].train_number == "C3380"
+
+    @patch("requests.Session.get")
+    def test_timeout_latency_recorded(self, mock_get):
+        """Test a timed-out request still counts toward the latency percentiles"""
+        mock_get.side_effect = requests.Timeout("slow")
+        tracker = LatencyTracker()
+        crawler = CtripTicketCrawler(hedge_percentile=95, latency_tracker=tracker)
+
+        with pytest.raises(Exception):
+            crawler.fetch_tickets(mock_ticket_query())
+
+        assert tracker.stats("trains.ctrip.com")["samples"] == 1
+
+    def test_hedge_threads_shared(self):
+        """Test crawlers built per run share one hedge thread pool"""
+        assert CtripTicketCrawler()._hedge_pool() is CtripTicketCrawler()._hedge_pool()
+
+    @patch("requests.Session.get")
+    def test_hedging_disabled(self, mock_get):
+        """Test percentile 0 disables hedging"""
+        mock_get.return_value = Mock(text=self.PAGE)
+        crawler = CtripTicketCrawler(hedge_percentile=0)
+
+        crawler.fetch_tickets(mock_ticket_query())
+
+        assert crawler._latency_tracker is None
+        assert crawler.hedges == 0
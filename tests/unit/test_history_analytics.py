@@ -0,0 +1,161 @@
+"""Unit tests for columnar history analytics"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.application.history_analytics import SEAT_TYPES, SeatHistory, load_history
+from src.domain.models import SeatSnapshot, SeatType
+from src.infrastructure.snapshot_store import SQLiteSnapshotStore
+from tests.fixtures.mock_data import mock_query_result
+
+T0 = datetime(2024, 11, 2, 15, 30, 0)
+
+
+def _row(minute: int, inventory: int, price: int = 15, date: str = "2024-11-17", seat: str = "二等座", train="C3380"):
+    """Raw snapshot row polled minute minutes after T0"""
+    time = (T0 + timedelta(minutes=minute)).isoformat()
+    return (time, "大邑", "成都南", date, train, seat, price, inventory, int(inventory > 0))
+
+
+class TestSeatHistory:
+    """Test SeatHistory"""
+
+    def test_from_records_builds_columns(self):
+        """Test raw rows become typed columns with train and seat type codes"""
+        history = SeatHistory.from_records([_row(0, 0), _row(1, 5, seat="一等座", train="G1")])
+
+        assert len(history) == 2
+        assert history.time.dtype == np.dtype("datetime64[us]")
+        assert history.train_numbers == ["C3380", "G1"]
+        assert history.train.tolist() == [0, 1]
+        assert [SEAT_TYPES[code] for code in history.seat_type] == [SeatType.SECOND_CLASS, SeatType.FIRST_CLASS]
+        assert history.available.tolist() == [False, True]
+
+    def test_from_snapshots_matches_records(self):
+        """Test snapshot models load into the same columns"""
+        history = SeatHistory.from_snapshots(SeatSnapshot.from_result(mock_query_result(has_tickets=True)))
+
+        assert len(history) == 2
+        assert history.price.tolist() == [15, 23]
+        assert str(history.departure_date[0]) == "2024-11-17"
+
+    def test_empty(self):
+        """Test empty input gives an empty history every query accepts"""
+        history = SeatHistory.from_records([])
+
+        assert len(history) == 0
+        assert history.first_available() == {}
+        assert len(history.price_changes()) == 0
+        assert len(history.availability_timeline()[0]) == 0
+
+    def test_mismatched_columns(self):
+        """Test columns must have the same length"""
+        empty = SeatHistory.empty()
+        with pytest.raises(ValueError):
+            SeatHistory(
+                time=np.array(["2024-11-02T15:30"], dtype="datetime64[us]"),
+                train=empty.train,
+                train_numbers=[],
+                departure_date=empty.departure_date,
+                seat_type=empty.seat_type,
+                price=empty.price,
+                inventory=empty.inventory,
+                bookable=empty.bookable,
+            )
+
+    def test_select(self):
+        """Test filtering by train, date and seat type"""
+        history = SeatHistory.from_records(
+            [_row(0, 1), _row(0, 1, seat="一等座"), _row(0, 1, date="2024-11-18"), _row(0, 1, train="G1")]
+        )
+
+        assert len(history.select(train_number="C3380")) == 3
+        assert len(history.select(train_number="C3380", departure_date="2024-11-17")) == 2
+        assert len(history.select(seat_type=SeatType.FIRST_CLASS)) == 1
+        assert len(history.select(train_number="D1")) == 0
+
+    def test_availability_timeline(self):
+        """Test a poll counts as available when any seat is available"""
+        history = SeatHistory.from_records(
+            [_row(2, 0), _row(0, 0), _row(0, 0, seat="一等座"), _row(1, 0), _row(1, 3, seat="一等座")]
+        )
+
+        times, available = history.availability_timeline()
+
+        assert [t.astype(datetime) for t in times] == [T0, T0 + timedelta(minutes=1), T0 + timedelta(minutes=2)]
+        assert available.tolist() == [False, True, False]
+
+    def test_first_available_per_date(self):
+        """Test the earliest available poll is reported per departure date"""
+        history = SeatHistory.from_records(
+            [
+                _row(5, 10),
+                _row(3, 0),
+                _row(4, 2),
+                _row(1, 0, date="2024-11-18"),
+                _row(9, 1, date="2024-11-18"),
+                _row(0, 0, date="2024-11-19"),
+            ]
+        )
+
+        assert history.first_available() == {
+            "2024-11-17": T0 + timedelta(minutes=4),
+            "2024-11-18": T0 + timedelta(minutes=9),
+        }
+
+    def test_price_changes_per_series(self):
+        """Test consecutive price differences within one train, date and seat type"""
+        history = SeatHistory.from_records(
+            [
+                _row(2, 5, price=18),
+                _row(0, 5, price=15),
+                _row(1, 5, price=15),
+                _row(3, 5, price=15),
+                _row(0, 5, price=30, seat="一等座"),
+                _row(1, 5, price=30, seat="一等座"),
+                _row(0, 5, price=99, date="2024-11-18"),
+            ]
+        )
+
+        changes = history.price_changes()
+
+        assert changes["old_price"].tolist() == [15, 18]
+        assert changes["new_price"].tolist() == [18, 15]
+        assert [t.astype(datetime) for t in changes["time"]] == [T0 + timedelta(minutes=2), T0 + timedelta(minutes=3)]
+        assert {SEAT_TYPES[code] for code in changes["seat_type"]} == {SeatType.SECOND_CLASS}
+
+
+class TestLoadHistory:
+    """Test loading history from a snapshot store"""
+
+    def test_load_from_sqlite(self, tmp_path):
+        """Test rows recorded by the SQLite store load into columns"""
+        store = SQLiteSnapshotStore(tmp_path / "snapshots.db")
+        result = mock_query_result(has_tickets=True)
+        store.record(result)
+        store.record(result.model_copy(update={"query_time": T0 + timedelta(minutes=1)}))
+        store.close()
+
+        history = load_history(store, "C3380", departure_date="2024-11-17")
+
+        assert len(history) == 4
+        assert history.first_available() == {"2024-11-17": T0}
+
+    def test_load_one_route(self, tmp_path):
+        """Test history of a train on another route is left out"""
+        store = SQLiteSnapshotStore(tmp_path / "snapshots.db")
+        result = mock_query_result(has_tickets=True)
+        store.record(result)
+        store.record(result.model_copy(update={"query": result.query.model_copy(update={"arrival_station": "北京"})}))
+        store.close()
+
+        history = load_history(
+            store,
+            "C3380",
+            departure_station=result.query.departure_station,
+            arrival_station=result.query.arrival_station,
+        )
+
+        assert len(history) == 2
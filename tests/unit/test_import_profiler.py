@@ -0,0 +1,85 @@
+"""Unit tests for ImportProfiler"""
+
+import sys
+import textwrap
+
+import pytest
+
+from src.infrastructure.import_profiler import ImportProfiler
+
+
+@pytest.fixture
+def modules(tmp_path, monkeypatch):
+    """Two fresh modules on sys.path: outer imports inner"""
+    (tmp_path / "profiled_inner.py").write_text("import time\ntime.sleep(0.02)\nVALUE = 1\n")
+    (tmp_path / "profiled_outer.py").write_text(
+        textwrap.dedent(
+            """
+            import time
+            import profiled_inner
+            time.sleep(0.01)
+            VALUE = profiled_inner.VALUE + 1
+            """
+        )
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield
+    for name in ("profiled_inner", "profiled_outer"):
+        sys.modules.pop(name, None)
+
+
+class TestImportProfiler:
+    """Test ImportProfiler"""
+
+    def test_records_self_and_cumulative_time(self, modules):
+        """Test nested import time counts toward the importer's cumulative time only"""
+        profiler = ImportProfiler().install()
+        try:
+            import profiled_outer
+        finally:
+            profiler.uninstall()
+
+        assert profiled_outer.VALUE == 2
+        inner_self, inner_cumulative = profiler.timings["profiled_inner"]
+        outer_self, outer_cumulative = profiler.timings["profiled_outer"]
+
+        assert inner_self >= 0.02
+        assert outer_cumulative >= inner_cumulative + 0.01
+        assert outer_self < outer_cumulative - inner_cumulative + 0.005
+        assert profiler.total == pytest.approx(outer_cumulative)
+
+    def test_uninstall_stops_recording(self, modules):
+        """Test imports after uninstall are not recorded"""
+        profiler = ImportProfiler().install()
+        profiler.uninstall()
+
+        import profiled_inner  # noqa: F401
+
+        assert profiler not in sys.meta_path
+        assert profiler.timings == {}
+
+    def test_already_imported_modules_not_recorded(self, modules):
+        """Test only modules actually executed while installed are timed"""
+        import profiled_inner  # noqa: F401
+
+        profiler = ImportProfiler().install()
+        try:
+            import profiled_outer  # noqa: F401
+        finally:
+            profiler.uninstall()
+
+        assert list(profiler.timings) == ["profiled_outer"]
+
+    def test_report_lists_slowest_first(self, modules):
+        """Test report orders modules by cumulative time and honours the limit"""
+        profiler = ImportProfiler().install()
+        try:
+            import profiled_outer  # noqa: F401
+        finally:
+            profiler.uninstall()
+
+        lines = profiler.report(limit=1).splitlines()
+
+        assert lines[0].startswith("Imported 2 module(s)")
+        assert len(lines) == 3
+        assert lines[2].endswith("profiled_outer")
@@ -0,0 +1,133 @@
+"""Unit tests for InventoryDeltaEngine"""
+
+from src.application.inventory_delta import InventoryDeltaEngine
+from src.domain.models import InventoryEventType, SeatInfo, SeatType, TrainInfo
+from tests.fixtures.mock_data import mock_query_result
+
+
+def _result(*seats: SeatInfo, date: str | None = None):
+    """Query result with one C3380 train carrying the given seats"""
+    result = mock_query_result(has_tickets=True)
+    train = TrainInfo(
+        train_number="C3380",
+        departure_station="大邑",
+        arrival_station="成都南",
+        departure_time="08:30",
+        arrival_time="09:05",
+        duration="35min",
+        start_price=15,
+        seats=list(seats),
+    )
+    update = {"trains": [train]}
+    if date:
+        update["query"] = result.query.model_copy(update={"departure_date": date})
+    return result.model_copy(update=update)
+
+
+def _seat(inventory: int, price: int = 15, seat_type: SeatType = SeatType.SECOND_CLASS) -> SeatInfo:
+    return SeatInfo(seat_type=seat_type, price=price, inventory=inventory, bookable=inventory > 0)
+
+
+class TestInventoryDeltaEngine:
+    """Test InventoryDeltaEngine"""
+
+    def test_first_available_seat_appears(self):
+        """Test an available seat seen for the first time emits APPEARED"""
+        events = InventoryDeltaEngine().diff(_result(_seat(10)))
+
+        assert [e.event_type for e in events] == [InventoryEventType.APPEARED]
+        assert events[0].previous is None
+        assert events[0].current.inventory == 10
+
+    def test_first_sold_out_seat_is_silent(self):
+        """Test a sold-out seat seen for the first time emits nothing"""
+        assert InventoryDeltaEngine().diff(_result(_seat(0))) == []
+
+    def test_identical_poll_is_silent(self):
+        """Test repeating the same state emits nothing"""
+        engine = InventoryDeltaEngine()
+        engine.diff(_result(_seat(10)))
+
+        assert engine.diff(_result(_seat(10))) == []
+
+    def test_restock_appears(self):
+        """Test a sold-out seat becoming available emits APPEARED"""
+        engine = InventoryDeltaEngine()
+        engine.diff(_result(_seat(0)))
+
+        events = engine.diff(_result(_seat(3)))
+
+        assert [e.event_type for e in events] == [InventoryEventType.APPEARED]
+        assert events[0].previous.inventory == 0
+
+    def test_sold_out(self):
+        """Test an available seat becoming unavailable emits SOLD_OUT"""
+        engine = InventoryDeltaEngine()
+        engine.diff(_result(_seat(10)))
+
+        events = engine.diff(_result(_seat(0)))
+
+        assert [e.event_type for e in events] == [InventoryEventType.SOLD_OUT]
+
+    def test_inventory_drop_and_price_change(self):
+        """Test a lower inventory and a new price emit both events"""
+        engine = InventoryDeltaEngine()
+        engine.diff(_result(_seat(10, price=15)))
+
+        events = engine.diff(_result(_seat(4, price=18)))
+
+        assert [e.event_type for e in events] == [
+            InventoryEventType.INVENTORY_DROPPED,
+            InventoryEventType.PRICE_CHANGED,
+        ]
+        assert "10 tickets -> 4 tickets" in events[0].description
+        assert "¥15 -> ¥18" in events[1].description
+
+    def test_inventory_increase_is_silent(self):
+        """Test a higher inventory on an available seat emits nothing"""
+        engine = InventoryDeltaEngine()
+        engine.diff(_result(_seat(4)))
+
+        assert engine.diff(_result(_seat(10))) == []
+
+    def test_state_is_per_seat_type_and_date(self):
+        """Test seat types and dates are tracked independently"""
+        engine = InventoryDeltaEngine()
+        engine.diff(_result(_seat(10), _seat(0, seat_type=SeatType.FIRST_CLASS)))
+
+        events = engine.diff(_result(_seat(10), _seat(2, seat_type=SeatType.FIRST_CLASS)))
+        other_date = engine.diff(_result(_seat(10), date="2024-11-18"))
+
+        assert [(e.seat_type, e.event_type) for e in events] == [(SeatType.FIRST_CLASS, InventoryEventType.APPEARED)]
+        assert [e.departure_date for e in other_date] == ["2024-11-18"]
+        assert len(engine) == 3
+
+    def test_missing_train_keeps_state(self):
+        """Test a result without the train does not read as a sell-out"""
+        engine = InventoryDeltaEngine()
+        engine.diff(_result(_seat(10)))
+
+        assert engine.diff(mock_query_result(has_tickets=False)) == []
+        assert engine.diff(_result(_seat(10))) == []
+
+    def test_forget_date(self):
+        """Test forgetting a date drops its state"""
+        engine = InventoryDeltaEngine()
+        engine.diff(_result(_seat(10)))
+
+        engine.forget("2024-11-17")
+
+        assert len(engine) == 0
+        assert [e.event_type for e in engine.diff(_result(_seat(10)))] == [InventoryEventType.APPEARED]
+
+    def test_peek_does_not_record(self):
+        """Test peeked events repeat until the result is recorded"""
+        engine = InventoryDeltaEngine()
+        result = _result(_seat(10))
+
+        assert [e.event_type for e in engine.peek(result)] == [InventoryEventType.APPEARED]
+        assert [e.event_type for e in engine.peek(result)] == [InventoryEventType.APPEARED]
+
+        engine.record(result)
+
+        assert engine.peek(result) == []
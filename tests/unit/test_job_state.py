@@ -0,0 +1,41 @@
+"""Unit tests for SQLiteJobStateStore"""
+
+from datetime import datetime, timedelta, timezone
+
+from src.infrastructure.job_state import SQLiteJobStateStore, open_job_state_store
+
+NOW = datetime(2024, 11, 4, 15, 30, tzinfo=timezone(timedelta(hours=8)))
+
+
+class TestSQLiteJobStateStore:
+    """Test SQLiteJobStateStore"""
+
+    def test_unknown_job(self, tmp_path):
+        """Test a job without state returns None"""
+        assert SQLiteJobStateStore(tmp_path / "scheduler.db").get("weekly_job_0_15_30") is None
+
+    def test_record_run_and_next_run(self, tmp_path):
+        """Test run and next-run updates merge into one row"""
+        store = SQLiteJobStateStore(tmp_path / "scheduler.db")
+
+        store.record_next_run("weekly_job_0_15_30", NOW)
+        store.record_run("weekly_job_0_15_30", NOW, "success")
+        store.record_next_run("weekly_job_0_15_30", NOW + timedelta(days=7))
+
+        state = store.get("weekly_job_0_15_30")
+        assert state.last_run_at == NOW
+        assert state.last_status == "success"
+        assert state.next_run_at == NOW + timedelta(days=7)
+
+    def test_state_survives_reopen(self, tmp_path):
+        """Test state is read back by a new store on the same file"""
+        SQLiteJobStateStore(tmp_path / "scheduler.db").record_next_run("a", NOW)
+        SQLiteJobStateStore(tmp_path / "scheduler.db").record_run("b", NOW, "error")
+
+        states = SQLiteJobStateStore(tmp_path / "scheduler.db").all()
+
+        assert [(s.job_id, s.next_run_at, s.last_status) for s in states] == [("a", NOW, None), ("b", None, "error")]
+
+    def test_open_disabled(self):
+        """Test an empty path disables the store"""
+        assert open_job_state_store("") is None
@@ -0,0 +1,63 @@
+"""Unit tests for LatencyTracker"""
+
+import pytest
+
+from src.infrastructure.latency import LatencyTracker
+
+
+class TestLatencyTracker:
+    """Test per-host latency percentiles"""
+
+    def test_invalid_parameters(self):
+        """Test invalid window configuration is rejected"""
+        with pytest.raises(ValueError):
+            LatencyTracker(window=0)
+        with pytest.raises(ValueError):
+            LatencyTracker(window=10, min_samples=20)
+
+    def test_no_percentile_before_min_samples(self):
+        """Test percentiles are withheld until enough samples exist"""
+        tracker = LatencyTracker(min_samples=3)
+        tracker.record("host", 0.1)
+        tracker.record("host", 0.2)
+
+        assert tracker.percentile("host", 95) is None
+
+        tracker.record("host", 0.3)
+        assert tracker.percentile("host", 95) == 0.3
+
+    def test_nearest_rank_percentiles(self):
+        """Test nearest-rank percentile calculation"""
+        tracker = LatencyTracker(min_samples=1)
+        for ms in range(1, 101):
+            tracker.record("host", ms / 1000)
+
+        assert tracker.percentile("host", 50) == 0.05
+        assert tracker.percentile("host", 95) == 0.095
+        assert tracker.percentile("host", 100) == 0.1
+
+    def test_window_drops_old_samples(self):
+        """Test only the most recent samples are kept"""
+        tracker = LatencyTracker(window=3, min_samples=1)
+        for seconds in (5.0, 0.1, 0.2, 0.3):
+            tracker.record("host", seconds)
+
+        assert tracker.percentile("host", 100) == 0.3
+
+    def test_hosts_are_independent(self):
+        """Test samples are tracked per host"""
+        tracker = LatencyTracker(min_samples=1)
+        tracker.record("a", 0.1)
+        tracker.record("b", 2.0)
+
+        assert tracker.percentile("a", 99) == 0.1
+        assert tracker.percentile("b", 99) == 2.0
+        assert tracker.percentile("c", 99) is None
+
+    def test_stats(self):
+        """Test stats snapshot"""
+        tracker = LatencyTracker(min_samples=1)
+        tracker.record("host", 0.5)
+
+        assert tracker.stats("host") == {"samples": 1, "p50": 0.5, "p90": 0.5, "p99": 0.5}
+        assert tracker.stats("other") == {"samples": 0}
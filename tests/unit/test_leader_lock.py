@@ -0,0 +1,54 @@
+"""Unit tests for FileLeaderLock"""
+
+import os
+import threading
+import time
+
+from src.infrastructure.leader_lock import FileLeaderLock
+
+
+class TestFileLeaderLock:
+    """Test FileLeaderLock"""
+
+    def test_only_one_leader(self, tmp_path):
+        """Test a second lock on the same file is refused while the first is held"""
+        leader = FileLeaderLock(tmp_path / "locks" / "leader.lock")
+        standby = FileLeaderLock(tmp_path / "locks" / "leader.lock")
+
+        assert leader.acquire()
+        assert not standby.acquire()
+        assert (tmp_path / "locks" / "leader.lock").read_text().strip() == str(os.getpid())
+
+        leader.release()
+        assert standby.acquire()
+        standby.release()
+
+    def test_acquire_is_reentrant(self, tmp_path):
+        """Test acquiring a held lock again succeeds"""
+        lock = FileLeaderLock(tmp_path / "leader.lock")
+
+        assert lock.acquire()
+        assert lock.acquire()
+        assert lock.held
+        lock.release()
+        assert not lock.held
+
+    def test_standby_takes_over(self, tmp_path):
+        """Test a blocking acquire returns once the leader releases"""
+        leader = FileLeaderLock(tmp_path / "leader.lock")
+        standby = FileLeaderLock(tmp_path / "leader.lock")
+        leader.acquire()
+        acquired = threading.Event()
+
+        def wait_for_leadership():
+            with standby:
+                acquired.set()
+
+        thread = threading.Thread(target=wait_for_leadership)
+        thread.start()
+        time.sleep(0.1)
+        assert not acquired.is_set()
+
+        leader.release()
+        thread.join(5)
+        assert acquired.is_set()
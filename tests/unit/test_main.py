@@ -0,0 +1,196 @@
+"""Unit tests for the entry point's run wiring"""
+
+import asyncio
+import json
+import os
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from dependency_injector import providers
+from loguru import logger
+
+from main import ShardWorker, _run_scheduler, build_service, log_crawler_metrics
+from src.application.sharding import POLL, REMEMBER
+from src.container import Container
+from src.domain.models import WatchTarget
+from src.infrastructure.async_crawler import AsyncCtripTicketCrawler
+from src.infrastructure.crawler import CtripTicketCrawler
+from tests.fixtures.mock_data import mock_analysis
+
+PAGE = """
+<html><head><script id="__NEXT_DATA__" type="application/json">{payload}</script></head></html>
+"""
+
+
+def page(inventory: int = 99) -> Mock:
+    """List page response with one C3380 train"""
+    train = {
+        "trainNumber": "C3380",
+        "departureStationName": "大邑",
+        "arrivalStationName": "成都南",
+        "departureTime": "08:30",
+        "arrivalTime": "09:05",
+        "duration": "35min",
+        "startPrice": 15,
+        "seatItemInfoList": [{"seatName": "二等座", "seatPrice": 15, "seatInventory": inventory, "seatBookable": True}],
+    }
+    payload = json.dumps({"props": {"pageProps": {"trainInfoList": [train]}}}, ensure_ascii=False)
+    return Mock(status_code=200, text=PAGE.format(payload=payload))
+
+
+ENV = {
+    "DEEPSEEK_API_KEY": "test-key",
+    "SMTP_HOST": "smtp.test.com",
+    "SMTP_USER": "test@test.com",
+    "SMTP_PASSWORD": "test-password",
+    "EMAIL_FROM": "from@test.com",
+    "EMAIL_TO": '["to@test.com"]',
+    "CRAWLER_CACHE_TTL": "0",
+    "CRAWLER_HEDGE_PERCENTILE": "0",
+}
+
+
+def mock_clients(container: Container) -> Container:
+    """Override the analyzer and notifier with mocks"""
+    analyzer = Mock()
+    analyzer.analyze.return_value = mock_analysis(has_ticket=True)
+    container.analyzer.override(providers.Object(analyzer))
+    container.notifier.override(providers.Object(Mock()))
+    return container
+
+
+@pytest.fixture
+def container():
+    """Container with a mocked analyzer and notifier"""
+    with patch.dict(os.environ, ENV, clear=True):
+        yield mock_clients(Container())
+
+
+class TestBuildService:
+    """Test services built per run share state across runs"""
+
+    @staticmethod
+    def run(container: Container) -> None:
+        build_service(container).monitor_ticket("大邑", "成都南", "C3380", days_ahead=15)
+
+    @patch("requests.Session.get")
+    def test_unchanged_payload_skips_analysis_on_next_run(self, mock_get, container):
+        """Test the second run's fresh service and crawler reuse the first run's result and analysis"""
+        mock_get.return_value = page()
+        parse = CtripTicketCrawler._parse_raw_trains
+
+        with patch.object(CtripTicketCrawler, "_parse_raw_trains", autospec=True, side_effect=parse) as mock_parse:
+            self.run(container)
+            self.run(container)
+
+        assert mock_get.call_count == 2
+        assert mock_parse.call_count == 1
+        assert container.analyzer().analyze.call_count == 1
+        assert container.notifier().send.call_count == 1
+
+    @patch("requests.Session.get")
+    def test_watch_list_reuses_previous_run_analysis(self, mock_get, container):
+        """Test a watch list run reuses the previous run's analysis for an unchanged target"""
+        mock_get.return_value = page()
+        target = WatchTarget(departure_station="大邑", arrival_station="成都南", train_number="C3380")
+
+        first = build_service(container).monitor_targets([target])
+        second = build_service(container).monitor_targets([target])
+
+        assert container.analyzer().analyze.call_count == 1
+        assert second[target] is first[target]
+
+    @patch("requests.Session.get")
+    def test_changed_payload_analyzed_again(self, mock_get, container):
+        """Test a payload change between runs is analyzed and notified"""
+        mock_get.side_effect = [page(99), page(3)]
+
+        self.run(container)
+        self.run(container)
+
+        assert container.analyzer().analyze.call_count == 2
+        assert container.notifier().send.call_count == 2
+
+
+class TestShardWorker:
+    """Test the worker process side of sharded monitoring"""
+
+    @pytest.fixture
+    def worker(self):
+        with patch.dict(os.environ, ENV, clear=True), patch("main.setup_logging"):
+            worker = ShardWorker(workers=4)
+            mock_clients(worker._container)
+            yield worker
+
+    def test_rate_limit_is_split(self, worker):
+        """Test each of N workers gets 1/N of the configured rate"""
+        config = worker._container.config()
+
+        assert config.crawler_rate_limit == pytest.approx(2.0 / 4)
+        assert config.crawler_rate_burst == 1
+
+    @patch("requests.Session.get")
+    def test_poll_repeats_until_remembered(self, mock_get, worker):
+        """Test a poll is reported as new until the coordinator confirms it was notified"""
+        mock_get.return_value = page()
+        targets = [WatchTarget(departure_station="大邑", arrival_station="成都南", train_number="C3380")]
+
+        first = worker((POLL, targets))
+        again = worker((POLL, targets))
+        worker((REMEMBER, None))
+        remembered = worker((POLL, targets))
+
+        assert len(first.new_tickets) == len(again.new_tickets) == 1
+        assert remembered.new_tickets == []
+        assert worker._container.notifier().send_batch.call_count == 0
+
+
+class TestLogCrawlerMetrics:
+    """Test crawler metrics logged after a run"""
+
+    def test_logs_limiter_cache_and_latency(self, container):
+        """Test every metrics source is read and logged"""
+        messages: list[str] = []
+        handler = logger.add(messages.append, format="{message}")
+        try:
+            log_crawler_metrics(container)
+        finally:
+            logger.remove(handler)
+
+        text = "".join(messages)
+        assert "Rate limiter (trains.ctrip.com): concurrency_limit=" in text
+        assert "Response cache: size=0" in text
+        assert "Latency (trains.ctrip.com): samples=0" in text
+
+
+class TestScheduledJobs:
+    """Test the job handed to each scheduler backend"""
+
+    @staticmethod
+    def scheduled(container: Container, backend: str) -> dict:
+        """Keyword arguments the monitoring jobs were scheduled with"""
+        scheduler = Mock()
+        container.scheduler.override(providers.Object(scheduler))
+        with patch.dict(os.environ, {"SCHEDULER_BACKEND": backend}):
+            _run_scheduler(container, None)
+        return scheduler.schedule_multiple_weekly_jobs.call_args.kwargs
+
+    def test_blocking_backend_runs_plain_jobs(self, container):
+        """Test the blocking scheduler gets a plain job"""
+        kwargs = self.scheduled(container, "blocking")
+
+        assert not asyncio.iscoroutinefunction(kwargs["job_func"])
+
+    def test_asyncio_backend_runs_coroutine_job(self, container):
+        """Test the asyncio scheduler gets a coroutine job fetching through the async crawler"""
+        kwargs = self.scheduled(container, "asyncio")
+
+        assert asyncio.iscoroutinefunction(kwargs["job_func"])
+        assert asyncio.iscoroutinefunction(kwargs["warmup_func"])
+
+        with patch("main.run_once_async", new_callable=AsyncMock) as mock_run:
+            asyncio.run(kwargs["job_func"]())
+
+        crawler = mock_run.await_args.args[1]
+        assert isinstance(crawler, AsyncCtripTicketCrawler)
+        assert crawler._client.is_closed
@@ -175,3 +175,85 @@ class TestEmailNotifierConfiguration:
         assert notifier._smtp_host == "smtp.163.com"
         assert notifier._smtp_port == 465
 
+
+
+class TestEmailNotifierBatch:
+    """Test aggregate email notification"""
+
+    @staticmethod
+    def notifier() -> EmailNotifier:
+        """Create notifier"""
+        return EmailNotifier(
+            smtp_host="smtp.gmail.com",
+            smtp_port=587,
+            smtp_user="test@gmail.com",
+            smtp_password="password",
+            from_addr="test@gmail.com",
+            to_addrs=["recipient@example.com"],
+        )
+
+    @staticmethod
+    def analysis_on(date: str, train_number: str = "C3380"):
+        """Create analysis for a given departure date and train"""
+        analysis = mock_analysis(has_ticket=True)
+        query = analysis.raw_data.query.model_copy(update={"departure_date": date, "train_number": train_number})
+        raw_data = analysis.raw_data.model_copy(update={"query": query})
+        return analysis.model_copy(update={"raw_data": raw_data})
+
+    @patch("smtplib.SMTP")
+    def test_send_batch_sends_one_email(self, mock_smtp):
+        """Test several analyses are sent as a single email"""
+        mock_server = Mock()
+        mock_smtp.return_value = mock_server
+
+        self.notifier().send_batch([self.analysis_on("2024-11-17"), self.analysis_on("2024-11-18")])
+
+        assert mock_server.sendmail.call_count == 1
+        message = mock_server.sendmail.call_args.args[2]
+        assert "C3380" in message
+
+    def test_batch_body_lists_every_date(self):
+        """Test aggregate body has one section per date"""
+        plain_text, html = self.notifier()._build_batch_body(
+            [self.analysis_on("2024-11-17"), self.analysis_on("2024-11-18")]
+        )
+
+        assert "2024-11-17" in html
+        assert "2024-11-18" in html
+        assert plain_text.count("✅ TKT AVAIL") == 2
+
+    def test_batch_subject(self):
+        """Test aggregate subject counts dates"""
+        subject = self.notifier()._build_batch_subject(
+            [self.analysis_on("2024-11-17"), self.analysis_on("2024-11-18")]
+        )
+
+        assert subject.startswith("✅ C3380 2d:")
+
+    def test_watch_list_names_every_train(self):
+        """Test a batch covering several trains names each one in the subject and its section"""
+        analyses = [
+            self.analysis_on("2024-11-17"),
+            self.analysis_on("2024-11-18"),
+            self.analysis_on("2024-11-17", train_number="G1"),
+        ]
+
+        subject = self.notifier()._build_batch_subject(analyses)
+        _, html = self.notifier()._build_batch_body(analyses)
+
+        assert subject.startswith("✅ C3380 ")
+        assert "; G1 " in subject
+        assert "2d:" not in subject
+        assert html.count("🚄 C3380 📅") == 2
+        assert html.count("🚄 G1 📅 2024-11-17") == 1
+
+    @patch("smtplib.SMTP")
+    def test_send_batch_single_analysis_uses_send(self, mock_smtp):
+        """Test a batch of one is a regular notification"""
+        notifier = self.notifier()
+        analysis = self.analysis_on("2024-11-17")
+
+        with patch.object(notifier, "send") as mock_send:
+            notifier.send_batch([analysis])
+
+        mock_send.assert_called_once_with(analysis)
@@ -0,0 +1,212 @@
+"""Unit tests for AdaptiveRateLimiter"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from src.infrastructure.crawler import CtripTicketCrawler
+from src.infrastructure.rate_limiter import AdaptiveRateLimiter, RequestOutcome
+from tests.fixtures.mock_data import mock_ticket_query
+from tests.unit.test_crawler import TestFilterBeforeValidate
+
+
+class TestAdaptiveRateLimiter:
+    """Test token bucket and AIMD concurrency control"""
+
+    def test_invalid_parameters(self):
+        """Test invalid configuration is rejected"""
+        with pytest.raises(ValueError):
+            AdaptiveRateLimiter("host", rate=0)
+        with pytest.raises(ValueError):
+            AdaptiveRateLimiter("host", min_concurrency=4, max_concurrency=2)
+        with pytest.raises(ValueError):
+            AdaptiveRateLimiter("host", multiplicative_decrease=1.5)
+
+    def test_initial_concurrency_is_clamped(self):
+        """Test initial limit is kept within bounds"""
+        limiter = AdaptiveRateLimiter("host", initial_concurrency=4, max_concurrency=1)
+
+        assert limiter.concurrency_limit == 1
+
+    def test_additive_increase_on_success(self):
+        """Test each success adds 1/limit, about one per window of successes"""
+        limiter = AdaptiveRateLimiter("host", rate=100, initial_concurrency=2, max_concurrency=8)
+
+        for _ in range(2):
+            limiter.acquire()
+            limiter.release(RequestOutcome.SUCCESS)
+
+        assert limiter.concurrency_limit == pytest.approx(2 + 1 / 2 + 1 / 2.5)
+
+    def test_increase_capped_at_max(self):
+        """Test limit never exceeds max_concurrency"""
+        limiter = AdaptiveRateLimiter("host", rate=1000, burst=100, initial_concurrency=2, max_concurrency=3)
+
+        for _ in range(50):
+            limiter.acquire()
+            limiter.release(RequestOutcome.SUCCESS)
+
+        assert limiter.concurrency_limit == 3
+
+    def test_multiplicative_decrease_on_throttle(self):
+        """Test limit is cut on throttling, down to the minimum"""
+        limiter = AdaptiveRateLimiter("host", initial_concurrency=8, max_concurrency=8)
+
+        limiter.acquire()
+        limiter.release(RequestOutcome.THROTTLED)
+        assert limiter.concurrency_limit == 4
+
+        for _ in range(5):
+            limiter.acquire()
+            limiter.release(RequestOutcome.THROTTLED)
+        assert limiter.concurrency_limit == 1
+
+    def test_error_keeps_limit(self):
+        """Test non-congestion errors do not change the limit"""
+        limiter = AdaptiveRateLimiter("host", initial_concurrency=2)
+
+        limiter.acquire()
+        limiter.release(RequestOutcome.ERROR)
+
+        assert limiter.concurrency_limit == 2
+
+    def test_token_bucket_paces_requests(self):
+        """Test requests beyond the burst wait for tokens"""
+        limiter = AdaptiveRateLimiter("host", rate=50, burst=1)
+
+        start = time.monotonic()
+        for _ in range(3):
+            limiter.acquire()
+            limiter.release(RequestOutcome.ERROR)
+        elapsed = time.monotonic() - start
+
+        # Burst covers the first request, the other two wait 1/50s each
+        assert elapsed >= 0.035
+
+    def test_concurrency_limit_blocks_until_release(self):
+        """Test acquire waits for a free slot"""
+        limiter = AdaptiveRateLimiter("host", rate=100, initial_concurrency=1, max_concurrency=1)
+        limiter.acquire()
+        acquired = threading.Event()
+
+        def worker():
+            limiter.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+
+        assert not acquired.wait(0.1)
+        limiter.release(RequestOutcome.SUCCESS)
+        assert acquired.wait(1)
+        thread.join()
+
+    @pytest.mark.asyncio
+    async def test_acquire_async_respects_limit(self):
+        """Test async acquire never exceeds the concurrency limit"""
+        limiter = AdaptiveRateLimiter("host", rate=1000, burst=100, initial_concurrency=2, max_concurrency=2)
+        in_flight = 0
+        peak = 0
+
+        async def request():
+            nonlocal in_flight, peak
+            await limiter.acquire_async()
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            limiter.release(RequestOutcome.SUCCESS)
+
+        await asyncio.gather(*(request() for _ in range(6)))
+
+        assert peak == 2
+
+    def test_try_acquire_never_waits(self):
+        """Test try_acquire takes a free token and refuses when none is left"""
+        limiter = AdaptiveRateLimiter("host", rate=0.1, burst=1, initial_concurrency=4)
+
+        assert limiter.try_acquire()
+        assert not limiter.try_acquire()
+        assert limiter.metrics()["acquired"] == 1
+
+    def test_cancelled_leaves_limit(self):
+        """Test a cancelled request frees its slot without adapting the limit"""
+        limiter = AdaptiveRateLimiter("host", initial_concurrency=2)
+
+        limiter.acquire()
+        limiter.release(RequestOutcome.CANCELLED)
+
+        assert limiter.concurrency_limit == 2
+        assert limiter.metrics()["cancelled"] == 1
+        assert limiter.metrics()["in_flight"] == 0
+
+    def test_metrics(self):
+        """Test metrics snapshot"""
+        limiter = AdaptiveRateLimiter("host", rate=100)
+
+        limiter.acquire()
+        limiter.release(RequestOutcome.SUCCESS)
+        limiter.acquire()
+        limiter.release(RequestOutcome.THROTTLED)
+        limiter.acquire()
+
+        metrics = limiter.metrics()
+
+        assert metrics["acquired"] == 3
+        assert metrics["in_flight"] == 1
+        assert metrics["successes"] == 1
+        assert metrics["throttled"] == 1
+        assert metrics["errors"] == 0
+        assert metrics["rate"] == 100
+
+
+class TestCrawlerRateLimiting:
+    """Test crawler reports request outcomes to the limiter"""
+
+    PAGE = TestFilterBeforeValidate.page("C3380")
+
+    @patch("requests.Session.get")
+    def test_success_reported(self, mock_get):
+        """Test a page with train data counts as success"""
+        mock_get.return_value = Mock(text=self.PAGE)
+        limiter = AdaptiveRateLimiter("host", rate=100)
+
+        CtripTicketCrawler(rate_limiter=limiter).fetch_tickets(mock_ticket_query())
+
+        metrics = limiter.metrics()
+        assert metrics["successes"] == 1
+        assert metrics["in_flight"] == 0
+
+    @patch("requests.Session.get")
+    def test_empty_page_is_throttle_signal(self, mock_get):
+        """Test a page without train data cuts the limit"""
+        mock_get.return_value = Mock(text="<html><body>Please verify</body></html>")
+        limiter = AdaptiveRateLimiter("host", initial_concurrency=4)
+
+        CtripTicketCrawler(rate_limiter=limiter).fetch_tickets(mock_ticket_query())
+
+        assert limiter.metrics()["throttled"] == 1
+        assert limiter.concurrency_limit == 2
+
+    @pytest.mark.parametrize(
+        "status_code, outcome",
+        [(429, "throttled"), (503, "throttled"), (404, "errors")],
+    )
+    @patch("requests.Session.get")
+    def test_http_errors(self, mock_get, status_code, outcome):
+        """Test 429/5xx are throttle signals and other errors are not"""
+        response = Mock(status_code=status_code)
+        response.raise_for_status.side_effect = requests.HTTPError("error", response=response)
+        mock_get.return_value = response
+        limiter = AdaptiveRateLimiter("host")
+
+        with pytest.raises(Exception):
+            CtripTicketCrawler(rate_limiter=limiter).fetch_tickets(mock_ticket_query())
+
+        metrics = limiter.metrics()
+        assert metrics[outcome] == 1
+        assert metrics["in_flight"] == 0
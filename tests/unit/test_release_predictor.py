@@ -0,0 +1,87 @@
+"""Unit tests for ReleaseTimePredictor"""
+
+from datetime import datetime, time, timedelta
+
+import pytest
+
+from src.application.history_analytics import SeatHistory
+from src.application.release_predictor import ReleaseTimePredictor
+
+
+def _history(polls):
+    """History from (date, poll time, inventory) triples of one C3380 second class seat"""
+    return SeatHistory.from_records(
+        (t.isoformat(), "大邑", "成都南", date, "C3380", "二等座", 15, inventory, int(inventory > 0))
+        for date, t, inventory in polls
+    )
+
+
+def _release_polls(date: str, release: datetime, step: int = 10):
+    """Polls every step seconds around a release: sold out before, available from release on"""
+    return [(date, release + timedelta(seconds=offset), 20 if offset >= 0 else 0) for offset in range(-60, 61, step)]
+
+
+class TestReleaseTimePredictor:
+    """Test ReleaseTimePredictor"""
+
+    def test_invalid_min_observations(self):
+        """Test at least one observation is required"""
+        with pytest.raises(ValueError):
+            ReleaseTimePredictor(min_observations=0)
+
+    def test_release_instant_is_midpoint_of_flip(self):
+        """Test the release is estimated between the last sold-out and first available poll"""
+        release = datetime(2024, 11, 4, 15, 30, 0)
+        history = _history(_release_polls("2024-11-18", release))
+
+        instants = ReleaseTimePredictor().release_instants(history)
+
+        assert [i.astype(datetime) for i in instants] == [release - timedelta(seconds=5)]
+
+    def test_restock_and_long_gap_are_ignored(self):
+        """Test later flips and flips across a long gap are not releases"""
+        release = datetime(2024, 11, 4, 15, 30, 0)
+        polls = _release_polls("2024-11-18", release)
+        polls += [
+            ("2024-11-18", release + timedelta(minutes=5), 0),
+            ("2024-11-18", release + timedelta(minutes=6), 3),
+            ("2024-11-19", release, 0),
+            ("2024-11-19", release + timedelta(hours=2), 10),
+        ]
+
+        instants = ReleaseTimePredictor(max_gap_seconds=600).release_instants(_history(polls))
+
+        assert len(instants) == 1
+
+    def test_already_available_date_has_no_release(self):
+        """Test a date available from its first poll gives no observation"""
+        history = _history([("2024-11-18", datetime(2024, 11, 4, 15, 0), 5)])
+
+        assert len(ReleaseTimePredictor().release_instants(history)) == 0
+
+    def test_predicts_median_time_of_day(self):
+        """Test the prediction is the median release time of day across dates"""
+        polls = []
+        for day, second in enumerate([0, 20, 40, 300]):
+            release = datetime(2024, 11, 4 + day * 7, 15, 30) + timedelta(seconds=second)
+            polls += _release_polls(f"2024-11-{18 + day:02d}", release)
+
+        prediction = ReleaseTimePredictor(min_observations=3).predict(_history(polls), "C3380")
+
+        assert prediction is not None
+        assert prediction.observations == 4
+        assert prediction.release_time == time(15, 30, 25)
+        assert prediction.spread_seconds == pytest.approx(20)
+        assert prediction.at(datetime(2024, 12, 2).date()) == datetime(2024, 12, 2, 15, 30, 25)
+
+    def test_not_enough_observations(self):
+        """Test no prediction below min_observations"""
+        history = _history(_release_polls("2024-11-18", datetime(2024, 11, 4, 15, 30)))
+
+        assert ReleaseTimePredictor(min_observations=2).predict(history, "C3380") is None
+
+    def test_other_trains_are_ignored(self):
+        """Test rows of other trains do not count"""
+        history = _history(_release_polls("2024-11-18", datetime(2024, 11, 4, 15, 30)))
+
+        assert ReleaseTimePredictor(min_observations=1).predict(history, "G1") is None
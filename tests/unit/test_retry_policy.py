@@ -0,0 +1,164 @@
+"""Unit tests for RetryPolicy"""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.application.retry_policy import RetryPolicy
+from src.domain.exceptions import DomainException, RetryExhaustedException
+
+
+class TestBackoff:
+    """Test backoff delays"""
+
+    def test_fibonacci_without_jitter(self):
+        """Test delays follow the Fibonacci sequence"""
+        policy = RetryPolicy(jitter=False)
+
+        assert [policy.backoff(attempt) for attempt in range(1, 7)] == [1, 1, 2, 3, 5, 8]
+
+    def test_full_jitter_range(self):
+        """Test jittered delays stay within [0, fib(n)]"""
+        policy = RetryPolicy()
+
+        for attempt in range(1, 7):
+            delay = policy.backoff(attempt)
+            assert 0 <= delay <= [1, 1, 2, 3, 5, 8][attempt - 1]
+
+    def test_max_delay_caps_wait(self):
+        """Test a single wait never exceeds max_delay"""
+        policy = RetryPolicy(jitter=False, max_delay=4)
+
+        assert policy.backoff(10) == 4
+
+    def test_invalid_attempts(self):
+        """Test at least one attempt is required"""
+        with pytest.raises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+
+class TestRun:
+    """Test synchronous retry loop"""
+
+    @patch("time.sleep")
+    def test_returns_first_non_empty_result(self, mock_sleep):
+        """Test retry stops at the first non-empty result"""
+        func = Mock(side_effect=[[], [], ["train"]])
+
+        result = RetryPolicy(jitter=False).run(func)
+
+        assert result == ["train"]
+        assert func.call_count == 3
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [1, 1]
+
+    @patch("time.sleep")
+    def test_empty_result_returned_when_exhausted(self, mock_sleep):
+        """Test the last empty result is returned once attempts run out"""
+        func = Mock(return_value=[])
+
+        assert RetryPolicy(max_attempts=3, jitter=False).run(func) == []
+        assert func.call_count == 3
+
+    @patch("time.sleep")
+    def test_errors_raise_when_exhausted(self, mock_sleep):
+        """Test the last error is wrapped once attempts run out"""
+        func = Mock(side_effect=ConnectionError("reset"))
+
+        with pytest.raises(RetryExhaustedException) as exc_info:
+            RetryPolicy(max_attempts=3).run(func, operation="fetch tickets")
+
+        assert isinstance(exc_info.value, DomainException)
+        assert "Failed to fetch tickets after 3 attempts" in str(exc_info.value)
+        assert isinstance(exc_info.value.__cause__, ConnectionError)
+
+    @patch("time.sleep")
+    def test_retry_on_empty_disabled(self, mock_sleep):
+        """Test empty results are accepted when retry_on_empty is off"""
+        func = Mock(return_value=[])
+
+        RetryPolicy(retry_on_empty=False).run(func)
+
+        assert func.call_count == 1
+
+    @patch("time.sleep")
+    def test_retry_on_error_disabled(self, mock_sleep):
+        """Test errors fail immediately when retry_on_error is off"""
+        func = Mock(side_effect=ConnectionError("reset"))
+
+        with pytest.raises(RetryExhaustedException):
+            RetryPolicy(retry_on_error=False).run(func)
+
+        assert func.call_count == 1
+
+    @patch("time.sleep")
+    def test_non_retryable_error(self, mock_sleep):
+        """Test only retryable exception types are retried"""
+        func = Mock(side_effect=ValueError("bad page"))
+
+        with pytest.raises(RetryExhaustedException):
+            RetryPolicy(retryable=(ConnectionError,)).run(func)
+
+        assert func.call_count == 1
+
+    def test_deadline_stops_retries(self):
+        """Test no retry is started past the deadline"""
+        clock = [0.0]
+
+        def sleep(seconds):
+            clock[0] += seconds
+
+        func = Mock(return_value=[])
+
+        with patch("time.sleep", side_effect=sleep), patch("time.monotonic", side_effect=lambda: clock[0]):
+            # Waits of 1 + 1 fit in 2.5s, the next wait of 2 does not
+            RetryPolicy(max_attempts=10, deadline=2.5, jitter=False).run(func)
+
+        assert func.call_count == 3
+        assert clock[0] == 2
+
+    @patch("time.sleep")
+    def test_custom_empty_check(self, mock_sleep):
+        """Test is_empty classifies results"""
+        func = Mock(side_effect=[{"trains": []}, {"trains": ["C3380"]}])
+
+        result = RetryPolicy().run(func, is_empty=lambda r: not r["trains"])
+
+        assert result == {"trains": ["C3380"]}
+
+
+class TestRunAsync:
+    """Test asyncio retry loop"""
+
+    @pytest.mark.asyncio
+    async def test_retries_without_blocking_event_loop(self):
+        """Test other coroutines keep running while one is backing off"""
+        attempts = 0
+        ticks = 0
+
+        async def func():
+            nonlocal attempts
+            attempts += 1
+            return ["train"] if attempts == 3 else []
+
+        async def ticker():
+            nonlocal ticks
+            while attempts < 3:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        policy = RetryPolicy(max_delay=0.05)
+        result, _ = await asyncio.gather(policy.run_async(func), ticker())
+
+        assert result == ["train"]
+        assert ticks > 1
+
+    @pytest.mark.asyncio
+    async def test_errors_raise_when_exhausted(self):
+        """Test async errors are wrapped once attempts run out"""
+
+        async def func():
+            raise ConnectionError("reset")
+
+        with pytest.raises(RetryExhaustedException):
+            await RetryPolicy(max_attempts=2, max_delay=0.01).run_async(func)
@@ -1,11 +1,17 @@
 """Unit tests for APSchedulerWrapper"""
 
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
 
 import pytest
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 
-from src.infrastructure.scheduler import APSchedulerWrapper
+from src.infrastructure.job_state import SQLiteJobStateStore
+from src.infrastructure.scheduler import APSchedulerWrapper, AsyncIOSchedulerWrapper
 
 
 class TestAPSchedulerWrapper:
@@ -241,3 +247,293 @@ class TestSchedulerIntegration:
         assert trigger.fields[5].expressions[0].first == 10  # hour
         assert trigger.fields[6].expressions[0].first == 15  # minute
 
+
+
+class TestWarmupScheduling:
+    """Test warm-up jobs ahead of scheduled runs"""
+
+    def test_warmup_job_scheduled_before_job(self):
+        """Test warm-up job fires warmup_seconds before the job"""
+        scheduler = APSchedulerWrapper()
+
+        scheduler.schedule_weekly_job(
+            day_of_week=0,
+            hour=15,
+            minute=30,
+            job_func=Mock(),
+            warmup_func=Mock(),
+            warmup_seconds=30,
+        )
+
+        jobs = {job.id: job for job in scheduler._scheduler.get_jobs()}
+        assert set(jobs) == {"weekly_job_0_15_30", "weekly_warmup_0_15_30"}
+
+        fields = jobs["weekly_warmup_0_15_30"].trigger.fields
+        assert fields[4].expressions[0].first == 0  # day_of_week
+        assert fields[5].expressions[0].first == 15  # hour
+        assert fields[6].expressions[0].first == 29  # minute
+        assert fields[7].expressions[0].first == 30  # second
+
+    def test_no_warmup_when_disabled(self):
+        """Test warmup_seconds=0 schedules no warm-up job"""
+        scheduler = APSchedulerWrapper()
+
+        scheduler.schedule_multiple_weekly_jobs(
+            days_of_week=[0, 2],
+            hour=15,
+            minute=30,
+            job_func=Mock(),
+            warmup_func=Mock(),
+            warmup_seconds=0,
+        )
+
+        assert len(scheduler._scheduler.get_jobs()) == 2
+
+    def test_multiple_jobs_with_warmup(self):
+        """Test each scheduled day gets its own warm-up job"""
+        scheduler = APSchedulerWrapper()
+
+        scheduler.schedule_multiple_weekly_jobs(
+            days_of_week=[0, 2, 4],
+            hour=15,
+            minute=30,
+            job_func=Mock(),
+            warmup_func=Mock(),
+            warmup_seconds=60,
+        )
+
+        job_ids = [job.id for job in scheduler._scheduler.get_jobs()]
+        assert len(job_ids) == 6
+        assert "weekly_warmup_2_15_30" in job_ids
+
+    @pytest.mark.parametrize(
+        ("day", "hour", "minute", "seconds", "expected"),
+        [
+            (0, 15, 30, 30, (0, 15, 29, 30)),
+            (0, 15, 30, 0, (0, 15, 30, 0)),
+            (2, 0, 0, 90, (1, 23, 58, 30)),
+            (0, 0, 0, 10, (6, 23, 59, 50)),  # Wraps to Sunday of the previous week
+        ],
+    )
+    def test_offset_weekly_time(self, day, hour, minute, seconds, expected):
+        """Test warm-up time offsets across minute, day and week boundaries"""
+        assert APSchedulerWrapper._offset_weekly_time(day, hour, minute, seconds) == expected
+
+
+class TestLeadScheduling:
+    """Test jobs started ahead of the scheduled time"""
+
+    def test_job_starts_lead_seconds_early(self):
+        """Test lead_seconds shifts the job and its warm-up earlier"""
+        scheduler = APSchedulerWrapper()
+
+        scheduler.schedule_weekly_job(
+            day_of_week=0,
+            hour=15,
+            minute=30,
+            job_func=Mock(),
+            warmup_func=Mock(),
+            warmup_seconds=30,
+            lead_seconds=5,
+        )
+
+        jobs = {job.id: job for job in scheduler._scheduler.get_jobs()}
+
+        job_fields = jobs["weekly_job_0_15_30"].trigger.fields
+        assert job_fields[6].expressions[0].first == 29  # minute
+        assert job_fields[7].expressions[0].first == 55  # second
+
+        warmup_fields = jobs["weekly_warmup_0_15_30"].trigger.fields
+        assert warmup_fields[6].expressions[0].first == 29  # minute
+        assert warmup_fields[7].expressions[0].first == 25  # second
+
+
+class TestCronAndIntervalJobs:
+    """Test generic cron and interval jobs"""
+
+    def test_cron_job_options(self):
+        """Test cron jobs carry max_instances and coalesce"""
+        scheduler = APSchedulerWrapper()
+
+        scheduler.schedule_cron_job("release", Mock(), day_of_week="mon-fri", hour=15, minute=30, max_instances=3)
+
+        job = scheduler._scheduler.get_job("release")
+        assert isinstance(job.trigger, CronTrigger)
+        assert job.max_instances == 3
+        assert job.coalesce is True
+
+    def test_interval_job_options(self):
+        """Test interval jobs carry their interval and coalesce setting"""
+        scheduler = APSchedulerWrapper()
+
+        scheduler.schedule_interval_job("poll", Mock(), seconds=10, coalesce=False)
+
+        jobs = scheduler._scheduler.get_jobs()
+        assert len(jobs) == 1
+        assert isinstance(jobs[0].trigger, IntervalTrigger)
+        assert jobs[0].trigger.interval.total_seconds() == 10
+        assert jobs[0].coalesce is False
+
+
+class TestAsyncIOSchedulerWrapper:
+    """Test asyncio scheduler"""
+
+    def test_weekly_jobs_use_shared_offsets(self):
+        """Test weekly scheduling behaves like the blocking wrapper"""
+        scheduler = AsyncIOSchedulerWrapper()
+
+        scheduler.schedule_multiple_weekly_jobs(days_of_week=[0, 2], hour=15, minute=30, job_func=Mock())
+
+        assert {job.id for job in scheduler._scheduler.get_jobs()} == {"weekly_job_0_15_30", "weekly_job_2_15_30"}
+
+    def test_runs_coroutine_jobs_concurrently_on_one_loop(self):
+        """Test coroutine jobs overlap on the event loop thread"""
+        scheduler = AsyncIOSchedulerWrapper()
+        threads = set()
+        running = []
+        peak = []
+
+        async def job():
+            threads.add(threading.get_ident())
+            running.append(1)
+            peak.append(len(running))
+            await asyncio.sleep(0.2)
+            running.pop()
+
+        async def main():
+            loop_thread = threading.get_ident()
+            scheduler.schedule_interval_job("burst-a", job, seconds=0.05)
+            scheduler.schedule_interval_job("burst-b", job, seconds=0.05)
+            task = asyncio.create_task(scheduler.run())
+            await asyncio.sleep(0.4)
+            scheduler.shutdown()
+            await task
+            return loop_thread
+
+        loop_thread = asyncio.run(main())
+
+        assert threads == {loop_thread}
+        assert max(peak) == 2  # max_instances=1 per job, two jobs overlap
+
+    def test_start_blocks_until_shutdown(self):
+        """Test start runs its own loop and returns after shutdown from another thread"""
+        scheduler = AsyncIOSchedulerWrapper()
+        calls = []
+        scheduler.schedule_interval_job("tick", lambda: calls.append(1), seconds=0.05)
+
+        stopper = threading.Timer(0.3, scheduler.shutdown)
+        stopper.start()
+        started = time.monotonic()
+        scheduler.start()
+
+        assert time.monotonic() - started >= 0.25
+        assert calls
+        assert not scheduler._scheduler.running
+
+    def test_shutdown_before_start(self):
+        """Test shutdown without a running loop is a no-op"""
+        AsyncIOSchedulerWrapper().shutdown()
+
+
+class TestMisfireRecovery:
+    """Test replaying runs missed while the process was down"""
+
+    @staticmethod
+    def scheduler_with_state(tmp_path, next_run_at, last_run_at=None, grace=300):
+        store = SQLiteJobStateStore(tmp_path / "scheduler.db")
+        store.record_next_run("weekly_job_0_15_30", next_run_at)
+        if last_run_at is not None:
+            store.record_run("weekly_job_0_15_30", last_run_at, "success")
+
+        scheduler = APSchedulerWrapper(job_state=store, misfire_grace_seconds=grace)
+        scheduler.schedule_weekly_job(day_of_week=0, hour=15, minute=30, job_func=Mock())
+        return scheduler
+
+    def test_missed_run_is_replayed(self, tmp_path):
+        """Test a run missed within the grace period is scheduled immediately"""
+        missed_at = datetime.now().astimezone() - timedelta(seconds=60)
+        scheduler = self.scheduler_with_state(tmp_path, missed_at)
+
+        scheduler._recover_missed_runs()
+
+        job_ids = {job.id for job in scheduler._scheduler.get_jobs()}
+        assert job_ids == {"weekly_job_0_15_30", "weekly_job_0_15_30__recovery"}
+
+    def test_stable_job_id_recovered_after_time_change(self, tmp_path):
+        """Test a missed run is still found when the job now runs at another (e.g. predicted) time"""
+        store = SQLiteJobStateStore(tmp_path / "scheduler.db")
+        store.record_next_run("ticket_monitor_0", datetime.now().astimezone() - timedelta(seconds=60))
+        scheduler = APSchedulerWrapper(job_state=store)
+        scheduler.schedule_multiple_weekly_jobs(
+            days_of_week=[0],
+            hour=15,
+            minute=31,
+            job_func=Mock(),
+            warmup_func=Mock(),
+            warmup_seconds=30,
+            job_id="ticket_monitor",
+        )
+
+        scheduler._recover_missed_runs()
+
+        job_ids = {job.id for job in scheduler._scheduler.get_jobs()}
+        assert job_ids == {"ticket_monitor_0", "ticket_monitor_0_warmup", "ticket_monitor_0__recovery"}
+
+    def test_run_older_than_grace_is_skipped(self, tmp_path):
+        """Test a run missed longer ago than the grace period is not replayed"""
+        missed_at = datetime.now().astimezone() - timedelta(hours=1)
+        scheduler = self.scheduler_with_state(tmp_path, missed_at)
+
+        scheduler._recover_missed_runs()
+
+        assert len(scheduler._scheduler.get_jobs()) == 1
+
+    def test_completed_run_is_not_replayed(self, tmp_path):
+        """Test a run that finished before the restart is not replayed"""
+        due_at = datetime.now().astimezone() - timedelta(seconds=60)
+        scheduler = self.scheduler_with_state(tmp_path, due_at, last_run_at=due_at)
+
+        scheduler._recover_missed_runs()
+
+        assert len(scheduler._scheduler.get_jobs()) == 1
+
+    def test_future_run_is_not_replayed(self, tmp_path):
+        """Test a run that is not due yet is left to its trigger"""
+        scheduler = self.scheduler_with_state(tmp_path, datetime.now().astimezone() + timedelta(hours=1))
+
+        scheduler._recover_missed_runs()
+
+        assert len(scheduler._scheduler.get_jobs()) == 1
+
+    def test_misfire_grace_applies_to_jobs(self):
+        """Test scheduled jobs use the configured misfire grace time"""
+        scheduler = APSchedulerWrapper(misfire_grace_seconds=120)
+        scheduler.schedule_weekly_job(day_of_week=0, hour=15, minute=30, job_func=Mock())
+
+        job = scheduler._scheduler.get_jobs()[0]
+        assert job.misfire_grace_time == 120
+        assert job.coalesce is True
+
+    def test_runs_and_next_runs_are_persisted(self, tmp_path):
+        """Test a running scheduler records each run and the following run time"""
+        store = SQLiteJobStateStore(tmp_path / "scheduler.db")
+        scheduler = AsyncIOSchedulerWrapper(job_state=store)
+
+        async def failing():
+            raise RuntimeError("boom")
+
+        scheduler.schedule_interval_job("ok", Mock(), seconds=0.05)
+        scheduler.schedule_interval_job("fails", failing, seconds=0.05)
+
+        async def main():
+            task = asyncio.create_task(scheduler.run())
+            await asyncio.sleep(0.3)
+            scheduler.shutdown()
+            await task
+
+        asyncio.run(main())
+
+        states = {state.job_id: state for state in store.all()}
+        assert states["ok"].last_status == "success"
+        assert states["fails"].last_status == "error"
+        assert states["ok"].next_run_at > states["ok"].last_run_at
@@ -0,0 +1,181 @@
+"""Unit tests for watch list sharding"""
+
+import hashlib
+from unittest.mock import Mock
+
+import pytest
+
+from src.application.sharding import POLL, REMEMBER, ShardedTargetMonitor, partition_targets, shard_index
+from src.domain.exceptions import DomainException
+from src.domain.models import WatchListResult, WatchTarget
+from tests.fixtures.mock_data import mock_analysis
+
+
+def _targets(count: int, route: str = "成都南") -> list[WatchTarget]:
+    return [
+        WatchTarget(departure_station="大邑", arrival_station=route, train_number=f"C{3300 + i}") for i in range(count)
+    ]
+
+
+def _resolve_date(days_ahead: int) -> str:
+    return f"2024-11-{days_ahead:02d}"
+
+
+class FakePool:
+    """In-process pool answering each polled shard with one new ticket per target"""
+
+    def __init__(self, size: int, fail: set[int] | None = None) -> None:
+        self.size = size
+        self.fail = fail or set()
+        self.calls = []
+
+    @property
+    def payloads(self):
+        """Payloads of the last poll"""
+        polls = [payloads for payloads in self.calls if any(p and p[0] == POLL for p in payloads)]
+        return [p and p[1] for p in polls[-1]] if polls else None
+
+    def map(self, payloads, timeout=None):
+        self.calls.append(payloads)
+        return [
+            None
+            if payload is None
+            else RuntimeError("worker died")
+            if index in self.fail
+            else None
+            if payload[0] == REMEMBER
+            else WatchListResult(
+                analyses={target: mock_analysis(has_ticket=True) for target in payload[1]},
+                new_tickets=[mock_analysis(has_ticket=True) for _ in payload[1]],
+            )
+            for index, payload in enumerate(payloads)
+        ]
+
+
+class TestShardIndex:
+    """Test stable list page hashing"""
+
+    def test_known_value(self):
+        """Test the shard does not depend on the process (no salted hash())"""
+        page = ("大邑", "成都南", "2024-11-15")
+
+        assert shard_index(page, 7) == hex_digest_mod(page, 7)
+
+    def test_station_whitespace_is_ignored(self):
+        """Test targets that need the same page land on the same shard"""
+        a = WatchTarget(departure_station="大邑", arrival_station="成都南", train_number="C3380")
+        b = WatchTarget(departure_station=" 大邑 ", arrival_station="成都南", train_number="C3382")
+
+        partitions = partition_targets([a, b], 16, _resolve_date)
+
+        assert [a, b] in partitions
+
+    def test_page_stays_on_one_shard(self):
+        """Test every train on one route and date is dispatched to the same worker"""
+        partitions = partition_targets(_targets(8), 4, _resolve_date)
+
+        assert sorted(map(len, partitions)) == [0, 0, 0, 8]
+
+    def test_spreads_pages(self):
+        """Test distinct routes and dates are spread over every shard"""
+        targets = [
+            target.model_copy(update={"days_ahead": day})
+            for route in range(20)
+            for target in _targets(2, route=f"站{route}")
+            for day in range(1, 11)
+        ]
+
+        partitions = partition_targets(targets, 4, _resolve_date)
+
+        assert all(len(partition) > 40 for partition in partitions)
+        assert sum(map(len, partitions)) == 400
+
+    def test_partition_deduplicates(self):
+        """Test duplicate targets are dispatched once"""
+        targets = _targets(3)
+
+        assert sum(map(len, partition_targets(targets + targets, 2, _resolve_date))) == 3
+
+    def test_invalid_shard_count(self):
+        """Test at least one shard is required"""
+        with pytest.raises(ValueError):
+            partition_targets(_targets(1), 0, _resolve_date)
+
+
+def hex_digest_mod(page: tuple[str, str, str], shards: int) -> int:
+    """Reference implementation of the documented hash"""
+    key = "|".join(page)
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big") % shards
+
+
+class TestShardedTargetMonitor:
+    """Test the sharding coordinator"""
+
+    @staticmethod
+    def monitor(pool: FakePool, targets: list[WatchTarget], notifier: Mock | None = None):
+        return ShardedTargetMonitor(pool, notifier or Mock(), _resolve_date).monitor(targets)
+
+    @staticmethod
+    def spread_targets() -> list[WatchTarget]:
+        """Targets on several routes, so more than one shard is busy"""
+        return [target for route in range(10) for target in _targets(2, route=f"站{route}")]
+
+    def test_merges_worker_results(self):
+        """Test every target's analysis comes back from the worker of its page"""
+        pool = FakePool(size=3)
+        targets = self.spread_targets()
+
+        analyses = self.monitor(pool, targets)
+
+        assert set(analyses) == set(targets)
+        for index, payload in enumerate(pool.payloads):
+            for target in payload or []:
+                page = (target.departure_station, target.arrival_station, _resolve_date(target.days_ahead))
+                assert shard_index(page, 3) == index
+
+    def test_one_notification_per_run(self):
+        """Test the coordinator sends one aggregate notification, then workers remember their poll"""
+        pool = FakePool(size=3)
+        notifier = Mock()
+        targets = self.spread_targets()
+
+        self.monitor(pool, targets, notifier)
+
+        notifier.send_batch.assert_called_once()
+        assert len(notifier.send_batch.call_args.args[0]) == len(targets)
+        assert [payload and payload[0] for payload in pool.calls[-1]] == [
+            REMEMBER if shard else None for shard in pool.payloads
+        ]
+
+    def test_failed_notification_is_not_remembered(self):
+        """Test workers are not told to remember a poll whose notification failed"""
+        pool = FakePool(size=2)
+        notifier = Mock()
+        notifier.send_batch.side_effect = ConnectionError("SMTP down")
+
+        with pytest.raises(ConnectionError):
+            self.monitor(pool, _targets(2), notifier)
+
+        assert len(pool.calls) == 1
+
+    def test_failed_worker_is_skipped(self):
+        """Test results of healthy workers survive a failed one"""
+        targets = self.spread_targets()
+        pool = FakePool(size=2, fail={0})
+
+        analyses = self.monitor(pool, targets)
+
+        assert analyses and set(analyses) == set(pool.payloads[1])
+        assert pool.calls[-1][0] is None
+
+    def test_all_workers_failed(self):
+        """Test an error is raised when no shard succeeded"""
+        with pytest.raises(DomainException):
+            self.monitor(FakePool(size=2, fail={0, 1}), self.spread_targets())
+
+    def test_empty_watch_list(self):
+        """Test an empty watch list dispatches nothing"""
+        pool = FakePool(size=2)
+
+        assert self.monitor(pool, []) == {}
+        assert pool.payloads is None
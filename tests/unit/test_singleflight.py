@@ -0,0 +1,134 @@
+"""Unit tests for SingleFlight"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.infrastructure.crawler import CtripTicketCrawler
+from src.infrastructure.singleflight import SingleFlight
+from tests.fixtures.mock_data import mock_ticket_query
+
+
+class TestSingleFlight:
+    """Test thread-based coalescing"""
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Test identical concurrent calls run the function once"""
+        flight = SingleFlight()
+        calls = []
+        release = threading.Event()
+
+        def slow():
+            calls.append(1)
+            release.wait(1)
+            return "page"
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(flight.do, "key", slow) for _ in range(4)]
+            time.sleep(0.05)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert results == ["page"] * 4
+        assert len(calls) == 1
+        assert flight.coalesced == 3
+
+    def test_different_keys_run_separately(self):
+        """Test calls with different keys are not coalesced"""
+        flight = SingleFlight()
+
+        assert flight.do("a", lambda: 1) == 1
+        assert flight.do("b", lambda: 2) == 2
+        assert flight.coalesced == 0
+
+    def test_sequential_calls_run_again(self):
+        """Test a finished call does not serve later callers"""
+        flight = SingleFlight()
+        fn = Mock(return_value="page")
+
+        flight.do("key", fn)
+        flight.do("key", fn)
+
+        assert fn.call_count == 2
+
+    def test_error_is_shared_with_waiters(self):
+        """Test waiters receive the leader's exception"""
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def failing():
+            release.wait(1)
+            raise ConnectionError("refused")
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [pool.submit(flight.do, "key", failing) for _ in range(2)]
+            time.sleep(0.05)
+            release.set()
+
+            for future in futures:
+                with pytest.raises(ConnectionError):
+                    future.result()
+
+
+class TestAsyncSingleFlight:
+    """Test coroutine-based coalescing"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_coroutines_share_one_execution(self):
+        """Test identical concurrent coroutines await one execution"""
+        flight = SingleFlight()
+        calls = []
+
+        async def slow():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "page"
+
+        results = await asyncio.gather(*(flight.do_async("key", slow) for _ in range(5)))
+
+        assert results == ["page"] * 5
+        assert len(calls) == 1
+        assert flight.coalesced == 4
+
+    @pytest.mark.asyncio
+    async def test_error_is_shared_with_waiters(self):
+        """Test waiting coroutines receive the leader's exception"""
+        flight = SingleFlight()
+
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise ConnectionError("refused")
+
+        results = await asyncio.gather(*(flight.do_async("key", failing) for _ in range(3)), return_exceptions=True)
+
+        assert all(isinstance(result, ConnectionError) for result in results)
+
+
+class TestCrawlerCoalescing:
+    """Test crawler integration"""
+
+    @patch("requests.Session.get")
+    def test_concurrent_identical_queries_send_one_request(self, mock_get):
+        """Test two crawlers polling the same page at once hit Ctrip once"""
+        release = threading.Event()
+
+        def slow_get(*args, **kwargs):
+            release.wait(1)
+            return Mock(text="<html></html>")
+
+        mock_get.side_effect = slow_get
+        flight = SingleFlight()
+        crawlers = [CtripTicketCrawler(single_flight=flight) for _ in range(3)]
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [pool.submit(crawler.fetch_tickets, mock_ticket_query()) for crawler in crawlers]
+            time.sleep(0.05)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert mock_get.call_count == 1
+        assert len(results) == 3
@@ -0,0 +1,151 @@
+"""Unit tests for SQLiteSnapshotStore"""
+
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.domain.models import SeatType
+from src.infrastructure.snapshot_store import SQLiteSnapshotStore, open_snapshot_store
+from tests.fixtures.mock_data import mock_query_result
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Store in a temporary directory, closed after the test"""
+    store = SQLiteSnapshotStore(tmp_path / "history" / "snapshots.db", flush_interval=0.01)
+    yield store
+    store.close()
+
+
+class TestSQLiteSnapshotStore:
+    """Test SQLiteSnapshotStore"""
+
+    def test_records_seat_level_rows(self, store):
+        """Test a result is stored as one row per train seat"""
+        store.record(mock_query_result(has_tickets=True))
+        store.flush()
+
+        history = store.history("C3380")
+
+        assert [s.seat_type for s in history] == [SeatType.SECOND_CLASS, SeatType.FIRST_CLASS]
+        assert history[0].inventory == 99
+        assert history[0].bookable is True
+        assert history[0].departure_date == "2024-11-17"
+        assert history[0].query_time == datetime(2024, 11, 2, 15, 30, 0)
+        assert store.written == 2
+
+    def test_empty_result_is_not_recorded(self, store):
+        """Test a result without trains writes nothing"""
+        store.record(mock_query_result(has_tickets=False))
+        store.flush()
+
+        assert store.history("C3380") == []
+
+    def test_history_filters(self, store):
+        """Test history filters by date and poll time, oldest first"""
+        base = mock_query_result(has_tickets=True)
+        later = base.model_copy(update={"query_time": base.query_time + timedelta(minutes=5)})
+        other_date = base.model_copy(update={"query": base.query.model_copy(update={"departure_date": "2024-11-18"})})
+        for result in (later, base, other_date):
+            store.record(result)
+        store.flush()
+
+        assert len(store.history("C3380")) == 6
+        assert len(store.history("C3380", departure_date="2024-11-17")) == 4
+        assert {s.query_time for s in store.history("C3380", since=later.query_time)} == {later.query_time}
+        assert store.history("C3380", departure_date="2024-11-17")[0].query_time == base.query_time
+        assert store.history("G1") == []
+
+    def test_history_filters_route(self, store):
+        """Test history filters by queried stations, so one train number on two routes stays apart"""
+        base = mock_query_result(has_tickets=True)
+        other_route = base.model_copy(update={"query": base.query.model_copy(update={"departure_station": "崇州"})})
+        for result in (base, other_route):
+            store.record(result)
+        store.flush()
+
+        route = {"departure_station": base.query.departure_station, "arrival_station": base.query.arrival_station}
+        assert len(store.history("C3380")) == 4
+        assert len(store.history("C3380", **route)) == 2
+        assert len(store.history("C3380", departure_station="崇州")) == 2
+        assert store.history("C3380", departure_station="崇州", arrival_station="北京") == []
+
+    def test_wal_mode_and_index(self, store, tmp_path):
+        """Test the database runs in WAL mode with the history index"""
+        conn = sqlite3.connect(tmp_path / "history" / "snapshots.db")
+        try:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+            columns = [row[2] for row in conn.execute("PRAGMA index_info(idx_seat_snapshots_train_date_time)")]
+        finally:
+            conn.close()
+
+        assert mode == "wal"
+        assert columns == ["train_number", "departure_date", "query_time"]
+
+    def test_record_does_not_wait_for_writer(self, tmp_path):
+        """Test record returns while the writer is busy and drops results once the queue is full"""
+        store = SQLiteSnapshotStore(tmp_path / "snapshots.db", batch_size=1, max_pending=1, flush_interval=0.01)
+        release = threading.Event()
+        original = store._write_batch
+
+        def slow_write(conn, batch):
+            release.wait(5)
+            original(conn, batch)
+
+        store._write_batch = slow_write
+        try:
+            for _ in range(5):
+                store.record(mock_query_result(has_tickets=True))
+
+            assert store.dropped >= 3
+        finally:
+            release.set()
+            store.close()
+
+        assert store.written == 2 * (5 - store.dropped)
+
+    def test_batches_results_per_transaction(self, tmp_path):
+        """Test queued results are written together"""
+        store = SQLiteSnapshotStore(tmp_path / "snapshots.db", batch_size=10, flush_interval=0.2)
+        batches = []
+        original = store._write_batch
+
+        def counting_write(conn, batch):
+            batches.append(len(batch))
+            original(conn, batch)
+
+        store._write_batch = counting_write
+        for _ in range(5):
+            store.record(mock_query_result(has_tickets=True))
+        store.close()
+
+        assert sum(batches) == 5
+        assert len(batches) < 5
+        assert store.written == 10
+
+    def test_close_persists_pending_results(self, tmp_path):
+        """Test close commits what is still queued and can be called twice"""
+        store = SQLiteSnapshotStore(tmp_path / "snapshots.db")
+        store.record(mock_query_result(has_tickets=True))
+        store.close()
+        store.close()
+
+        assert len(store.history("C3380")) == 2
+
+
+class TestOpenSnapshotStore:
+    """Test open_snapshot_store"""
+
+    def test_empty_path_disables(self):
+        """Test an empty path disables persistence"""
+        assert open_snapshot_store("") is None
+
+    def test_opens_store(self, tmp_path):
+        """Test a path opens a store"""
+        store = open_snapshot_store(str(tmp_path / "snapshots.db"))
+        try:
+            assert isinstance(store, SQLiteSnapshotStore)
+        finally:
+            store.close()
@@ -1,13 +1,20 @@
 """Unit tests for TicketMonitorService"""
 
+import threading
 import time
-from unittest.mock import Mock, patch
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+from src.application.burst_poller import AsyncBurstPoller, BurstPoller
+from src.application.inventory_delta import InventoryDeltaEngine
+from src.application.retry_policy import RetryPolicy
 from src.application.ticket_service import TicketMonitorService
 from src.domain.exceptions import DomainException
-from tests.fixtures.mock_data import mock_query_result
+from src.domain.interfaces import IAsyncTicketCrawler
+from src.domain.models import WatchTarget
+from tests.fixtures.mock_data import mock_analysis, mock_query_result
 
 
 class TestTicketMonitorService:
@@ -105,8 +112,9 @@ class TestTicketMonitorService:
         assert mock_analyzer.analyze.call_count == 0
         assert mock_notifier.send.call_count == 0
 
+    @patch("random.uniform", side_effect=lambda low, high: high)  # Full jitter at its upper bound
     @patch("time.sleep")  # Mock sleep to speed up tests
-    def test_fibonacci_backoff_timing(self, mock_sleep, mock_crawler_no_tickets, mock_analyzer, mock_notifier):
+    def test_fibonacci_backoff_timing(self, mock_sleep, mock_uniform, mock_crawler_no_tickets, mock_analyzer, mock_notifier):
         """Test Fibonacci backoff timing"""
         service = TicketMonitorService(
             crawler=mock_crawler_no_tickets,
@@ -159,8 +167,9 @@ class TestTicketMonitorService:
 class TestFetchWithRetry:
     """Dedicated tests for retry mechanism"""
 
+    @patch("random.uniform", side_effect=lambda low, high: high)  # Full jitter at its upper bound
     @patch("time.sleep")
-    def test_retry_with_incremental_backoff(self, mock_sleep, mock_crawler_no_tickets, mock_analyzer, mock_notifier):
+    def test_retry_with_incremental_backoff(self, mock_sleep, mock_uniform, mock_crawler_no_tickets, mock_analyzer, mock_notifier):
         """Test incremental backoff"""
         service = TicketMonitorService(
             crawler=mock_crawler_no_tickets,
@@ -237,3 +246,515 @@ class TestFetchWithRetry:
         # Verify wait times: 1 second, 1 second
         assert mock_sleep.call_count == 2
 
+    def test_fetched_result_is_recorded(self, mock_crawler, mock_analyzer, mock_notifier):
+        """Test the final fetched result is handed to the snapshot store"""
+        store = Mock()
+        service = TicketMonitorService(
+            crawler=mock_crawler,
+            analyzer=mock_analyzer,
+            notifier=mock_notifier,
+            snapshot_store=store,
+        )
+
+        service.monitor_ticket(
+            departure_station="大邑",
+            arrival_station="成都南",
+            train_number="C3380",
+            days_ahead=15,
+        )
+
+        store.record.assert_called_once_with(mock_crawler.fetch_tickets.return_value)
+
+
+
+class TestUnchangedResults:
+    """Tests for skipping work on unchanged polls"""
+
+    def test_unchanged_result_skips_analysis_and_notification(self, mock_analyzer, mock_notifier):
+        """Test an unchanged payload reuses the previous analysis"""
+        fresh = mock_query_result(has_tickets=True)
+        crawler = Mock()
+        crawler.fetch_tickets.side_effect = [fresh, fresh.model_copy(update={"unchanged": True})]
+
+        service = TicketMonitorService(
+            crawler=crawler,
+            analyzer=mock_analyzer,
+            notifier=mock_notifier,
+        )
+
+        for _ in range(2):
+            service.monitor_ticket(
+                departure_station="大邑",
+                arrival_station="成都南",
+                train_number="C3380",
+                days_ahead=15,
+            )
+
+        assert crawler.fetch_tickets.call_count == 2
+        assert mock_analyzer.analyze.call_count == 1
+        assert mock_notifier.send.call_count == 1
+
+    def test_unchanged_without_previous_analysis_is_analyzed(self, mock_analyzer, mock_notifier):
+        """Test an unchanged flag is ignored when this service has not analyzed the query yet"""
+        crawler = Mock()
+        crawler.fetch_tickets.return_value = mock_query_result(has_tickets=True).model_copy(update={"unchanged": True})
+
+        service = TicketMonitorService(
+            crawler=crawler,
+            analyzer=mock_analyzer,
+            notifier=mock_notifier,
+        )
+
+        service.monitor_ticket(
+            departure_station="大邑",
+            arrival_station="成都南",
+            train_number="C3380",
+            days_ahead=15,
+        )
+
+        assert mock_analyzer.analyze.call_count == 1
+        assert mock_notifier.send.call_count == 1
+
+    def test_failed_notification_is_retried_on_unchanged_poll(self, mock_analyzer, mock_notifier):
+        """Test an analysis whose notification failed is not reused by the next unchanged poll"""
+        fresh = mock_query_result(has_tickets=True)
+        crawler = Mock()
+        crawler.fetch_tickets.side_effect = [fresh, fresh.model_copy(update={"unchanged": True})]
+        mock_notifier.send.side_effect = [ConnectionError("SMTP down"), None]
+        service = TicketMonitorService(crawler=crawler, analyzer=mock_analyzer, notifier=mock_notifier)
+
+        def monitor():
+            service.monitor_ticket(
+                departure_station="大邑",
+                arrival_station="成都南",
+                train_number="C3380",
+                days_ahead=15,
+            )
+
+        with pytest.raises(ConnectionError):
+            monitor()
+        monitor()
+
+        assert mock_analyzer.analyze.call_count == 2
+        assert mock_notifier.send.call_count == 2
+
+
+class TestInventoryEvents:
+    """Tests for analyzing and notifying only on inventory events"""
+
+    @staticmethod
+    def monitor(service):
+        service.monitor_ticket(
+            departure_station="大邑",
+            arrival_station="成都南",
+            train_number="C3380",
+            days_ahead=15,
+        )
+
+    def test_repeated_inventory_skips_analysis(self, mock_analyzer, mock_notifier):
+        """Test a refetched payload with the same inventory is not analyzed again"""
+        crawler = Mock()
+        crawler.fetch_tickets.side_effect = [mock_query_result(has_tickets=True), mock_query_result(has_tickets=True)]
+        service = TicketMonitorService(
+            crawler=crawler,
+            analyzer=mock_analyzer,
+            notifier=mock_notifier,
+            delta_engine=InventoryDeltaEngine(),
+        )
+
+        self.monitor(service)
+        self.monitor(service)
+
+        assert mock_analyzer.analyze.call_count == 1
+        assert mock_notifier.send.call_count == 1
+
+    def test_inventory_change_is_analyzed(self, mock_analyzer, mock_notifier):
+        """Test an inventory drop triggers a new analysis"""
+        fresh = mock_query_result(has_tickets=True)
+        train = fresh.trains[0]
+        dropped = fresh.model_copy(
+            update={
+                "trains": [
+                    train.model_copy(
+                        update={"seats": [train.seats[0].model_copy(update={"inventory": 5}), *train.seats[1:]]}
+                    )
+                ]
+            }
+        )
+        crawler = Mock()
+        crawler.fetch_tickets.side_effect = [fresh, dropped]
+        service = TicketMonitorService(
+            crawler=crawler,
+            analyzer=mock_analyzer,
+            notifier=mock_notifier,
+            delta_engine=InventoryDeltaEngine(),
+        )
+
+        self.monitor(service)
+        self.monitor(service)
+
+        assert mock_analyzer.analyze.call_count == 2
+
+    @patch("time.sleep")
+    def test_no_events_skips_analysis(self, mock_sleep, mock_crawler_no_tickets, mock_analyzer, mock_notifier):
+        """Test a poll without available seats and no prior state is not analyzed"""
+        service = TicketMonitorService(
+            crawler=mock_crawler_no_tickets,
+            analyzer=mock_analyzer,
+            notifier=mock_notifier,
+            max_retries=1,
+            delta_engine=InventoryDeltaEngine(),
+        )
+
+        self.monitor(service)
+
+        assert mock_analyzer.analyze.call_count == 0
+        assert mock_notifier.send.call_count == 0
+
+    def test_shared_engine_suppresses_repeat_sweep_notification(self, mock_crawler, mock_analyzer, mock_notifier):
+        """Test a fresh service sharing the engine does not notify again without events"""
+        engine = InventoryDeltaEngine()
+
+        for _ in range(2):
+            service = TicketMonitorService(
+                crawler=mock_crawler,
+                analyzer=mock_analyzer,
+                notifier=mock_notifier,
+                delta_engine=engine,
+            )
+            service.sweep_tickets(
+                departure_station="大邑",
+                arrival_station="成都南",
+                train_number="C3380",
+                days=range(1, 3),
+            )
+
+        assert mock_notifier.send_batch.call_count == 1
+
+    def test_failed_notification_keeps_events(self, mock_analyzer, mock_notifier):
+        """Test events whose notification failed are reported again on the next poll"""
+        crawler = Mock()
+        crawler.fetch_tickets.side_effect = [mock_query_result(has_tickets=True), mock_query_result(has_tickets=True)]
+        mock_notifier.send.side_effect = [ConnectionError("SMTP down"), None]
+        engine = InventoryDeltaEngine()
+        service = TicketMonitorService(
+            crawler=crawler,
+            analyzer=mock_analyzer,
+            notifier=mock_notifier,
+            delta_engine=engine,
+        )
+
+        with pytest.raises(ConnectionError):
+            self.monitor(service)
+        assert len(engine) == 0
+        self.monitor(service)
+
+        assert mock_analyzer.analyze.call_count == 2
+        assert mock_notifier.send.call_count == 2
+        assert len(engine) > 0
+
+    def test_failed_analysis_keeps_events(self, mock_analyzer, mock_notifier):
+        """Test events whose analysis failed are analyzed and notified on the next watch list poll"""
+        crawler = Mock()
+        crawler.fetch_tickets.side_effect = [mock_query_result(has_tickets=True), mock_query_result(has_tickets=True)]
+        mock_analyzer.analyze.side_effect = [RuntimeError("API down"), mock_analysis(has_ticket=True)]
+        service = TicketMonitorService(
+            crawler=crawler,
+            analyzer=mock_analyzer,
+            notifier=mock_notifier,
+            delta_engine=InventoryDeltaEngine(),
+        )
+        targets = [WatchTarget(departure_station="大邑", arrival_station="成都南", train_number="C3380", days_ahead=15)]
+
+        with pytest.raises(RuntimeError):
+            service.monitor_targets(targets)
+        service.monitor_targets(targets)
+
+        assert mock_notifier.send_batch.call_count == 1
+
+
+class TestSweepTickets:
+    """Tests for multi-date sweep"""
+
+    @staticmethod
+    def sweep(service: TicketMonitorService, days=range(1, 6), weekdays=None):
+        """Run a sweep over the given days"""
+        return service.sweep_tickets(
+            departure_station="大邑",
+            arrival_station="成都南",
+            train_number="C3380",
+            days=days,
+            weekdays=weekdays,
+        )
+
+    def test_sweep_queries_each_date(self, mock_crawler, mock_analyzer, mock_notifier):
+        """Test every date is fetched and analyzed, with one aggregate notification"""
+        service = TicketMonitorService(crawler=mock_crawler, analyzer=mock_analyzer, notifier=mock_notifier)
+
+        result = self.sweep(service)
+
+        dates = sorted(call.args[0].departure_date for call in mock_crawler.fetch_tickets.call_args_list)
+        assert len(set(dates)) == 5
+        assert len(result.analyses) == 5
+        assert result.failed_dates == []
+        assert mock_notifier.send_batch.call_count == 1
+        assert len(mock_notifier.send_batch.call_args.args[0]) == 5
+        assert mock_notifier.send.call_count == 0
+
+    def test_sweep_weekday_filter(self, mock_crawler, mock_analyzer, mock_notifier):
+        """Test only dates on the chosen weekdays are swept"""
+        service = TicketMonitorService(crawler=mock_crawler, analyzer=mock_analyzer, notifier=mock_notifier)
+
+        self.sweep(service, days=range(1, 15), weekdays=[0])
+
+        weekdays = {
+            datetime.strptime(call.args[0].departure_date, "%Y-%m-%d").weekday()
+            for call in mock_crawler.fetch_tickets.call_args_list
+        }
+        assert weekdays == {0}
+        assert mock_crawler.fetch_tickets.call_count == 2
+
+    def test_sweep_runs_concurrently(self, mock_analyzer, mock_notifier):
+        """Test dates are fetched in parallel, bounded by max_workers"""
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def fetch(query):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.05)
+            with lock:
+                in_flight -= 1
+            return mock_query_result(has_tickets=True)
+
+        crawler = Mock()
+        crawler.fetch_tickets.side_effect = fetch
+        service = TicketMonitorService(
+            crawler=crawler,
+            analyzer=mock_analyzer,
+            notifier=mock_notifier,
+            max_workers=3,
+        )
+
+        self.sweep(service, days=range(1, 10))
+
+        assert peak == 3
+
+    @patch("time.sleep")
+    def test_sweep_collects_failed_dates(self, mock_sleep, mock_analyzer, mock_notifier):
+        """Test a failing date does not fail the sweep"""
+        crawler = Mock()
+        service = TicketMonitorService(crawler=crawler, analyzer=mock_analyzer, notifier=mock_notifier, max_retries=2)
+        target = service._calculate_target_date(2)
+
+        def fetch(query):
+            if query.departure_date == target:
+                raise Exception("Network error")
+            return mock_query_result(has_tickets=True)
+
+        crawler.fetch_tickets.side_effect = fetch
+
+        result = self.sweep(service, days=range(1, 4))
+
+        assert result.failed_dates == [target]
+        assert len(result.analyses) == 2
+
+    @patch("time.sleep")
+    def test_sweep_all_dates_failed(self, mock_sleep, mock_crawler_failure, mock_analyzer, mock_notifier):
+        """Test sweep raises when no date could be fetched"""
+        service = TicketMonitorService(
+            crawler=mock_crawler_failure, analyzer=mock_analyzer, notifier=mock_notifier, max_retries=1
+        )
+
+        with pytest.raises(DomainException):
+            self.sweep(service, days=range(1, 3))
+
+        assert mock_notifier.send_batch.call_count == 0
+
+    def test_sweep_without_tickets_skips_notification(self, mock_crawler, mock_notifier):
+        """Test no notification is sent when no date has tickets"""
+        analyzer = Mock()
+        analyzer.analyze.return_value = mock_analysis(has_ticket=False)
+        service = TicketMonitorService(crawler=mock_crawler, analyzer=analyzer, notifier=mock_notifier)
+
+        result = self.sweep(service)
+
+        assert not result.has_ticket
+        assert mock_notifier.send_batch.call_count == 0
+
+    def test_unchanged_sweep_skips_notification(self, mock_analyzer, mock_notifier):
+        """Test a repeated sweep with unchanged payloads reuses analyses and does not notify again"""
+        fresh = mock_query_result(has_tickets=True)
+        crawler = Mock()
+        crawler.fetch_tickets.side_effect = [fresh] * 3 + [fresh.model_copy(update={"unchanged": True})] * 3
+        service = TicketMonitorService(crawler=crawler, analyzer=mock_analyzer, notifier=mock_notifier)
+
+        self.sweep(service, days=range(1, 4))
+        second = self.sweep(service, days=range(1, 4))
+
+        assert len(second.analyses) == 3
+        assert mock_analyzer.analyze.call_count == 3
+        assert mock_notifier.send_batch.call_count == 1
+
+    def test_failed_sweep_notification_is_retried(self, mock_analyzer, mock_notifier):
+        """Test a sweep whose aggregate notification failed notifies again on the next unchanged sweep"""
+        fresh = mock_query_result(has_tickets=True)
+        crawler = Mock()
+        crawler.fetch_tickets.side_effect = [fresh] * 3 + [fresh.model_copy(update={"unchanged": True})] * 3
+        mock_notifier.send_batch.side_effect = [ConnectionError("SMTP down"), None]
+        service = TicketMonitorService(crawler=crawler, analyzer=mock_analyzer, notifier=mock_notifier)
+
+        with pytest.raises(ConnectionError):
+            self.sweep(service, days=range(1, 4))
+        self.sweep(service, days=range(1, 4))
+
+        assert mock_notifier.send_batch.call_count == 2
+
+
+class TestMonitorTargets:
+    """Tests for the watch list use case"""
+
+    @staticmethod
+    def targets(*train_numbers: str) -> list[WatchTarget]:
+        """Watch targets on the same route and day"""
+        return [
+            WatchTarget(departure_station="大邑", arrival_station="成都南", train_number=number, days_ahead=15)
+            for number in train_numbers
+        ]
+
+    def test_shared_page_fetched_once(self, mock_crawler, mock_analyzer, mock_notifier):
+        """Test trains on one route and date cost a single fetch"""
+        service = TicketMonitorService(crawler=mock_crawler, analyzer=mock_analyzer, notifier=mock_notifier)
+
+        analyses = service.monitor_targets(self.targets("C3380", "C3382"))
+
+        assert mock_crawler.fetch_tickets.call_count == 1
+        query, train_numbers = mock_crawler.fetch_tickets.call_args.args
+        assert query.train_number is None
+        assert train_numbers == ["C3380", "C3382"]
+        assert len(analyses) == 2
+        assert mock_notifier.send_batch.call_count == 1
+
+    @patch("time.sleep")
+    def test_all_targets_failed(self, mock_sleep, mock_crawler_failure, mock_analyzer, mock_notifier):
+        """Test failure is raised when no target could be fetched"""
+        service = TicketMonitorService(
+            crawler=mock_crawler_failure, analyzer=mock_analyzer, notifier=mock_notifier, max_retries=1
+        )
+
+        with pytest.raises(DomainException):
+            service.monitor_targets(self.targets("C3380"))
+
+    def test_failed_notification_is_retried(self, mock_analyzer, mock_notifier):
+        """Test a watch list whose notification failed notifies again on the next unchanged poll"""
+        fresh = mock_query_result(has_tickets=True)
+        crawler = Mock()
+        crawler.fetch_tickets.side_effect = [fresh, fresh.model_copy(update={"unchanged": True})]
+        mock_notifier.send_batch.side_effect = [ConnectionError("SMTP down"), None]
+        service = TicketMonitorService(crawler=crawler, analyzer=mock_analyzer, notifier=mock_notifier)
+
+        with pytest.raises(ConnectionError):
+            service.monitor_targets(self.targets("C3380"))
+        service.monitor_targets(self.targets("C3380"))
+
+        assert mock_analyzer.analyze.call_count == 2
+        assert mock_notifier.send_batch.call_count == 2
+
+
+class TestMonitorTicketAsync:
+    """Tests for the coroutine monitoring use case"""
+
+    @staticmethod
+    def async_crawler(*results) -> Mock:
+        """Async crawler returning the given results in turn"""
+        crawler = Mock(spec=IAsyncTicketCrawler)
+        crawler.fetch_tickets = AsyncMock(side_effect=list(results))
+        return crawler
+
+    @pytest.mark.asyncio
+    async def test_tickets_are_analyzed_and_notified(self, mock_analyzer, mock_notifier):
+        """Test an async fetch is analyzed and notified like the sync use case"""
+        crawler = self.async_crawler(mock_query_result(has_tickets=True))
+        service = TicketMonitorService(crawler=Mock(), analyzer=mock_analyzer, notifier=mock_notifier)
+
+        await service.monitor_ticket_async("大邑", "成都南", "C3380", 15, crawler)
+
+        query = crawler.fetch_tickets.call_args.args[0]
+        assert query.departure_date == service._calculate_target_date(15)
+        assert mock_analyzer.analyze.call_count == 1
+        assert mock_notifier.send.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_results_retried_without_blocking(self, mock_analyzer, mock_notifier):
+        """Test empty results are retried with async waits (time.sleep is never called)"""
+        crawler = self.async_crawler(mock_query_result(has_tickets=False), mock_query_result(has_tickets=True))
+        service = TicketMonitorService(
+            crawler=Mock(),
+            analyzer=mock_analyzer,
+            notifier=mock_notifier,
+            retry_policy=RetryPolicy(max_attempts=3, jitter=False, max_delay=0.01),
+        )
+
+        with patch("time.sleep") as mock_sleep:
+            await service.monitor_ticket_async("大邑", "成都南", "C3380", 15, crawler)
+
+        assert crawler.fetch_tickets.call_count == 2
+        assert mock_sleep.call_count == 0
+        assert mock_notifier.send.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failure_is_raised(self, mock_analyzer, mock_notifier):
+        """Test a fetch failing every attempt is raised"""
+        crawler = self.async_crawler(Exception("Network error"))
+        service = TicketMonitorService(
+            crawler=Mock(), analyzer=mock_analyzer, notifier=mock_notifier, retry_policy=RetryPolicy(max_attempts=1)
+        )
+
+        with pytest.raises(DomainException):
+            await service.monitor_ticket_async("大邑", "成都南", "C3380", 15, crawler)
+
+        assert mock_notifier.send.call_count == 0
+
+
+class TestMonitorRelease:
+    """Tests for the release burst use case"""
+
+    def test_detected_tickets_are_analyzed_and_notified(self, mock_crawler, mock_analyzer, mock_notifier):
+        """Test tickets found in the burst are analyzed and notified"""
+        poller = BurstPoller(mock_crawler, interval=0.01, lead_seconds=0, window_seconds=5)
+        service = TicketMonitorService(crawler=Mock(), analyzer=mock_analyzer, notifier=mock_notifier)
+
+        burst = service.monitor_release("大邑", "成都南", "C3380", 15, datetime.now(), poller)
+
+        assert burst.detected
+        assert burst.query.departure_date == service._calculate_target_date(15)
+        assert mock_analyzer.analyze.call_count == 1
+        assert mock_notifier.send.call_count == 1
+
+    def test_no_tickets_skips_analysis(self, mock_crawler_no_tickets, mock_analyzer, mock_notifier):
+        """Test nothing is analyzed when the window closes without tickets"""
+        poller = BurstPoller(mock_crawler_no_tickets, interval=0.01, lead_seconds=0, window_seconds=0.05)
+        service = TicketMonitorService(crawler=Mock(), analyzer=mock_analyzer, notifier=mock_notifier)
+
+        burst = service.monitor_release("大邑", "成都南", "C3380", 15, datetime.now(), poller)
+
+        assert not burst.detected
+        assert mock_analyzer.analyze.call_count == 0
+        assert mock_notifier.send.call_count == 0
+
+    @pytest.mark.asyncio
+    async def test_async_burst_is_analyzed_and_notified(self, mock_analyzer, mock_notifier):
+        """Test tickets found by an async burst are analyzed and notified"""
+        crawler = Mock(spec=IAsyncTicketCrawler)
+        crawler.fetch_tickets = AsyncMock(return_value=mock_query_result(has_tickets=True))
+        poller = AsyncBurstPoller(crawler, interval=0.01, lead_seconds=0, window_seconds=5)
+        service = TicketMonitorService(crawler=Mock(), analyzer=mock_analyzer, notifier=mock_notifier)
+
+        burst = await service.monitor_release_async("大邑", "成都南", "C3380", 15, datetime.now(), poller)
+
+        assert burst.detected
+        assert mock_analyzer.analyze.call_count == 1
+        assert mock_notifier.send.call_count == 1
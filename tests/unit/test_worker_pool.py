@@ -0,0 +1,95 @@
+"""Unit tests for ProcessWorkerPool"""
+
+import os
+import time
+
+import pytest
+
+from src.infrastructure.worker_pool import ProcessWorkerPool, WorkerError
+
+
+def _echo_worker():
+    """Factory run in each worker: echoes the payload with the worker's PID"""
+
+    def handle(payload):
+        if payload == "boom":
+            raise ValueError("bad payload")
+        if payload == "exit":
+            os._exit(3)
+        if isinstance(payload, float):
+            time.sleep(payload)
+        return payload, os.getpid()
+
+    return handle
+
+
+@pytest.fixture
+def pool():
+    pool = ProcessWorkerPool(2, _echo_worker)
+    yield pool
+    pool.close()
+
+
+class TestProcessWorkerPool:
+    """Test ProcessWorkerPool"""
+
+    def test_invalid_size(self):
+        """Test at least one worker is required"""
+        with pytest.raises(ValueError):
+            ProcessWorkerPool(0, _echo_worker)
+
+    def test_payloads_run_in_separate_processes(self, pool):
+        """Test payload i runs on worker i, outside the coordinator"""
+        results = pool.map(["a", "b"], timeout=30)
+
+        assert [value for value, _ in results] == ["a", "b"]
+        pids = {pid for _, pid in results}
+        assert len(pids) == 2
+        assert os.getpid() not in pids
+
+    def test_workers_are_reused(self, pool):
+        """Test the same worker process serves the same index across runs"""
+        first = pool.map(["a", "b"], timeout=30)
+        second = pool.map(["c", "d"], timeout=30)
+
+        assert [pid for _, pid in first] == [pid for _, pid in second]
+
+    def test_failures_and_skips(self, pool):
+        """Test a failing payload becomes a WorkerError and None payloads are skipped"""
+        results = pool.map(["boom", None], timeout=30)
+
+        assert isinstance(results[0], WorkerError)
+        assert "bad payload" in str(results[0])
+        assert results[1] is None
+
+    def test_payload_count_must_match(self, pool):
+        """Test one payload per worker is required"""
+        with pytest.raises(ValueError):
+            pool.map(["a"])
+
+    def test_timeout_is_one_overall_deadline(self, pool):
+        """Test the timeout bounds the whole map, not each wait for an answer"""
+        pool.map(["a", "b"], timeout=30)
+
+        start = time.monotonic()
+        results = pool.map([0.6, 2.0], timeout=1.0)
+
+        assert time.monotonic() - start < 1.4
+        assert results[0][0] == 0.6
+        assert isinstance(results[1], WorkerError)
+
+    def test_dead_worker_fails_and_is_restarted(self, pool):
+        """Test a worker dying mid-task fails that task at once and is replaced for the next run"""
+        first = pool.map(["a", "b"], timeout=30)
+
+        start = time.monotonic()
+        results = pool.map(["exit", "b"], timeout=30)
+
+        assert time.monotonic() - start < 5
+        assert isinstance(results[0], WorkerError)
+        assert "exited (code 3)" in str(results[0])
+
+        again = pool.map(["a", "b"], timeout=30)
+        assert again[0][0] == "a"
+        assert again[0][1] != first[0][1]
+        assert again[1][1] == first[1][1]